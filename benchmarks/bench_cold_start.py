@@ -0,0 +1,80 @@
+"""
+Benchmark: process cold start with lazy font registration and the font cache
+
+Each sample runs in a fresh interpreter and times importing the document
+routes (what Flask and the CLI tools pay at startup) and then the first
+generator construction, which registers the Montserrat fonts and builds the
+shared stylesheet. The first generator is timed with an empty font cache
+(every font parsed from its TTF) and with a warm one (parsed faces unpickled).
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--rounds N]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = PROJECT_ROOT / 'repo' / 'app'
+
+CHILD = """
+import json, sys, time
+from pathlib import Path
+sys.path.insert(0, {app_dir!r})
+start = time.perf_counter()
+from routes.document_routes import GENERATORS
+imported = time.perf_counter()
+from database import DatabaseManager
+GENERATORS['executive_summary'](DatabaseManager({db_path!r}), Path({output_dir!r}))
+built = time.perf_counter()
+print(json.dumps({{'import': imported - start, 'first_generator': built - imported}}))
+"""
+
+
+def sample(db_path, output_dir, cache_dir):
+    """Time one fresh interpreter; returns {'import': s, 'first_generator': s}"""
+    code = CHILD.format(app_dir=str(APP_DIR), db_path=str(db_path), output_dir=str(output_dir))
+    env = dict(os.environ, FLUXGEN_FONT_CACHE_DIR=str(cache_dir))
+    result = subprocess.run([sys.executable, '-c', code], env=env, cwd=APP_DIR,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def median(samples, key):
+    values = sorted(s[key] for s in samples)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        cache_dir = tmp / 'font-cache'
+
+        sample(db_path, tmp / 'out', tmp / 'warmup-cache')  # OS file cache, .pyc files
+        cold = []
+        for _ in range(args.rounds):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(sample(db_path, tmp / 'out', cache_dir))
+        warm = [sample(db_path, tmp / 'out', cache_dir) for _ in range(args.rounds)]
+
+    print("=" * 60)
+    print(f"{'Median of ' + str(args.rounds) + ' processes':<30}{'empty cache':>15}{'warm cache':>15}")
+    print("=" * 60)
+    for key, label in (('import', 'import document routes'), ('first_generator', 'first generator')):
+        print(f"{label:<30}{median(cold, key) * 1000:>13.1f}ms{median(warm, key) * 1000:>13.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: SQLite connections opened per generated document
+
+Compares the unpooled DatabaseManager (one connect/close per query) with the
+pooled manager the Flask app uses (one connection pinned per request).
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_db_connections.py [--rounds N]
+"""
+import argparse
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+import database
+from database import DatabaseManager, ConnectionPool
+from routes.document_routes import GENERATORS
+
+
+class ConnectCounter:
+    """Counts sqlite3.connect calls made through the database module"""
+
+    def __init__(self):
+        self.count = 0
+        self._connect = sqlite3.connect
+
+    def __enter__(self):
+        def counting_connect(*args, **kwargs):
+            self.count += 1
+            return self._connect(*args, **kwargs)
+        database.sqlite3.connect = counting_connect
+        return self
+
+    def __exit__(self, *exc):
+        database.sqlite3.connect = self._connect
+
+
+def run_documents(make_db, output_dir, rounds, per_request=None):
+    """Generate every bulk document `rounds` times; return {doc: (connections, seconds)}"""
+    results = {}
+    for doc_name, generator_class in GENERATORS.items():
+        if doc_name == 'individual_prep':
+            continue
+        with ConnectCounter() as counter:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                db = make_db()
+                if per_request:
+                    per_request[0](db)
+                try:
+                    generator_class(db, output_dir).generate()
+                finally:
+                    if per_request:
+                        per_request[1](db)
+            elapsed = time.perf_counter() - start
+        results[doc_name] = (counter.count / rounds, elapsed / rounds)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        output_dir = tmp / 'outputs'
+
+        before = run_documents(lambda: DatabaseManager(db_path), output_dir, args.rounds)
+
+        pool = ConnectionPool(db_path)
+        pooled_db = DatabaseManager(db_path, pool=pool)
+        after = run_documents(
+            lambda: pooled_db, output_dir, args.rounds,
+            per_request=(lambda db: db.pool.pin(), lambda db: db.pool.unpin()),
+        )
+        pool.close()
+
+    print("=" * 72)
+    print(f"{'Document':<24}{'conns before':>14}{'conns after':>13}{'ms before':>11}{'ms after':>10}")
+    print("=" * 72)
+    for doc_name in before:
+        b_conns, b_time = before[doc_name]
+        a_conns, a_time = after[doc_name]
+        print(f"{doc_name:<24}{b_conns:>14.1f}{a_conns:>13.1f}{b_time * 1000:>11.0f}{a_time * 1000:>10.0f}")
+    print("-" * 72)
+    print(f"Pool stats: {pool.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
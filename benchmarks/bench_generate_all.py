@@ -0,0 +1,92 @@
+"""
+Benchmark: /generate-all wall time, sequential vs fanned out over render workers
+
+Renders the eight bulk documents one after another in this process (as
+/generate-all did before), then through RenderPool.render_each() with 1, 2,
+4 ... workers up to the CPU count (or --workers), one document per worker.
+Pools are started and warmed before timing, as the app does at startup.
+Speedup is against the sequential run; it cannot exceed the number of
+cores, and the longest single document bounds it too.
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_generate_all.py [--rounds N] [--workers 1,2,4]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+from database import DatabaseManager
+from render_pool import RenderPool, render_document
+from routes.document_routes import GENERATORS
+
+DOCUMENTS = [name for name in GENERATORS if name != 'individual_prep']
+
+
+def sequential(db, output_dir):
+    """Seconds to render every document in this thread"""
+    start = time.perf_counter()
+    for doc_name in DOCUMENTS:
+        render_document(db, doc_name, output_dir)
+    return time.perf_counter() - start
+
+
+def fanned_out(pool, db):
+    """Seconds to render every document across the pool's workers"""
+    start = time.perf_counter()
+    for doc_name, _, _, error in pool.render_each(DOCUMENTS, db):
+        if error is not None:
+            raise RuntimeError(f"{doc_name}: {error}")
+    return time.perf_counter() - start
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--workers', help='comma-separated worker counts (default: powers of two up to the CPU count)')
+    args = parser.parse_args()
+    if args.workers:
+        worker_counts = [int(n) for n in args.workers.split(',')]
+    else:
+        worker_counts = [n for n in (1, 2, 4, 8, 16, 32) if n < cpus] + [cpus]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        db = DatabaseManager(db_path)
+        db.migrate()
+
+        sequential(db, tmp / 'sequential')  # fonts, styles, images, dataset cache
+        baseline = min(sequential(db, tmp / 'sequential') for _ in range(args.rounds))
+
+        results = {}
+        for workers in worker_counts:
+            pool = RenderPool(tmp / f'pool_{workers}', workers=workers, max_jobs_per_worker=0)
+            try:
+                pool.start()
+                fanned_out(pool, db)  # every worker warm and holding the dataset
+                results[workers] = min(fanned_out(pool, db) for _ in range(args.rounds))
+            finally:
+                pool.close()
+
+    print(f"{len(DOCUMENTS)} documents, {cpus} CPUs")
+    print("=" * 48)
+    print(f"{'Run':<24}{'wall ms':>12}{'speedup':>12}")
+    print("=" * 48)
+    print(f"{'sequential':<24}{baseline * 1000:>12.0f}{1.0:>11.2f}x")
+    for workers, seconds in results.items():
+        label = f"{workers} worker{'s' if workers > 1 else ''}"
+        print(f"{label:<24}{seconds * 1000:>12.0f}{baseline / seconds:>11.2f}x")
+
+
+if __name__ == '__main__':
+    main()
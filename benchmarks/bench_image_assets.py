@@ -0,0 +1,77 @@
+"""
+Benchmark: logo decoding and embedding per generated document
+
+Renders every bulk document with the image asset cache cleared before each
+one (every document decodes, compresses and encodes its logos, as before the
+cache) and with a warm cache. Reports render time, PDF size and the number of
+image XObjects embedded per PDF.
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_image_assets.py [--rounds N]
+"""
+import argparse
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+from database import DatabaseManager
+from generators import base
+from routes.document_routes import GENERATORS
+
+
+def render_all(db, output_dir, rounds, cold):
+    """Return {doc: (seconds per render, bytes, image XObjects)}"""
+    results = {}
+    for doc_name, generator_class in GENERATORS.items():
+        if doc_name == 'individual_prep':
+            continue
+        elapsed = 0.0
+        for _ in range(rounds):
+            if cold:
+                base._image_assets.clear()
+            start = time.perf_counter()
+            path = generator_class(db, output_dir).generate()
+            elapsed += time.perf_counter() - start
+        data = path.read_bytes()
+        results[doc_name] = (elapsed / rounds, len(data), len(re.findall(rb'/Subtype /Image', data)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        db = DatabaseManager(db_path)
+
+        render_all(db, tmp / 'warmup', 1, cold=False)  # fonts, styles, imports
+        cold = render_all(db, tmp / 'cold', args.rounds, cold=True)
+        warm = render_all(db, tmp / 'warm', args.rounds, cold=False)
+
+    print("=" * 78)
+    print(f"{'Document':<24}{'ms cold':>9}{'ms warm':>9}{'KB cold':>10}{'KB warm':>10}{'images/PDF':>14}")
+    print("=" * 78)
+    for doc_name in cold:
+        c_time, c_size, c_images = cold[doc_name]
+        w_time, w_size, w_images = warm[doc_name]
+        print(f"{doc_name:<24}{c_time * 1000:>9.0f}{w_time * 1000:>9.0f}"
+              f"{c_size / 1024:>10.0f}{w_size / 1024:>10.0f}{f'{c_images} / {w_images}':>14}")
+    print("-" * 78)
+    c_total = sum(r[0] for r in cold.values())
+    w_total = sum(r[0] for r in warm.values())
+    print(f"{'all documents':<24}{c_total * 1000:>9.0f}{w_total * 1000:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: PDF size and render time per output profile
+
+Renders every bulk document in the 'standard' and 'optimized' profiles (see
+generators.base.PDF_PROFILES) and reports bytes, bytes saved and render time
+per document. Renders are in memory, so nothing is written to disk.
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_pdf_profiles.py [--rounds N]
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+from database import DatabaseManager
+from render_pool import render_document_bytes
+from routes.document_routes import GENERATORS
+
+
+def render(db, output_dir, doc_name, profile, rounds):
+    """(seconds per render, PDF bytes)"""
+    elapsed = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _, pdf = render_document_bytes(db, doc_name, output_dir, profile=profile)
+        elapsed += time.perf_counter() - start
+    return elapsed / rounds, len(pdf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    documents = [name for name in GENERATORS if name != 'individual_prep']
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        db = DatabaseManager(db_path)
+
+        for profile in ('standard', 'optimized'):  # fonts, styles, image variants
+            render(db, tmp, documents[0], profile, 1)
+        results = {
+            doc_name: (render(db, tmp, doc_name, 'standard', args.rounds),
+                       render(db, tmp, doc_name, 'optimized', args.rounds))
+            for doc_name in documents
+        }
+
+    print("=" * 78)
+    print(f"{'Document':<24}{'standard':>11}{'optimized':>11}{'saved':>10}{'%':>7}{'ms std':>8}{'ms opt':>8}")
+    print("=" * 78)
+    totals = [0, 0]
+    for doc_name, ((s_time, s_size), (o_time, o_size)) in results.items():
+        totals[0] += s_size
+        totals[1] += o_size
+        print(f"{doc_name:<24}{s_size:>11,}{o_size:>11,}{s_size - o_size:>10,}"
+              f"{(s_size - o_size) / s_size * 100:>6.1f}%{s_time * 1000:>8.0f}{o_time * 1000:>8.0f}")
+    print("-" * 78)
+    print(f"{'all documents':<24}{totals[0]:>11,}{totals[1]:>11,}{totals[0] - totals[1]:>10,}"
+          f"{(totals[0] - totals[1]) / totals[0] * 100:>6.1f}%")
+
+
+if __name__ == '__main__':
+    main()
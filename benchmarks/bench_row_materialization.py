@@ -0,0 +1,98 @@
+"""
+Benchmark: memory and time to materialize 100k rows
+
+Compares execute_query() (one sqlite3.Row plus one dict per row) with
+query_models() (plain tuples passed to slotted model constructors) on the
+suppliers and equipment_machinery tables, padded to --rows rows.
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_row_materialization.py [--rows N] [--rounds N]
+"""
+import argparse
+import gc
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+from database import DatabaseManager
+from models import ModelFactory, Supplier, Equipment
+
+
+def pad_table(db_path, table, rows):
+    """Duplicate existing rows until the table holds `rows` rows"""
+    conn = sqlite3.connect(db_path)
+    columns = [r[1] for r in conn.execute(f"PRAGMA table_info({table})") if r[1] != 'id']
+    column_list = ', '.join(columns)
+    while True:
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        if count >= rows:
+            break
+        conn.execute(
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {table} LIMIT ?",
+            (rows - count,)
+        )
+    conn.commit()
+    conn.close()
+
+
+def measure(load, rounds):
+    """Return (best seconds, bytes retained by the result) for load()"""
+    best = float('inf')
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        result = load()
+        best = min(best, time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = load()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return best, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        db = DatabaseManager(db_path)
+
+        print("=" * 78)
+        print(f"{'Table':<22}{'Loader':<16}{'ms':>10}{'MB retained':>14}{'bytes/row':>12}")
+        print("=" * 78)
+        for model in (Supplier, Equipment):
+            table = ModelFactory.TABLES[model]
+            pad_table(db_path, table, args.rows)
+            rows = args.rows
+            loaders = {
+                'dict rows': lambda: db.execute_query(f"SELECT * FROM {table} ORDER BY id"),
+                'typed models': lambda: db.query_models(model),
+            }
+            results = {name: measure(load, args.rounds) for name, load in loaders.items()}
+            for name, (seconds, retained) in results.items():
+                print(f"{table:<22}{name:<16}{seconds * 1000:>10.0f}{retained / 1e6:>14.1f}{retained / rows:>12.0f}")
+            (d_time, d_mem), (m_time, m_mem) = results.values()
+            print(f"{'':<22}{'saved':<16}{(d_time - m_time) * 1000:>10.0f}{(d_mem - m_mem) / 1e6:>14.1f}"
+                  f"{(d_mem - m_mem) / rows:>12.0f}")
+            print("-" * 78)
+
+
+if __name__ == '__main__':
+    main()
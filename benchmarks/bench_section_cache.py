@@ -0,0 +1,94 @@
+"""
+Benchmark: document content build with section memoization
+
+Times build_content() (the story of flowables, before layout) for every bulk
+document three ways: with the section cache emptied before each build (every
+section rebuilt, as before @section), with a warm cache, and right after a
+write to team_members (only the sections that read it are rebuilt). Also
+checks that PDFs rendered from cached sections match freshly built ones.
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_section_cache.py [--rounds N]
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+from reportlab import rl_config
+
+from database import DatabaseManager
+from generators import base
+from routes.document_routes import GENERATORS
+
+DOCUMENTS = [name for name in GENERATORS if name != 'individual_prep']
+
+
+def build(db, output_dir, doc_name, cold):
+    """Seconds for one build_content() of doc_name"""
+    generator = GENERATORS[doc_name](db, output_dir)
+    if cold:
+        base._section_entries().clear()
+    start = time.perf_counter()
+    generator.build_content()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    rl_config.invariant = 1  # no timestamps or random IDs, so bytes can be compared
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        db = DatabaseManager(db_path)
+        db.migrate()  # dataset_versions, which sections are keyed by
+
+        for doc_name in DOCUMENTS:  # fonts, styles, imports, dataset cache
+            build(db, tmp, doc_name, cold=True)
+
+        results = {}
+        for doc_name in DOCUMENTS:
+            cold = min(build(db, tmp, doc_name, cold=True) for _ in range(args.rounds))
+            warm = min(build(db, tmp, doc_name, cold=False) for _ in range(args.rounds))
+            results[doc_name] = [cold, warm]
+
+        for doc_name in DOCUMENTS:  # every document's sections cached again
+            build(db, tmp, doc_name, cold=False)
+        member = db.get_team_members()[0]
+        db.bulk_update('team_members', [{'id': member['id'], 'notes': (member.get('notes') or '') + ' '}])
+        for doc_name in DOCUMENTS:
+            results[doc_name].append(build(db, tmp, doc_name, cold=False))
+
+        same = {}
+        for doc_name in DOCUMENTS:
+            cached_pdf = GENERATORS[doc_name](db, tmp / 'cached').generate().read_bytes()
+            base._section_entries().clear()
+            fresh_pdf = GENERATORS[doc_name](db, tmp / 'fresh').generate().read_bytes()
+            same[doc_name] = cached_pdf == fresh_pdf
+        stats = base.section_cache_stats()
+
+    print("=" * 72)
+    print(f"{'Document':<24}{'ms rebuilt':>12}{'ms cached':>12}{'ms team edit':>14}{'same PDF':>10}")
+    print("=" * 72)
+    for doc_name, (cold, warm, edited) in results.items():
+        print(f"{doc_name:<24}{cold * 1000:>12.1f}{warm * 1000:>12.1f}{edited * 1000:>14.1f}"
+              f"{'yes' if same[doc_name] else 'NO':>10}")
+    print("-" * 72)
+    print(f"{'all documents':<24}{sum(r[0] for r in results.values()) * 1000:>12.1f}"
+          f"{sum(r[1] for r in results.values()) * 1000:>12.1f}"
+          f"{sum(r[2] for r in results.values()) * 1000:>14.1f}")
+    print(f"section hits {stats['hits']}, misses {stats['misses']}, entries {stats['entries']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: stylesheet construction cost per generator
+
+Compares building the sample + FluxGen stylesheet for every generator (what
+BaseDocumentGenerator.__init__ used to do) with wrapping the shared,
+process-wide stylesheet in a per-document DocumentStyles view.
+
+Usage:
+    python benchmarks/bench_stylesheet.py [--iterations N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+from generators.base import _build_stylesheet, shared_styles, DocumentStyles
+
+
+def per_call_us(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    shared_styles()  # built once per process, outside the timed loop
+
+    rebuilt = per_call_us(_build_stylesheet, args.iterations)
+    shared = per_call_us(lambda: DocumentStyles(shared_styles()), args.iterations)
+
+    print("=" * 60)
+    print(f"{'Stylesheet per generator':<36}{'us/generator':>14}")
+    print("=" * 60)
+    print(f"{'rebuilt (before)':<36}{rebuilt:>14.1f}")
+    print(f"{'shared + copy-on-write view':<36}{shared:>14.2f}")
+    print("-" * 60)
+    print(f"/generate-all (9 generators) saves ~{(rebuilt - shared) * 9 / 1000:.2f} ms per request")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: table cell construction and layout per generated document
+
+Renders every bulk document with table cells built as plain Paragraphs (each
+cell parsed and wrapped from scratch, as before TableCell) and with TableCell
+(shared parsed fragments, wrap remembered per width). Reports render time per
+document and checks that both variants produce the same PDF bytes.
+Runs against a temporary copy of data/fluxgen.db so the real database is untouched.
+
+Usage:
+    python benchmarks/bench_table_cells.py [--rounds N]
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / 'repo' / 'app'))
+
+from reportlab import rl_config
+from reportlab.platypus import Paragraph
+
+from database import DatabaseManager
+from generators import base
+from routes.document_routes import GENERATORS
+
+
+def render_all(db, output_dir, rounds, cell_class):
+    """Return {doc: (seconds per render, PDF bytes)}"""
+    base.TableCell = cell_class
+    results = {}
+    for doc_name, generator_class in GENERATORS.items():
+        if doc_name == 'individual_prep':
+            continue
+        elapsed = 0.0
+        for _ in range(rounds):
+            start = time.perf_counter()
+            path = generator_class(db, output_dir).generate()
+            elapsed += time.perf_counter() - start
+        results[doc_name] = (elapsed / rounds, path.read_bytes())
+        path.unlink()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    rl_config.invariant = 1  # no timestamps or random IDs, so bytes can be compared
+    table_cell = base.TableCell
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'fluxgen.db'
+        shutil.copy(PROJECT_ROOT / 'data' / 'fluxgen.db', db_path)
+        db = DatabaseManager(db_path)
+
+        render_all(db, tmp / 'warmup', 1, table_cell)  # fonts, styles, imports, fragment cache
+        plain = render_all(db, tmp / 'plain', args.rounds, Paragraph)
+        cached = render_all(db, tmp / 'cached', args.rounds, table_cell)
+    base.TableCell = table_cell
+
+    print("=" * 64)
+    print(f"{'Document':<24}{'ms Paragraph':>14}{'ms TableCell':>14}{'same PDF':>12}")
+    print("=" * 64)
+    for doc_name in plain:
+        p_time, p_pdf = plain[doc_name]
+        c_time, c_pdf = cached[doc_name]
+        print(f"{doc_name:<24}{p_time * 1000:>14.0f}{c_time * 1000:>14.0f}{'yes' if p_pdf == c_pdf else 'NO':>12}")
+    print("-" * 64)
+    print(f"{'all documents':<24}{sum(r[0] for r in plain.values()) * 1000:>14.0f}"
+          f"{sum(r[0] for r in cached.values()) * 1000:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,24 @@
 """
 Main Flask application for FluxGen Document Generation System
 """
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, jsonify, current_app
+import atexit
 import logging
 import os
 from pathlib import Path
 
 import sys
-import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import config, Config
 from routes.data_routes import data_bp
 from routes.document_routes import doc_bp
-from database import DatabaseManager
+from routes.debug_routes import debug_bp
+from database import DatabaseManager, ConnectionPool, WriteQueue, SnapshotManager, query_tracer
+from render_pool import RenderPool
+from render_cache import RenderCache
+from jobs import JobQueue
+from manifest import manifest_for
 
 def create_app(config_name='development'):
     """Application factory pattern"""
@@ -35,9 +40,107 @@ def create_app(config_name='development'):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    # Tracing must be configured before any connection is opened
+    query_tracer.configure(
+        enabled=app.config['DB_TRACE_QUERIES'],
+        slow_query_ms=app.config['DB_SLOW_QUERY_MS'],
+        recent_size=app.config['DB_TRACE_RECENT'],
+    )
+
+    # Shared database manager backed by a connection pool (see routes' get_db())
+    pool = ConnectionPool(
+        app.config['DATABASE_PATH'],
+        max_size=app.config['DB_POOL_SIZE'],
+        timeout=app.config['DB_POOL_TIMEOUT'],
+        health_check_interval=app.config['DB_HEALTH_CHECK_INTERVAL'],
+        busy_timeout_ms=app.config['DB_BUSY_TIMEOUT_MS'],
+    )
+    db = DatabaseManager(app.config['DATABASE_PATH'], pool=pool)
+    db.migrate()
+    if app.config['DB_JOURNAL_MODE']:
+        journal_mode = db.set_journal_mode(app.config['DB_JOURNAL_MODE'])
+        app.logger.info(f"SQLite journal mode: {journal_mode}")
+    if app.config['DB_SERIALIZE_WRITES']:
+        db.writer = WriteQueue(
+            app.config['DATABASE_PATH'],
+            busy_timeout_ms=app.config['DB_BUSY_TIMEOUT_MS'],
+            wal_autocheckpoint=app.config['DB_WAL_AUTOCHECKPOINT'],
+            checkpoint_interval=app.config['DB_CHECKPOINT_INTERVAL'],
+        )
+    app.extensions['fluxgen_db'] = db
+    atexit.register(db.close)
+    pools = [pool]
+
+    # Frozen copies of the database: what a batch of documents reads in every
+    # mode (see routes' render_batch()), and every generator in immutable mode
+    app.extensions['fluxgen_snapshots'] = SnapshotManager(
+        app.config['DATABASE_PATH'],
+        app.config['DB_SNAPSHOT_DIR'],
+        keep=app.config['DB_SNAPSHOT_KEEP'],
+    )
+
+    # Generators never write; optionally give them read-only or snapshot connections
+    generation_mode = app.config['GENERATION_DB_MODE']
+    if generation_mode == 'ro':
+        generation_pool = ConnectionPool(
+            app.config['DATABASE_PATH'],
+            max_size=app.config['DB_POOL_SIZE'],
+            timeout=app.config['DB_POOL_TIMEOUT'],
+            health_check_interval=app.config['DB_HEALTH_CHECK_INTERVAL'],
+            busy_timeout_ms=app.config['DB_BUSY_TIMEOUT_MS'],
+            mode='ro',
+        )
+        app.extensions['fluxgen_generation_db'] = DatabaseManager(
+            app.config['DATABASE_PATH'], pool=generation_pool, mode='ro'
+        )
+        atexit.register(generation_pool.close)
+        pools.append(generation_pool)
+    elif generation_mode not in ('rw', 'immutable'):
+        raise ValueError(f"Unknown GENERATION_DB_MODE: {generation_mode}")
+    app.logger.info(f"Document generation database mode: {generation_mode}")
+
+    # Worker processes for rendering (see routes' render_documents()). They are
+    # spawned on the first render, not here: the reloader's parent process and
+    # scripts that call create_app() without a __main__ guard never start any
+    if app.config['RENDER_WORKERS'] > 0:
+        render_pool = RenderPool(
+            app.config['OUTPUT_DIR'],
+            workers=app.config['RENDER_WORKERS'],
+            max_jobs_per_worker=app.config['RENDER_MAX_JOBS_PER_WORKER'],
+        )
+        app.extensions['fluxgen_render_pool'] = render_pool
+        atexit.register(render_pool.close)
+    if app.config['RENDER_CACHE_MAX_MB'] > 0:
+        app.extensions['fluxgen_render_cache'] = RenderCache(
+            app.config['RENDER_CACHE_DIR'],
+            app.config['OUTPUT_DIR'],
+            max_bytes=app.config['RENDER_CACHE_MAX_MB'] * 1024 * 1024,
+        )
+
+    # /list and bundles read this index of OUTPUT_DIR; catch up with files added or removed while stopped
+    manifest_for(app.config['OUTPUT_DIR']).rebuild()
+
+    # Generate requests return a job ID; jobs render on these threads (see routes' start_job())
+    if app.config['JOB_WORKERS'] > 0:
+        job_queue = JobQueue(
+            workers=app.config['JOB_WORKERS'],
+            max_queued=app.config['JOB_MAX_QUEUED'],
+            history=app.config['JOB_HISTORY'],
+            app=app,
+        )
+        app.extensions['fluxgen_jobs'] = job_queue
+        atexit.register(job_queue.close)
+
+    @app.teardown_appcontext
+    def release_db_connection(exc):
+        """Return the request's (or job's) pinned connections to their pools"""
+        for request_pool in pools:
+            request_pool.unpin()
+    
     # Register blueprints
     app.register_blueprint(data_bp)
     app.register_blueprint(doc_bp)
+    app.register_blueprint(debug_bp)
     
     # Main routes
     @app.route('/')
@@ -60,13 +163,20 @@ def create_app(config_name='development'):
         """Health check endpoint"""
         try:
             # Test database connection
-            db = DatabaseManager(Config.DATABASE_PATH)
+            db = current_app.extensions['fluxgen_db']
             company_info = db.get_company_info()
+            render_pool = current_app.extensions.get('fluxgen_render_pool')
+            render_cache = current_app.extensions.get('fluxgen_render_cache')
+            job_queue = current_app.extensions.get('fluxgen_jobs')
             
             return jsonify({
                 'status': 'healthy',
                 'database': 'connected',
-                'company': company_info['legal_name'] if company_info else 'Not found'
+                'company': company_info['legal_name'] if company_info else 'Not found',
+                'dataset_cache': db.cache_stats(),
+                'render_pool': render_pool.get_stats() if render_pool else None,
+                'render_cache': render_cache.get_stats() if render_cache else None,
+                'jobs': job_queue.get_stats() if job_queue else None
             })
         except Exception as e:
             return jsonify({
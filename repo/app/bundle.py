@@ -0,0 +1,88 @@
+"""
+ZIP bundles of generated PDFs, streamed as they are written
+"""
+import logging
+import os
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+from manifest import manifest_for
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def latest_documents(output_dir: Path, doc_names: Iterable[str], profile: str = 'standard') -> Dict[str, List[Path]]:
+    """
+    Newest generated PDF of each of ``doc_names`` in ``profile``, from the output manifest.
+
+    ``individual_prep`` gets the newest prep document of every team member
+    instead of one file. Document types with no PDF yet map to an empty list.
+    """
+    doc_names = list(doc_names)
+    latest: Dict[str, List[Path]] = {doc_name: [] for doc_name in doc_names}
+    for row in manifest_for(output_dir).latest(doc_names, profile=profile):
+        latest[row['doc_type']].append(Path(output_dir) / row['filename'])
+    return latest
+
+
+class _Chunks:
+    """Write-only, unseekable file: zipfile writes into it and the generator hands the bytes on"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(paths: Iterable[Path], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of ``paths`` piece by piece as it is written.
+
+    PDFs are already compressed, so entries are stored as they are. Each
+    file is read ``chunk_size`` bytes at a time and its bytes are yielded
+    straight away; with an unseekable output, zipfile records sizes and
+    CRCs in data descriptors after each entry, so nothing is buffered
+    beyond one chunk and nothing touches the disk. A file deleted before
+    its turn is left out.
+    """
+    sink = _Chunks()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for path in paths:
+            try:
+                source = open(path, 'rb')
+            except FileNotFoundError:
+                logger.warning(f"Skipping {path.name} in bundle: deleted before it was sent")
+                continue
+            with source:
+                stat = os.fstat(source.fileno())
+                info = zipfile.ZipInfo(path.name, date_time=time.localtime(stat.st_mtime)[:6])
+                info.compress_type = zipfile.ZIP_STORED
+                info.file_size = stat.st_size
+                info.external_attr = 0o644 << 16
+                with archive.open(info, 'w') as entry:
+                    while True:
+                        block = source.read(chunk_size)
+                        if not block:
+                            break
+                        entry.write(block)
+                        yield sink.take()
+            data = sink.take()  # the entry's data descriptor
+            if data:
+                yield data
+    data = sink.take()  # central directory
+    if data:
+        yield data
@@ -14,9 +14,54 @@ class Config:
     # Project root (two levels up from this file: repo/app -> repo -> FluxGen)
     BASE_DIR = Path(__file__).resolve().parents[2]
     DATABASE_PATH = BASE_DIR / 'data' / 'fluxgen.db'
+
+    # Connection pool shared by all requests (see database.ConnectionPool)
+    DB_POOL_SIZE = int(os.environ.get('FLUXGEN_DB_POOL_SIZE', 8))
+    DB_POOL_TIMEOUT = float(os.environ.get('FLUXGEN_DB_POOL_TIMEOUT', 30))
+    DB_HEALTH_CHECK_INTERVAL = float(os.environ.get('FLUXGEN_DB_HEALTH_CHECK_INTERVAL', 60))
+
+    # Journaling and write serialization (see database.WriteQueue)
+    DB_JOURNAL_MODE = os.environ.get('FLUXGEN_DB_JOURNAL_MODE', 'WAL')
+    DB_BUSY_TIMEOUT_MS = int(os.environ.get('FLUXGEN_DB_BUSY_TIMEOUT_MS', 5000))
+    DB_WAL_AUTOCHECKPOINT = int(os.environ.get('FLUXGEN_DB_WAL_AUTOCHECKPOINT', 1000))  # pages
+    DB_CHECKPOINT_INTERVAL = float(os.environ.get('FLUXGEN_DB_CHECKPOINT_INTERVAL', 300))  # seconds
+    DB_SERIALIZE_WRITES = os.environ.get('FLUXGEN_DB_SERIALIZE_WRITES', '1') == '1'
+
+    # Query tracing (see database.QueryTracer and /api/debug/queries)
+    DB_TRACE_QUERIES = os.environ.get('FLUXGEN_DB_TRACE_QUERIES', '0') == '1'
+    DB_SLOW_QUERY_MS = float(os.environ.get('FLUXGEN_DB_SLOW_QUERY_MS', 100))
+    DB_TRACE_RECENT = int(os.environ.get('FLUXGEN_DB_TRACE_RECENT', 200))  # statements kept in /recent
+    
+    # How document generators open the database: 'rw', 'ro' (mode=ro URI) or
+    # 'immutable' (lock-free reads of a snapshot copy, see database.SnapshotManager)
+    GENERATION_DB_MODE = os.environ.get('FLUXGEN_GENERATION_DB_MODE', 'rw')
+    DB_SNAPSHOT_DIR = BASE_DIR / 'data' / 'snapshots'
+    DB_SNAPSHOT_KEEP = int(os.environ.get('FLUXGEN_DB_SNAPSHOT_KEEP', 3))
+    
+    # Render worker processes (see render_pool.RenderPool); 0 renders in the request thread.
+    # Off by default outside production: spawned workers re-import the main
+    # module, which breaks scripts that call create_app() without a __main__ guard
+    RENDER_WORKERS = int(os.environ.get('FLUXGEN_RENDER_WORKERS', 0))
+    RENDER_MAX_JOBS_PER_WORKER = int(os.environ.get('FLUXGEN_RENDER_MAX_JOBS_PER_WORKER', 50))  # 0 = never recycle
+    RENDER_TIMEOUT = float(os.environ.get('FLUXGEN_RENDER_TIMEOUT', 300))  # seconds a request waits for its PDF
+    
+    # Background generation jobs (see jobs.JobQueue); 0 generates inside the request
+    JOB_WORKERS = int(os.environ.get('FLUXGEN_JOB_WORKERS', 4))
+    JOB_MAX_QUEUED = int(os.environ.get('FLUXGEN_JOB_MAX_QUEUED', 100))  # 0 = unbounded
+    JOB_HISTORY = int(os.environ.get('FLUXGEN_JOB_HISTORY', 200))  # finished jobs kept for /jobs/<id>
+    JOB_EVENTS_KEEPALIVE = 15  # seconds between keep-alive comments on an idle /jobs/<id>/events stream
     
     # Output directory for generated PDFs
     OUTPUT_DIR = Path(__file__).parent / 'outputs'
+
+    # Rendered PDFs reused while generator code, data and options are unchanged
+    # (see render_cache.RenderCache); 0 disables the cache
+    RENDER_CACHE_DIR = OUTPUT_DIR / '.cache'
+    RENDER_CACHE_MAX_MB = int(os.environ.get('FLUXGEN_RENDER_CACHE_MAX_MB', 256))
+
+    # PDF profile used when a request does not choose one (see generators.base.PDF_PROFILES):
+    # 'standard', or 'optimized' for smaller PDFs to email
+    PDF_PROFILE = os.environ.get('FLUXGEN_PDF_PROFILE', 'standard')
     
     # FluxGen brand colors
     BRAND_COLORS = {
@@ -57,6 +102,7 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
+    RENDER_WORKERS = int(os.environ.get('FLUXGEN_RENDER_WORKERS', 2))
 
 
 config = {
@@ -3,26 +3,1008 @@ Database connection and utilities for FluxGen application
 """
 import sqlite3
 import json
+import os
+import queue
+import sys
+import threading
+import time
+import logging
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote
 from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
 
+from models import DatasetSnapshot, ModelFactory
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhaustedError(sqlite3.OperationalError):
+    """Raised when no pooled connection becomes available within the timeout"""
+
+
+class _Lease:
+    """A connection checked out by one thread"""
+
+    __slots__ = ('conn', 'depth', 'pinned')
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.depth = 0
+        self.pinned = False
+
+
+class QueryTracer:
+    """
+    Optional per-statement instrumentation for DatabaseManager connections.
+
+    When enabled, connections are opened as ``_TracedConnection`` and every
+    statement run through ``execute``/``executemany`` is timed from execute
+    until its cursor is exhausted or closed, with the row count and the
+    calling generator section (the nearest ``_add_*`` frame, else the first
+    caller outside this module). Statements SQLite runs outside a cursor -
+    the implicit BEGIN, ``executescript`` bodies - are picked up through
+    ``set_trace_callback`` and counted without a duration. Statements slower
+    than ``slow_query_ms`` are logged as warnings.
+    """
+
+    def __init__(self, recent_size: int = 200):
+        self.enabled = False
+        self.slow_query_ms = 100.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._recent = deque(maxlen=recent_size)
+
+    def configure(self, enabled: bool = True, slow_query_ms: Optional[float] = None,
+                  recent_size: Optional[int] = None):
+        """Turn tracing on or off; applies to connections opened afterwards"""
+        self.enabled = enabled
+        if slow_query_ms is not None:
+            self.slow_query_ms = float(slow_query_ms)
+        if recent_size is not None:
+            with self._lock:
+                self._recent = deque(self._recent, maxlen=recent_size)
+
+    def connect(self, db_path, **kwargs) -> sqlite3.Connection:
+        """sqlite3.connect() that returns a traced connection while tracing is enabled"""
+        if not self.enabled:
+            return sqlite3.connect(db_path, **kwargs)
+        conn = sqlite3.connect(db_path, factory=_TracedConnection, **kwargs)
+        conn.set_trace_callback(conn._on_trace)
+        return conn
+
+    @contextmanager
+    def section(self, label: str):
+        """Attribute statements run by this thread inside the block to ``label``"""
+        previous = getattr(self._local, 'section', None)
+        self._local.section = label
+        try:
+            yield
+        finally:
+            self._local.section = previous
+
+    def caller(self) -> str:
+        """Name the code that issued the current statement"""
+        label = getattr(self._local, 'section', None)
+        if label:
+            return label
+        fallback = None
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename not in (__file__, threading.__file__):
+                owner = frame.f_locals.get('self')
+                name = f"{type(owner).__name__}.{code.co_name}" if owner is not None else \
+                    f"{os.path.splitext(os.path.basename(code.co_filename))[0]}.{code.co_name}"
+                if code.co_name.startswith('_add_'):
+                    return name
+                if fallback is None:
+                    fallback = name
+            frame = frame.f_back
+        return fallback or threading.current_thread().name
+
+    def record(self, sql: str, duration: Optional[float], rows: int, section: str):
+        """Add one statement execution; ``duration`` is seconds, or None when untimed"""
+        statement = ' '.join(sql.split())
+        duration_ms = duration * 1000 if duration is not None else None
+        with self._lock:
+            entry = self._stats.get(statement)
+            if entry is None:
+                entry = self._stats[statement] = {
+                    'statement': statement, 'calls': 0, 'timed_calls': 0,
+                    'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0, 'slow': 0, 'sections': {},
+                }
+            entry['calls'] += 1
+            entry['rows'] += rows
+            entry['sections'][section] = entry['sections'].get(section, 0) + 1
+            if duration_ms is not None:
+                entry['timed_calls'] += 1
+                entry['total_ms'] += duration_ms
+                entry['max_ms'] = max(entry['max_ms'], duration_ms)
+                if duration_ms >= self.slow_query_ms:
+                    entry['slow'] += 1
+            self._recent.append({
+                'statement': statement,
+                'duration_ms': round(duration_ms, 3) if duration_ms is not None else None,
+                'rows': rows,
+                'section': section,
+                'at': time.time(),
+            })
+        if duration_ms is not None and duration_ms >= self.slow_query_ms:
+            logger.warning(f"Slow query ({duration_ms:.1f} ms, {rows} rows) in {section}: {statement}")
+
+    def get_stats(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Aggregated per-statement stats, slowest total time first"""
+        with self._lock:
+            statements = [dict(entry, sections=dict(entry['sections'])) for entry in self._stats.values()]
+            recent = list(self._recent)
+        for entry in statements:
+            timed = entry['timed_calls']
+            entry['avg_ms'] = round(entry['total_ms'] / timed, 3) if timed else None
+            entry['total_ms'] = round(entry['total_ms'], 3)
+            entry['max_ms'] = round(entry['max_ms'], 3)
+        statements.sort(key=lambda entry: (entry['total_ms'], entry['calls']), reverse=True)
+        return {
+            'enabled': self.enabled,
+            'slow_query_ms': self.slow_query_ms,
+            'statements': statements[:limit] if limit else statements,
+            'recent': recent[-limit:] if limit else recent,
+        }
+
+    def reset(self):
+        """Drop collected stats"""
+        with self._lock:
+            self._stats.clear()
+            self._recent.clear()
+
+
+class _TracedCursor(sqlite3.Cursor):
+    """Cursor that reports each statement to the tracer once it is finished"""
+
+    _trace = None
+
+    def _start(self, sql: str):
+        self._finish()
+        self._trace = [sql, 0.0, 0, query_tracer.caller()]
+        self.connection._active = weakref.ref(self)
+
+    def _finish(self):
+        trace, self._trace = self._trace, None
+        if trace is None:
+            return
+        active = self.connection._active
+        if active is not None and active() is self:
+            self.connection._active = None
+        sql, duration, rows, section = trace
+        if self.description is None and self.rowcount > 0:
+            rows = self.rowcount
+        query_tracer.record(sql, duration, rows, section)
+
+    def _timed(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            if self._trace is not None:
+                self._trace[1] += time.perf_counter() - started
+
+    def execute(self, sql, parameters=()):
+        self._start(sql)
+        self._timed(super().execute, sql, parameters)
+        if self.description is None:
+            self._finish()
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._start(sql)
+        self._timed(super().executemany, sql, seq_of_parameters)
+        self._finish()
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if self._trace is not None:
+            if row is None:
+                self._finish()
+            else:
+                self._trace[2] += 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed(super().fetchmany, self.arraysize if size is None else size)
+        if self._trace is not None:
+            self._trace[2] += len(rows)
+            if not rows:
+                self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        if self._trace is not None:
+            self._trace[2] += len(rows)
+            self._finish()
+        return rows
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        if query_tracer is not None:
+            self._finish()
+
+
+class _TracedConnection(sqlite3.Connection):
+    """Connection whose execute/executemany go through _TracedCursor"""
+
+    _active = None  # weakref to the cursor whose statement is in flight
+    _in_transaction_end = False
+
+    def cursor(self, factory=_TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        self._timed_transaction_end('COMMIT', super().commit)
+
+    def rollback(self):
+        self._timed_transaction_end('ROLLBACK', super().rollback)
+
+    def _timed_transaction_end(self, statement: str, fn):
+        if not self.in_transaction:
+            return fn()
+        section = query_tracer.caller()
+        self._in_transaction_end = True  # recorded here with a duration, not by _on_trace
+        started = time.perf_counter()
+        try:
+            fn()
+        finally:
+            self._in_transaction_end = False
+            query_tracer.record(statement, time.perf_counter() - started, 0, section)
+
+    def _on_trace(self, statement: str):
+        """set_trace_callback hook: record statements not issued through a traced cursor"""
+        if self._in_transaction_end:
+            return
+        active = self._active
+        if active is None or active() is None:
+            query_tracer.record(statement, None, 0, query_tracer.caller())
+
+
+query_tracer = QueryTracer()
+
+
+# How DatabaseManager connections open the file:
+#   rw        - read-write (default)
+#   ro        - mode=ro URI: writes fail, but locking and WAL visibility are unchanged
+#   immutable - mode=ro&immutable=1: no locks and no change detection, only for
+#               frozen snapshot copies (see SnapshotManager)
+DB_MODES = ('rw', 'ro', 'immutable')
+
+
+def _connect(db_path, mode: str = 'rw', **kwargs) -> sqlite3.Connection:
+    """Open ``db_path`` in one of DB_MODES"""
+    if mode != 'rw':
+        flags = 'mode=ro&immutable=1' if mode == 'immutable' else 'mode=ro'
+        db_path = f"file:{quote(Path(db_path).resolve().as_posix())}?{flags}"
+        kwargs['uri'] = True
+    return query_tracer.connect(db_path, **kwargs)
+
+
+class ConnectionPool:
+    """
+    Bounded pool of SQLite connections shared by every DatabaseManager in a process.
+
+    A thread keeps the same connection for nested ``connection()`` blocks, and
+    ``pin()`` extends that to a whole unit of work (one Flask request), so a
+    request that calls several ``DatabaseManager`` methods opens at most one
+    connection. Idle connections are kept open and handed to the next caller.
+    """
+
+    def __init__(self, db_path: Path, max_size: int = 8, timeout: float = 30.0,
+                 health_check_interval: float = 60.0, busy_timeout_ms: int = 5000,
+                 mode: str = 'rw'):
+        self.db_path = db_path
+        self.mode = mode
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._cond = threading.Condition()
+        self._idle: List[tuple] = []  # (connection, last_used) - most recently used last
+        self._size = 0                # connections currently open (idle + leased)
+        self._closed = False
+        self._local = threading.local()
+
+        self.stats = {'opened': 0, 'closed': 0, 'checkouts': 0, 'reused': 0, 'discarded': 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection configured for pooled use"""
+        conn = _connect(
+            self.db_path, self.mode, timeout=self.busy_timeout_ms / 1000, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection):
+        """Close a connection that is leaving the pool (caller holds the lock)"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        self._size -= 1
+        self.stats['closed'] += 1
+        self._cond.notify()
+
+    def _is_healthy(self, conn: sqlite3.Connection, last_used: float) -> bool:
+        """Ping connections that have been idle longer than the health check interval"""
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding unhealthy pooled connection: {e}")
+            return False
+
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle connection, open a new one, or wait for one to be returned"""
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed")
+
+                while self._idle:
+                    conn, last_used = self._idle.pop()
+                    if self._is_healthy(conn, last_used):
+                        self.stats['checkouts'] += 1
+                        self.stats['reused'] += 1
+                        return conn
+                    self.stats['discarded'] += 1
+                    self._discard(conn)
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolExhaustedError(
+                        f"No database connection available after {self.timeout}s "
+                        f"(pool size {self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.stats['opened'] += 1
+            self.stats['checkouts'] += 1
+        return conn
+
+    def _checkin(self, conn: sqlite3.Connection):
+        """Return a connection to the idle list, rolling back any open transaction"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            healthy = True
+        except sqlite3.Error:
+            healthy = False
+
+        with self._cond:
+            if self._closed or not healthy:
+                self._discard(conn)
+                return
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Borrow this thread's connection, checking one out if it has none"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            lease = _Lease(self._checkout())
+            self._local.lease = lease
+
+        lease.depth += 1
+        try:
+            yield lease.conn
+        finally:
+            lease.depth -= 1
+            if lease.depth == 0 and not lease.pinned:
+                self._local.lease = None
+                self._checkin(lease.conn)
+
+    def pin(self):
+        """Keep the current thread's connection checked out until ``unpin()``"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            lease = _Lease(self._checkout())
+            self._local.lease = lease
+        lease.pinned = True
+
+    def unpin(self):
+        """Release a pinned connection back to the pool"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            return
+        lease.pinned = False
+        if lease.depth == 0:
+            self._local.lease = None
+            self._checkin(lease.conn)
+
+    def close(self):
+        """Close idle connections and refuse new checkouts; leased ones close on return"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool counters plus current occupancy"""
+        with self._cond:
+            return dict(self.stats, size=self._size, idle=len(self._idle), max_size=self.max_size)
+
+
+class WriteQueue:
+    """
+    Serializes every write through one dedicated writer thread and connection.
+
+    With the database in WAL mode readers never wait on this writer, and
+    because in-process writers no longer compete for the write lock the only
+    remaining contention is with other processes, which the busy timeout
+    absorbs. The writer also owns WAL checkpointing: a PASSIVE checkpoint runs
+    once ``checkpoint_interval`` seconds have passed since the last one (or
+    when the queue goes idle with uncheckpointed writes), and a TRUNCATE
+    checkpoint runs on close.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path: Path, busy_timeout_ms: int = 5000,
+                 wal_autocheckpoint: int = 1000, checkpoint_interval: float = 300.0):
+        self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.wal_autocheckpoint = wal_autocheckpoint
+        self.checkpoint_interval = checkpoint_interval
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self.stats = {'writes': 0, 'failed': 0, 'checkpoints': 0, 'last_checkpoint': None}
+
+        self._thread = threading.Thread(target=self._run, name='fluxgen-db-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, fn) -> Future:
+        """Queue ``fn(conn)`` to run and commit on the writer thread"""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Write queue is closed")
+        future: Future = Future()
+        # Attribute traced statements to the submitting code, not the writer thread
+        section = query_tracer.caller() if query_tracer.enabled else None
+        self._queue.put((fn, future, section))
+        return future
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = query_tracer.connect(self.db_path, timeout=self.busy_timeout_ms / 1000)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA wal_autocheckpoint = {int(self.wal_autocheckpoint)}")
+        # WAL stays durable against application crashes with NORMAL; skips an fsync per commit
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _checkpoint(self, conn: sqlite3.Connection, mode: str = 'PASSIVE') -> tuple:
+        busy, log_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        self.stats['checkpoints'] += 1
+        self.stats['last_checkpoint'] = {
+            'mode': mode, 'busy': busy, 'log_frames': log_frames, 'checkpointed': checkpointed,
+        }
+        return busy, log_frames, checkpointed
+
+    def _run(self):
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            logger.error(f"Database writer could not open {self.db_path}: {e}")
+            self._closed = True
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not self._STOP:
+                    item[1].set_exception(e)
+            return
+
+        last_checkpoint = time.monotonic()
+        dirty = False
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.checkpoint_interval if dirty else None)
+                except queue.Empty:
+                    # Idle with uncheckpointed writes
+                    self._checkpoint(conn)
+                    last_checkpoint, dirty = time.monotonic(), False
+                    continue
+
+                if item is self._STOP:
+                    break
+                fn, future, section = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    with query_tracer.section(section):
+                        result = fn(conn)
+                        conn.commit()
+                except BaseException as e:
+                    conn.rollback()
+                    self.stats['failed'] += 1
+                    future.set_exception(e)
+                else:
+                    self.stats['writes'] += 1
+                    dirty = True
+                    future.set_result(result)
+
+                if dirty and time.monotonic() - last_checkpoint >= self.checkpoint_interval:
+                    self._checkpoint(conn)
+                    last_checkpoint, dirty = time.monotonic(), False
+        finally:
+            try:
+                self._checkpoint(conn, 'TRUNCATE')
+            except sqlite3.Error as e:
+                logger.warning(f"Final WAL checkpoint failed: {e}")
+            conn.close()
+
+    def checkpoint(self, mode: str = 'PASSIVE') -> tuple:
+        """Run a WAL checkpoint on the writer thread; returns (busy, log, checkpointed)"""
+        return self.submit(lambda conn: self._checkpoint(conn, mode)).result()
+
+    def pending(self) -> int:
+        """Writes waiting in the queue"""
+        return self._queue.qsize()
+
+    def close(self, timeout: float = 30.0):
+        """Finish queued writes, checkpoint and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer counters plus queue depth"""
+        return dict(self.stats, pending=self.pending())
+
+
+# Tables whose writes are counted in dataset_versions (kept current by triggers)
+VERSIONED_TABLES = (
+    'company_info', 'team_members', 'investment_capex', 'production_targets',
+    'alloys_catalog', 'funding_programs', 'certifications_roadmap', 'business_assumptions',
+    'competitors', 'competitor_pricing', 'market_analysis', 'raw_materials', 'brand_assets',
+)
+
+
+def _dataset_versions_sql() -> str:
+    """Version table plus one bump trigger per table and write operation"""
+    statements = [
+        "CREATE TABLE IF NOT EXISTS dataset_versions ("
+        "table_name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0);"
+    ]
+    for table in VERSIONED_TABLES:
+        statements.append(
+            f"INSERT OR IGNORE INTO dataset_versions (table_name, version) VALUES ('{table}', 0);"
+        )
+        for op in ('INSERT', 'UPDATE', 'DELETE'):
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{op.lower()} "
+                f"AFTER {op} ON {table} BEGIN "
+                f"UPDATE dataset_versions SET version = version + 1 WHERE table_name = '{table}'; "
+                f"END;"
+            )
+    return "\n".join(statements)
+
+
+# Single-row summary kept current by triggers on its three source tables.
+# get_financial_summary() reads it with one point lookup; the reconcile
+# command compares it against FINANCIAL_SUMMARY_RECOMPUTE.
+FINANCIAL_SUMMARY_RECOMPUTE = """
+    SELECT
+        (SELECT COALESCE(SUM(estimated_cost_cad), 0) FROM investment_capex) AS total_capex,
+        (SELECT COALESCE(SUM(output_kg_month), 0) FROM production_targets) AS total_capacity,
+        (SELECT COUNT(*) FROM team_members WHERE status = 'active') AS team_size
+"""
+
+FINANCIAL_SUMMARY_SQL = f"""
+CREATE TABLE IF NOT EXISTS financial_summary (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_capex REAL NOT NULL DEFAULT 0,
+    total_capacity INTEGER NOT NULL DEFAULT 0,
+    team_size INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR REPLACE INTO financial_summary (id, total_capex, total_capacity, team_size)
+    SELECT 1, total_capex, total_capacity, team_size FROM ({FINANCIAL_SUMMARY_RECOMPUTE});
+
+CREATE TRIGGER IF NOT EXISTS trg_investment_capex_summary_insert AFTER INSERT ON investment_capex BEGIN
+    UPDATE financial_summary SET total_capex = total_capex + COALESCE(NEW.estimated_cost_cad, 0) WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_investment_capex_summary_update
+AFTER UPDATE OF estimated_cost_cad ON investment_capex BEGIN
+    UPDATE financial_summary SET total_capex = total_capex
+        + COALESCE(NEW.estimated_cost_cad, 0) - COALESCE(OLD.estimated_cost_cad, 0) WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_investment_capex_summary_delete AFTER DELETE ON investment_capex BEGIN
+    UPDATE financial_summary SET total_capex = total_capex - COALESCE(OLD.estimated_cost_cad, 0) WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_production_targets_summary_insert AFTER INSERT ON production_targets BEGIN
+    UPDATE financial_summary SET total_capacity = total_capacity + COALESCE(NEW.output_kg_month, 0) WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_production_targets_summary_update
+AFTER UPDATE OF output_kg_month ON production_targets BEGIN
+    UPDATE financial_summary SET total_capacity = total_capacity
+        + COALESCE(NEW.output_kg_month, 0) - COALESCE(OLD.output_kg_month, 0) WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_production_targets_summary_delete AFTER DELETE ON production_targets BEGIN
+    UPDATE financial_summary SET total_capacity = total_capacity - COALESCE(OLD.output_kg_month, 0) WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_team_members_summary_insert AFTER INSERT ON team_members BEGIN
+    UPDATE financial_summary SET team_size = team_size
+        + (CASE WHEN NEW.status = 'active' THEN 1 ELSE 0 END) WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_team_members_summary_update AFTER UPDATE OF status ON team_members BEGIN
+    UPDATE financial_summary SET team_size = team_size
+        + (CASE WHEN NEW.status = 'active' THEN 1 ELSE 0 END)
+        - (CASE WHEN OLD.status = 'active' THEN 1 ELSE 0 END) WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_team_members_summary_delete AFTER DELETE ON team_members BEGIN
+    UPDATE financial_summary SET team_size = team_size
+        - (CASE WHEN OLD.status = 'active' THEN 1 ELSE 0 END) WHERE id = 1;
+END;
+"""
+
+# Indexes for hot lookups and sorts found by `manage.py index-advisor`
+LOOKUP_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_capex_phase_category ON investment_capex(phase, category);
+CREATE INDEX IF NOT EXISTS idx_market_analysis_category_metric_year
+    ON market_analysis(category, metric, year DESC);
+"""
+
+# The suppliers table belongs to the Ai-Sourcing scripts and may not exist yet
+SUPPLIER_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_suppliers_company_name ON suppliers(company_name);
+CREATE INDEX IF NOT EXISTS idx_suppliers_website ON suppliers(website);
+"""
+
+
+def _lookup_indexes_sql(conn: sqlite3.Connection) -> str:
+    """LOOKUP_INDEXES_SQL, plus SUPPLIER_INDEXES_SQL when the suppliers table exists"""
+    has_suppliers = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'suppliers'"
+    ).fetchone()
+    return LOOKUP_INDEXES_SQL + (SUPPLIER_INDEXES_SQL if has_suppliers else '')
+
+
+# Schema migrations applied by DatabaseManager.migrate(), tracked in PRAGMA user_version.
+# A migration is an SQL script, or a function of the connection that returns one.
+SCHEMA_MIGRATIONS = [
+    (1, 'dataset version counters', _dataset_versions_sql()),
+    (2, 'materialized financial summary', FINANCIAL_SUMMARY_SQL),
+    (3, 'lookup indexes', _lookup_indexes_sql),
+]
+
+
+class _VersionWatcher:
+    """
+    Tracks per-table dataset versions for one database file.
+
+    ``PRAGMA data_version`` on a dedicated connection changes whenever any
+    other connection - a pooled one in this process or an Ai-Sourcing script -
+    commits, so the version table is only re-read after something was written.
+    Databases without the dataset_versions table fall back to a single epoch
+    that moves on every detected write.
+    """
+
+    def __init__(self, db_path: Path, mode: str = 'rw'):
+        if mode == 'immutable':
+            # Untraced like the rw connection; a frozen copy is read once and never changes
+            self.conn = sqlite3.connect(
+                f"file:{quote(Path(db_path).resolve().as_posix())}?mode=ro&immutable=1",
+                uri=True, check_same_thread=False
+            )
+        else:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.data_version = None
+        self.versions: Optional[Dict[str, int]] = None
+        self.epoch = 0
+        self.stale = True
+
+    def refresh(self):
+        """Re-read versions if the database changed since the last check (caller holds the lock)"""
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self.data_version and not self.stale:
+            return
+        self.data_version = data_version
+        self.stale = False
+        self.epoch += 1
+        try:
+            self.versions = dict(self.conn.execute("SELECT table_name, version FROM dataset_versions"))
+        except sqlite3.OperationalError:
+            self.versions = None
+
+    def version_key(self, tables: tuple) -> tuple:
+        """Cache key component for data read from ``tables``"""
+        if self.versions is None:
+            return ('epoch', self.epoch)
+        return tuple(self.versions.get(table, 0) for table in tables)
+
+
+class DatasetCache:
+    """
+    Process-wide read-through cache for rarely changing dataset queries.
+
+    Entries are stored with the versions of the tables they were read from and
+    are reloaded as soon as any of those tables is written, by this process or
+    by another one.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries: Dict[tuple, tuple] = {}   # (db, name) -> (version_key, value)
+        self._watchers: Dict[str, _VersionWatcher] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _watcher(self, db_key: str, db_path: Path, mode: str) -> _VersionWatcher:
+        watcher = self._watchers.get(db_key)
+        if watcher is None:
+            watcher = self._watchers[db_key] = _VersionWatcher(db_path, mode)
+        return watcher
+
+    def version_key(self, db_key: str, db_path: Path, tables: tuple, mode: str = 'rw') -> tuple:
+        """Current version key for ``tables``, checking for outside writes first"""
+        with self._lock:
+            watcher = self._watcher(db_key, db_path, mode)
+            watcher.refresh()
+            return watcher.version_key(tables)
+
+    def read_through(self, db_key: str, name: str, version_key: tuple, loader):
+        """Return the cached value for ``name`` at ``version_key``, loading it on a miss"""
+        with self._lock:
+            entry = self._entries.get((db_key, name))
+            if entry is not None and entry[0] == version_key:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries[(db_key, name)] = (version_key, value)
+        return value
+
+    def note_write(self, db_key: str):
+        """Force a version re-read on the next lookup after a local write"""
+        with self._lock:
+            watcher = self._watchers.get(db_key)
+            if watcher is not None:
+                watcher.stale = True
+                watcher.epoch += 1
+
+    def forget(self, db_key: str):
+        """Drop entries and the version watcher of one database (e.g. a deleted snapshot)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == db_key]:
+                del self._entries[key]
+            watcher = self._watchers.pop(db_key, None)
+            if watcher is not None:
+                watcher.conn.close()
+
+    def clear(self):
+        """Drop all cached entries and close version watchers"""
+        with self._lock:
+            self._entries.clear()
+            for watcher in self._watchers.values():
+                watcher.conn.close()
+            self._watchers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and entry count"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+            }
+
+
+dataset_cache = DatasetCache()
+
 
 class DatabaseManager:
     """SQLite database manager for FluxGen data"""
+
+    # Read queries shared by the get_* methods and read_snapshot()
+    DATASET_QUERIES = {
+        'team_members': "SELECT * FROM team_members ORDER BY id",
+        'investment_capex': "SELECT * FROM investment_capex ORDER BY phase, category",
+        'production_targets': "SELECT * FROM production_targets ORDER BY phase",
+        'alloys_catalog': "SELECT * FROM alloys_catalog ORDER BY alloy_symbol",
+        'funding_programs': "SELECT * FROM funding_programs ORDER BY program_name",
+        'certifications_roadmap': "SELECT * FROM certifications_roadmap ORDER BY phase, target_date",
+        'business_assumptions': "SELECT * FROM business_assumptions ORDER BY phase, category, assumption_name",
+        'competitors': "SELECT * FROM competitors ORDER BY company_name",
+        'competitor_pricing': "SELECT * FROM competitor_pricing ORDER BY supplier, flux_name",
+        'market_analysis': "SELECT * FROM market_analysis ORDER BY category, metric, year DESC",
+        'raw_materials': "SELECT * FROM raw_materials ORDER BY material_name, batch_mark",
+        'brand_assets': "SELECT * FROM brand_assets ORDER BY brand_type",
+    }
     
-    def __init__(self, db_path: Path):
+    # Columns the data editor may change per table (bulk_update)
+    EDITABLE_COLUMNS = {
+        'company_info': (
+            'legal_name', 'operating_name', 'location', 'province', 'country',
+            'incorporation_status', 'tagline', 'vision', 'mission', 'website',
+            'primary_email', 'primary_phone',
+        ),
+        'team_members': (
+            'name', 'role', 'email', 'phone', 'address', 'status', 'notes',
+            'background', 'expertise', 'current_position', 'value_to_fluxgen',
+        ),
+        'investment_capex': (
+            'category', 'description', 'estimated_cost_cad', 'actual_cost_cad',
+            'phase', 'status', 'notes',
+        ),
+        'production_targets': (
+            'phase', 'output_kg_month', 'facility_type', 'process_flow',
+            'sourcing_strategy', 'target_date', 'status',
+        ),
+    }
+
+    # Cached reads: name -> (tables the result depends on)
+    FINANCIAL_SUMMARY_TABLES = ('investment_capex', 'production_targets', 'team_members')
+
+    def __init__(self, db_path: Path, pool: Optional[ConnectionPool] = None,
+                 writer: Optional[WriteQueue] = None, mode: str = 'rw'):
+        if mode not in DB_MODES:
+            raise ValueError(f"Unknown database mode: {mode}")
         self.db_path = db_path
+        self.pool = pool
+        self.writer = writer
+        self.mode = mode
+        self._cache_key = str(Path(db_path).resolve())
         
     @contextmanager
     def get_connection(self):
-        """Get database connection with automatic cleanup"""
-        conn = sqlite3.connect(self.db_path)
+        """Get database connection with automatic cleanup
+
+        Connections come from the pool when one is configured; otherwise a
+        short-lived connection is opened and closed around the block.
+        """
+        if self.pool is not None:
+            with self.pool.connection() as conn:
+                yield conn
+            return
+
+        conn = _connect(self.db_path, self.mode)
         conn.row_factory = sqlite3.Row  # Enable dict-like access
         try:
             yield conn
         finally:
             conn.close()
+
+    def close(self):
+        """Drain the write queue and close pooled connections"""
+        if self.writer is not None:
+            self.writer.close()
+        if self.pool is not None:
+            self.pool.close()
+
+    def set_journal_mode(self, mode: str = 'WAL') -> str:
+        """Switch the database journal mode (persistent for WAL); returns the mode in effect"""
+        with self.get_connection() as conn:
+            return conn.execute(f"PRAGMA journal_mode = {mode}").fetchone()[0]
+
+    def checkpoint(self, mode: str = 'PASSIVE') -> tuple:
+        """Checkpoint the WAL into the main database file; returns (busy, log, checkpointed)"""
+        if self.writer is not None:
+            return self.writer.checkpoint(mode)
+        with self.get_connection() as conn:
+            return tuple(conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone())
+
+    def run_write(self, fn):
+        """
+        Run ``fn(conn)`` as one committed write transaction and return its result.
+
+        Writes go through the single writer thread when one is configured,
+        otherwise they run on a pooled connection.
+        """
+        if self.mode != 'rw':
+            raise sqlite3.OperationalError(f"Database {self.db_path} is open {self.mode}; writes are not allowed")
+        if self.writer is not None:
+            result = self.writer.submit(fn).result()
+        else:
+            with self.get_connection() as conn:
+                try:
+                    result = fn(conn)
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+        self._note_write()
+        return result
+
+    def migrate(self) -> int:
+        """Apply pending SCHEMA_MIGRATIONS and return the resulting schema version"""
+        with self.get_connection() as conn:
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            for version, description, script in SCHEMA_MIGRATIONS:
+                if version <= current:
+                    continue
+                if self.mode != 'rw':
+                    raise sqlite3.OperationalError(
+                        f"Database {self.db_path} is open {self.mode} but needs migration {version}"
+                    )
+                logger.info(f"Applying database migration {version}: {description}")
+                if callable(script):
+                    script = script(conn)
+                conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;")
+                current = version
+        self._note_write()
+        return current
+
+    def _note_write(self):
+        """Bump the in-process dataset version after a committed write"""
+        dataset_cache.note_write(self._cache_key)
+
+    def dataset_version(self) -> tuple:
+        """Current versions of every table read_snapshot() reads (changes on any write to them)"""
+        return dataset_cache.version_key(self._cache_key, self.db_path, VERSIONED_TABLES, self.mode)
+
+    def _cached(self, name: str, tables: tuple, loader):
+        """Read-through lookup in the process-wide dataset cache"""
+        version_key = dataset_cache.version_key(self._cache_key, self.db_path, tables, self.mode)
+        return dataset_cache.read_through(self._cache_key, name, version_key, loader)
+
+    def _cached_rows(self, name: str) -> List[Dict[str, Any]]:
+        """Cached DATASET_QUERIES result, copied so callers can't alter the cache"""
+        rows = self._cached(
+            name, (name,),
+            lambda: tuple(self.execute_query(self.DATASET_QUERIES[name]))
+        )
+        return [dict(row) for row in rows]
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the process-wide dataset cache"""
+        return dataset_cache.get_stats()
+
+    def query_stats(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Per-statement timings collected while query tracing is enabled"""
+        return query_tracer.get_stats(limit)
     
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute SELECT query and return results as list of dicts"""
@@ -31,17 +1013,54 @@ class DatabaseManager:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
     
+    def _model_select(self, model: type, where: str, order_by: str) -> str:
+        columns = ', '.join(ModelFactory.columns(model))
+        query = f"SELECT {columns} FROM {ModelFactory.TABLES[model]}"
+        if where:
+            query += f" WHERE {where}"
+        if order_by:
+            query += f" ORDER BY {order_by}"
+        return query
+
+    def query_models(self, model: type, where: str = '', params: tuple = (),
+                     order_by: str = 'id') -> List[Any]:
+        """
+        Typed SELECT returning slotted model instances instead of dicts.
+
+        Columns are selected explicitly in field order and fetched as plain
+        tuples, so each row costs one positional constructor call rather than
+        a sqlite3.Row plus a dict.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(self._model_select(model, where, order_by), params).fetchall()
+        return ModelFactory.from_rows(model, rows)
+
+    def iter_models(self, model: type, where: str = '', params: tuple = (),
+                    order_by: str = 'id', batch_size: int = 1000):
+        """Like query_models, but yields instances in batches for very large tables"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(self._model_select(model, where, order_by), params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from ModelFactory.from_rows(model, rows)
+
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute INSERT/UPDATE/DELETE query and return affected rows"""
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            conn.commit()
-            return cursor.rowcount
+        return self.run_write(lambda conn: conn.execute(query, params).rowcount)
     
     def get_company_info(self) -> Optional[Dict[str, Any]]:
         """Get company information"""
-        result = self.execute_query("SELECT * FROM company_info LIMIT 1")
-        return result[0] if result else None
+        result = self._cached(
+            'company_info', ('company_info',),
+            lambda: tuple(self.execute_query("SELECT * FROM company_info LIMIT 1"))
+        )
+        return dict(result[0]) if result else None
     
     def update_company_info(self, data: Dict[str, Any]) -> bool:
         """Update company information"""
@@ -62,7 +1081,7 @@ class DatabaseManager:
     
     def get_team_members(self) -> List[Dict[str, Any]]:
         """Get all team members"""
-        return self.execute_query("SELECT * FROM team_members ORDER BY id")
+        return self.execute_query(self.DATASET_QUERIES['team_members'])
     
     def get_team_member(self, member_id: int) -> Optional[Dict[str, Any]]:
         """Get specific team member"""
@@ -80,10 +1099,7 @@ class DatabaseManager:
             data.get('phone'), data.get('address'), data.get('status', 'active'),
             data.get('notes')
         )
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            conn.commit()
-            return cursor.lastrowid
+        return self.run_write(lambda conn: conn.execute(query, params).lastrowid)
     
     def update_team_member(self, member_id: int, data: Dict[str, Any]) -> bool:
         """Update team member"""
@@ -105,7 +1121,7 @@ class DatabaseManager:
     
     def get_investment_capex(self) -> List[Dict[str, Any]]:
         """Get all CAPEX items"""
-        return self.execute_query("SELECT * FROM investment_capex ORDER BY phase, category")
+        return self.execute_query(self.DATASET_QUERIES['investment_capex'])
     
     def update_capex_item(self, item_id: int, data: Dict[str, Any]) -> bool:
         """Update CAPEX item"""
@@ -124,7 +1140,7 @@ class DatabaseManager:
     
     def get_production_targets(self) -> List[Dict[str, Any]]:
         """Get all production targets"""
-        return self.execute_query("SELECT * FROM production_targets ORDER BY phase")
+        return self.execute_query(self.DATASET_QUERIES['production_targets'])
     
     def update_production_target(self, target_id: int, data: Dict[str, Any]) -> bool:
         """Update production target"""
@@ -141,72 +1157,307 @@ class DatabaseManager:
         )
         return self.execute_update(query, params) > 0
     
+    def bulk_update(self, table: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply partial updates to many rows of one table in a single transaction.
+
+        Each row is ``{'id': ..., column: value, ...}`` and only the given
+        columns change. Rows sharing a column set are written with one
+        ``executemany``. The batch is all-or-nothing: if any row is invalid or
+        its id does not exist, nothing is written.
+
+        Returns ``{'applied': bool, 'results': [{'id', 'status', 'error'?}, ...]}``
+        with status ``updated``, ``invalid``, ``not_found`` or ``skipped``.
+        """
+        if table not in self.EDITABLE_COLUMNS:
+            raise ValueError(f"Table {table} does not support bulk updates")
+        allowed = set(self.EDITABLE_COLUMNS[table])
+
+        results = []
+        seen_ids = set()
+        for row in rows:
+            row_id = row.get('id') if isinstance(row, dict) else None
+            result = {'id': row_id, 'status': 'updated'}
+            if not isinstance(row, dict) or not isinstance(row_id, int) or isinstance(row_id, bool):
+                result.update(status='invalid', error='Each row needs an integer id')
+            elif row_id in seen_ids:
+                result.update(status='invalid', error='Duplicate id in batch')
+            elif not set(row) - {'id'}:
+                result.update(status='invalid', error='No columns to update')
+            elif set(row) - {'id'} - allowed:
+                unknown = sorted(set(row) - {'id'} - allowed)
+                result.update(status='invalid', error=f"Unknown columns: {', '.join(unknown)}")
+            else:
+                seen_ids.add(row_id)
+            results.append(result)
+
+        if any(r['status'] == 'invalid' for r in results):
+            for r in results:
+                if r['status'] == 'updated':
+                    r['status'] = 'skipped'
+            return {'applied': False, 'results': results}
+
+        # Group rows by the columns they set so each group is one executemany
+        groups: Dict[tuple, List[tuple]] = {}
+        for row in rows:
+            columns = tuple(sorted(set(row) - {'id'}))
+            groups.setdefault(columns, []).append(tuple(row[c] for c in columns) + (row['id'],))
+
+        def apply(conn):
+            ids = list(seen_ids)
+            placeholders = ','.join('?' * len(ids))
+            existing = {r[0] for r in conn.execute(f"SELECT id FROM {table} WHERE id IN ({placeholders})", ids)}
+            if len(existing) != len(ids):
+                return existing
+            for columns, params in groups.items():
+                assignments = ', '.join(f"{column} = ?" for column in columns)
+                conn.executemany(f"UPDATE {table} SET {assignments} WHERE id = ?", params)
+            return existing
+
+        existing = self.run_write(apply)
+        applied = len(existing) == len(seen_ids)
+        for r in results:
+            if r['id'] not in existing:
+                r['status'] = 'not_found'
+            elif not applied:
+                r['status'] = 'skipped'
+        return {'applied': applied, 'results': results}
+
     def get_alloys_catalog(self) -> List[Dict[str, Any]]:
         """Get alloys catalog"""
-        return self.execute_query("SELECT * FROM alloys_catalog ORDER BY alloy_symbol")
+        return self._cached_rows('alloys_catalog')
     
     def get_funding_programs(self) -> List[Dict[str, Any]]:
         """Get funding programs"""
-        return self.execute_query("SELECT * FROM funding_programs ORDER BY program_name")
+        return self._cached_rows('funding_programs')
     
     def get_certifications_roadmap(self) -> List[Dict[str, Any]]:
         """Get certifications roadmap"""
-        return self.execute_query("SELECT * FROM certifications_roadmap ORDER BY phase, target_date")
+        return self._cached_rows('certifications_roadmap')
 
     def get_business_assumptions(self) -> List[Dict[str, Any]]:
         """Get key business assumptions by phase/category"""
-        return self.execute_query(
-            "SELECT * FROM business_assumptions ORDER BY phase, category, assumption_name"
-        )
+        return self._cached_rows('business_assumptions')
 
     def get_competitors(self) -> List[Dict[str, Any]]:
         """Get competitor list"""
-        return self.execute_query("SELECT * FROM competitors ORDER BY company_name")
+        return self._cached_rows('competitors')
 
     def get_competitor_pricing(self) -> List[Dict[str, Any]]:
         """Get competitor pricing benchmarks"""
-        return self.execute_query(
-            "SELECT * FROM competitor_pricing ORDER BY supplier, flux_name"
-        )
+        return self.execute_query(self.DATASET_QUERIES['competitor_pricing'])
 
     def get_market_analysis(self) -> List[Dict[str, Any]]:
         """Get market analysis metrics"""
-        return self.execute_query(
-            "SELECT * FROM market_analysis ORDER BY category, metric, year DESC"
-        )
+        return self._cached_rows('market_analysis')
 
     def get_raw_materials(self) -> List[Dict[str, Any]]:
         """Get raw material specifications"""
-        return self.execute_query(
-            "SELECT * FROM raw_materials ORDER BY material_name, batch_mark"
-        )
+        return self.execute_query(self.DATASET_QUERIES['raw_materials'])
     
     def get_brand_assets(self) -> List[Dict[str, Any]]:
         """Get brand assets"""
-        return self.execute_query("SELECT * FROM brand_assets ORDER BY brand_type")
+        return self.execute_query(self.DATASET_QUERIES['brand_assets'])
     
     def get_financial_summary(self) -> Dict[str, Any]:
         """Get financial summary data"""
-        # Total estimated CAPEX
-        capex_result = self.execute_query(
-            "SELECT SUM(estimated_cost_cad) as total_estimated_capex FROM investment_capex"
-        )
-        total_capex = capex_result[0]['total_estimated_capex'] or 0
-        
-        # Production capacity
-        production_result = self.execute_query(
-            "SELECT SUM(output_kg_month) as total_capacity FROM production_targets"
-        )
-        total_capacity = production_result[0]['total_capacity'] or 0
-        
-        # Team size
-        team_result = self.execute_query(
-            "SELECT COUNT(*) as team_size FROM team_members WHERE status = 'active'"
-        )
-        team_size = team_result[0]['team_size'] or 0
-        
+        def load():
+            with self.get_connection() as conn:
+                return self._query_financial_summary(conn)
+        return dict(self._cached('financial_summary', self.FINANCIAL_SUMMARY_TABLES, load))
+
+    def _query_financial_summary(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Read the materialized financial summary on an open connection"""
+        try:
+            row = conn.execute(
+                "SELECT total_capex, total_capacity, team_size FROM financial_summary WHERE id = 1"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Database not migrated yet: aggregate the source tables directly
+            row = None
+        if row is None:
+            row = conn.execute(FINANCIAL_SUMMARY_RECOMPUTE).fetchone()
         return {
-            'total_capex': total_capex,
-            'total_capacity': total_capacity,
-            'team_size': team_size
+            'total_capex': row['total_capex'] or 0,
+            'total_capacity': row['total_capacity'] or 0,
+            'team_size': row['team_size'] or 0
         }
+
+    def reconcile_financial_summary(self, fix: bool = False, tolerance: float = 0.005) -> Dict[str, Any]:
+        """
+        Compare the materialized financial summary with a full recompute.
+
+        Returns both versions and the mismatching fields; with ``fix`` the
+        table is overwritten with the recomputed values.
+        """
+        with self.get_connection() as conn:
+            recomputed = dict(conn.execute(FINANCIAL_SUMMARY_RECOMPUTE).fetchone())
+            try:
+                row = conn.execute(
+                    "SELECT total_capex, total_capacity, team_size FROM financial_summary WHERE id = 1"
+                ).fetchone()
+            except sqlite3.OperationalError:
+                raise sqlite3.OperationalError(
+                    "financial_summary table is missing; apply migrations first"
+                ) from None
+        materialized = dict(row) if row else None
+
+        mismatches = []
+        for key, expected in recomputed.items():
+            actual = materialized.get(key) if materialized else None
+            if actual is None or abs(actual - expected) > tolerance:
+                mismatches.append({'field': key, 'materialized': actual, 'recomputed': expected})
+
+        def overwrite(conn):
+            conn.execute(
+                "INSERT OR REPLACE INTO financial_summary (id, total_capex, total_capacity, team_size) "
+                "VALUES (1, :total_capex, :total_capacity, :team_size)", recomputed
+            )
+            # financial_summary has no version counter of its own: count the fix
+            # against the tables it totals, so cached summaries and renders reload
+            tables = self.FINANCIAL_SUMMARY_TABLES
+            conn.execute(
+                f"UPDATE dataset_versions SET version = version + 1 "
+                f"WHERE table_name IN ({', '.join('?' * len(tables))})", tables
+            )
+
+        fixed = False
+        if mismatches and fix:
+            self.run_write(overwrite)
+            fixed = True
+
+        return {
+            'materialized': materialized,
+            'recomputed': recomputed,
+            'mismatches': mismatches,
+            'consistent': not mismatches,
+            'fixed': fixed,
+        }
+
+    def read_snapshot(self) -> DatasetSnapshot:
+        """
+        Load the full generation dataset inside a single read transaction.
+
+        Every table is read under the same lock, so an editor save that lands
+        mid-load cannot leave a document with half old and half new data.
+        Table versions are read in the same transaction, and tables whose
+        cached copy matches them are taken from the dataset cache.
+        """
+        with self.get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                try:
+                    versions = dict(conn.execute("SELECT table_name, version FROM dataset_versions"))
+                except sqlite3.OperationalError:
+                    versions = None
+
+                def load(name, tables, loader):
+                    if versions is None:
+                        return loader()
+                    version_key = tuple(versions.get(table, 0) for table in tables)
+                    return dataset_cache.read_through(self._cache_key, name, version_key, loader)
+
+                company = load(
+                    'company_info', ('company_info',),
+                    lambda: tuple(dict(row) for row in conn.execute("SELECT * FROM company_info LIMIT 1"))
+                )
+                tables = {
+                    name: load(name, (name,), lambda query=query: tuple(dict(row) for row in conn.execute(query)))
+                    for name, query in self.DATASET_QUERIES.items()
+                }
+                financial_summary = load(
+                    'financial_summary', self.FINANCIAL_SUMMARY_TABLES,
+                    lambda: self._query_financial_summary(conn)
+                )
+            finally:
+                conn.rollback()
+
+        return DatasetSnapshot(
+            company_info=company[0] if company else None,
+            financial_summary=financial_summary,
+            versions=versions or {},
+            **tables
+        )
+
+
+class SnapshotManager:
+    """
+    Frozen copies of the live database for read-only generation workers.
+
+    ``create()`` copies the live database with the SQLite backup API, which
+    gives a consistent point-in-time copy even while the editor is writing.
+    It takes the copy out of WAL so it is one self-contained file and
+    publishes it under ``snapshot_dir`` with an atomic rename. ``reader()``
+    opens the newest copy with ``immutable=1``, so generators take no locks
+    at all. A new copy is made only when the live dataset versions have
+    moved. Only the newest ``keep`` copies stay on disk.
+    """
+
+    PREFIX = 'fluxgen_snapshot_'
+
+    def __init__(self, db_path: Path, snapshot_dir: Path, keep: int = 3):
+        self.db_path = db_path
+        self.snapshot_dir = Path(snapshot_dir)
+        self.keep = max(1, keep)
+        self._live_key = str(Path(db_path).resolve())
+        self._lock = threading.Lock()
+        self._reader: Optional[DatabaseManager] = None
+        self._reader_versions: Optional[tuple] = None
+
+    def list(self) -> List[Path]:
+        """Published snapshots, oldest first"""
+        if not self.snapshot_dir.exists():
+            return []
+        return sorted(self.snapshot_dir.glob(f"{self.PREFIX}*.db"))
+
+    def latest(self) -> Optional[Path]:
+        snapshots = self.list()
+        return snapshots[-1] if snapshots else None
+
+    def _live_versions(self) -> tuple:
+        return dataset_cache.version_key(self._live_key, self.db_path, VERSIONED_TABLES)
+
+    def create(self) -> Path:
+        """Copy the live database into a new snapshot and prune old ones"""
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_dir / f"{self.PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.db"
+        partial = path.with_name(f".{path.name}.partial")
+
+        source = _connect(self.db_path, 'ro')
+        target = sqlite3.connect(partial)
+        try:
+            source.backup(target)
+            target.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            target.close()
+            source.close()
+        os.replace(partial, path)
+        logger.info(f"Created database snapshot {path.name}")
+
+        self.prune(keep_path=path)
+        return path
+
+    def prune(self, keep_path: Optional[Path] = None) -> List[Path]:
+        """Delete all but the newest ``keep`` snapshots; returns the deleted paths"""
+        current = self._reader.db_path if self._reader is not None else None
+        removed = []
+        for path in self.list()[:-self.keep]:
+            if path in (keep_path, current):
+                continue
+            # Workers that still have it open keep reading the unlinked file (POSIX)
+            path.unlink(missing_ok=True)
+            dataset_cache.forget(str(path.resolve()))
+            removed.append(path)
+        return removed
+
+    def reader(self) -> DatabaseManager:
+        """Immutable DatabaseManager on a snapshot that matches the live data"""
+        with self._lock:
+            versions = self._live_versions()
+            if self._reader is None or self._reader_versions != versions:
+                path = self.create()
+                self._reader = DatabaseManager(path, mode='immutable')
+                # Versions read before the copy: a write landing during the
+                # backup moves the live key again and forces another copy
+                self._reader_versions = versions
+            return self._reader
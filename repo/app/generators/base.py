@@ -2,7 +2,7 @@
 Base document generator with FluxGen branding and text wrapping utilities
 """
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ListStyle, ParagraphStyle
 from reportlab.lib.colors import HexColor
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
@@ -11,44 +11,859 @@ from reportlab.platypus import (
 from reportlab.lib.units import inch, mm
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
+from reportlab.pdfbase import pdfmetrics, pdfdoc
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace, TTEncoding
+from reportlab import rl_config
+from reportlab.lib.utils import ImageReader, _digester
+from reportlab.pdfgen.canvas import Canvas
+from PIL import Image as PILImage
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from fnmatch import fnmatch
+import copy
+import functools
+import hashlib
+import io
+import math
+import operator
+import os
+import pickle
+import time
+from typing import Callable, List, Dict, Any, Optional, Tuple, Mapping
 import logging
+import threading
+import weakref
+import reportlab
+
+from database import DatabaseManager
+from manifest import manifest_for
 
 logger = logging.getLogger(__name__)
 
-# Register Montserrat fonts
+# Montserrat fonts, registered on first use (see shared_styles)
 _fonts_dir = Path(__file__).parent.parent / 'static' / 'fonts'
 _fonts_registered = False
+_fonts_lock = threading.Lock()
+
+_FONTS = (
+    ('Montserrat-Bold', 'Montserrat-Bold.ttf'),
+    ('Montserrat', 'Montserrat-Regular.ttf'),
+    ('Montserrat-SemiBold', 'Montserrat-SemiBold.ttf'),
+)
+
+# Parsed font faces are pickled here so later processes skip TTF parsing
+_font_cache_dir = Path(os.environ.get(
+    'FLUXGEN_FONT_CACHE_DIR', Path(__file__).parent.parent / '.cache' / 'fonts'
+))
+
+
+def _pdf_scale(units_per_em: int):
+    """Rebuild TTFontFile._pdfScale (a lambda, so it is not pickled)"""
+    if units_per_em == 1000:
+        return lambda x: x
+    return functools.partial(operator.mul, 1000 / units_per_em)
+
+
+def _font_cache_path(font_path: Path) -> Path:
+    """Cache file for ``font_path``, keyed by its size, mtime and the ReportLab version"""
+    stat = font_path.stat()
+    key = f"{font_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{reportlab.Version}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return _font_cache_dir / f"{font_path.stem}-{digest}.pickle"
+
+
+def _load_ttfont(name: str, font_path: Path) -> TTFont:
+    """TTFont for ``font_path``, from the on-disk face cache when it is current"""
+    cache_path = _font_cache_path(font_path)
+    try:
+        with open(cache_path, 'rb') as f:
+            face_state = pickle.load(f)
+    except FileNotFoundError:
+        face_state = None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable font cache {cache_path.name}: {e}")
+        face_state = None
+
+    if face_state is None:
+        font = TTFont(name, str(font_path))
+        face_state = dict(vars(font.face))
+        del face_state['_pdfScale']
+        try:
+            _font_cache_dir.mkdir(parents=True, exist_ok=True)
+            partial_path = cache_path.with_suffix('.partial')
+            with open(partial_path, 'wb') as f:
+                pickle.dump(face_state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write font cache for {font_path.name}: {e}")
+        return font
+
+    face = TTFontFace.__new__(TTFontFace)
+    face.__dict__.update(face_state)
+    face._pdfScale = _pdf_scale(face.unitsPerEm)
+    # Same attributes TTFont.__init__ sets, minus the parse
+    font = TTFont.__new__(TTFont)
+    font.fontName = name
+    font.face = face
+    font.encoding = TTEncoding()
+    font.state = weakref.WeakKeyDictionary()
+    font._asciiReadable = rl_config.ttfAsciiReadable
+    font.shapable = not any(fnmatch(name, pattern) for pattern in rl_config.unShapedFontGlob)
+    return font
+
 
 def _register_fonts():
-    """Register custom fonts with ReportLab (called once)"""
+    """Register custom fonts with ReportLab (once per process, on first document build)"""
     global _fonts_registered
     if _fonts_registered:
         return
 
+    with _fonts_lock:
+        if _fonts_registered:
+            return
+        try:
+            for name, filename in _FONTS:
+                font_path = _fonts_dir / filename
+                if font_path.exists():
+                    pdfmetrics.registerFont(_load_ttfont(name, font_path))
+
+            _fonts_registered = True
+            logger.info("Montserrat fonts registered successfully")
+        except Exception as e:
+            logger.warning(f"Could not register Montserrat fonts: {e}. Falling back to Helvetica.")
+
+
+@dataclass(frozen=True)
+class PdfProfile:
+    """How generate_document() writes a PDF (see PDF_PROFILES)"""
+    name: str
+    compress: bool = True                # Flate-compress page streams
+    ascii85: bool = True                 # ASCII85-encode streams (7-bit clean, 25% larger)
+    image_dpi: Optional[int] = None      # resample images above this resolution at their placed size
+
+
+# 'standard' is how documents have always been written; 'optimized' is for
+# PDFs that are emailed. ReportLab already embeds only the glyphs used from
+# each font, and identical images once per document (XObjects are named by
+# content digest), in both profiles.
+PDF_PROFILES: Dict[str, PdfProfile] = {
+    'standard': PdfProfile('standard'),
+    'optimized': PdfProfile('optimized', ascii85=False, image_dpi=150),
+}
+
+
+def pdf_profile(name: str) -> PdfProfile:
+    """The PdfProfile called ``name``; ValueError for unknown names"""
     try:
-        montserrat_bold = _fonts_dir / 'Montserrat-Bold.ttf'
-        montserrat_regular = _fonts_dir / 'Montserrat-Regular.ttf'
-        montserrat_semibold = _fonts_dir / 'Montserrat-SemiBold.ttf'
-
-        if montserrat_bold.exists():
-            pdfmetrics.registerFont(TTFont('Montserrat-Bold', str(montserrat_bold)))
-        if montserrat_regular.exists():
-            pdfmetrics.registerFont(TTFont('Montserrat', str(montserrat_regular)))
-        if montserrat_semibold.exists():
-            pdfmetrics.registerFont(TTFont('Montserrat-SemiBold', str(montserrat_semibold)))
-
-        _fonts_registered = True
-        logger.info("Montserrat fonts registered successfully")
-    except Exception as e:
-        logger.warning(f"Could not register Montserrat fonts: {e}. Falling back to Helvetica.")
+        return PDF_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF profile '{name}' (choose from {', '.join(PDF_PROFILES)})") from None
+
+
+class _RLConfigOverrides:
+    """
+    rl_config values applied while documents are built.
+
+    rl_config is process-global and read as the PDF is written, so builds
+    that need different values take turns; builds that agree run together.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active = 0
+        self._values: tuple = ()
+        self._saved: Dict[str, Any] = {}
+
+    @contextmanager
+    def apply(self, **values):
+        values = tuple(sorted(values.items()))
+        with self._cond:
+            while self._active and self._values != values:
+                self._cond.wait()
+            if not self._active:
+                self._saved = {name: getattr(rl_config, name) for name, _ in values}
+                for name, value in values:
+                    setattr(rl_config, name, value)
+                self._values = values
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                if not self._active:
+                    for name, value in self._saved.items():
+                        setattr(rl_config, name, value)
+                    self._cond.notify_all()
+
+
+_rl_overrides = _RLConfigOverrides()
+
+
+def _profile_canvas(profile: PdfProfile):
+    """canvasmaker for doc.build() whose canvases carry ``profile`` for the flowables drawn on them"""
+    def make(*args, **kwargs):
+        canv = Canvas(*args, **kwargs)
+        canv.pdf_profile = profile
+        return canv
+    return make
+
+
+class ImageVariant:
+    """
+    One encoding of an ImageAsset: a pre-decoded ``ImageReader`` and a
+    ready-built PDF image XObject (pixels compressed and encoded once).
+
+    ``name`` is the same content digest ``canvas.drawImage`` derives from the
+    reader, so each document embeds the image once however many times it is
+    drawn.
+    """
+
+    def __init__(self, reader: ImageReader):
+        self.reader = reader
+        self.width, self.height = reader.getSize()
+
+        # Decode now so the shared reader is read-only from here on
+        rawdata = reader.getRGBData()
+        alpha = reader._dataA
+        mask = alpha.getRGBData() if alpha else b'auto'
+        self.name = _digester(rawdata + mask)
+        self._xobject = pdfdoc.PDFImageXObject(self.name, reader, mask='auto')
+        self._xobject.name = self.name
+
+    def register(self, canv):
+        """Add this image's XObject to ``canv``'s document unless it is already there"""
+        doc = canv._doc
+        reg_name = doc.getXObjectName(self.name)
+        if reg_name in doc.idToObject:
+            return
+        # Registration stamps the object with a per-document id, so each PDF
+        # gets copies. Mirrors canvas.drawImage, including the soft mask.
+        xobject = copy.copy(self._xobject)
+        canv._setXObjects(xobject)
+        doc.Reference(xobject, reg_name)
+        doc.addForm(self.name, xobject)
+        smask = getattr(self._xobject, '_smask', None)
+        if smask is not None:
+            del xobject._smask
+            mask_reg_name = doc.getXObjectName(smask.name)
+            if mask_reg_name in doc.idToObject:
+                xobject.smask = pdfdoc.PDFObjectReference(mask_reg_name)
+            else:
+                smask = copy.copy(smask)
+                canv._setXObjects(smask)
+                xobject.smask = doc.Reference(smask, mask_reg_name)
+
+
+class ImageAsset:
+    """
+    A decoded image shared by every document rendered in this process.
+
+    Holds the pixel size and an ImageVariant per encoding documents have
+    asked for: the full image, or one resampled to fit a pixel box, each
+    with or without ASCII85 (whatever rl_config.useA85 is during the build).
+    """
+
+    def __init__(self, path: Path, mtime_ns: int):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.reader = ImageReader(str(path))
+        self.width, self.height = self.reader.getSize()
+        self._variants: Dict[tuple, ImageVariant] = {}
+        self._lock = threading.Lock()
+        self.variant()
+
+    def variant(self, max_width: Optional[int] = None, max_height: Optional[int] = None) -> ImageVariant:
+        """The image encoded for the current build, downsampled to fit max_width x max_height pixels"""
+        width, height = self.width, self.height
+        if max_width and max_height and (width > max_width or height > max_height):
+            scale = min(max_width / width, max_height / height)
+            width, height = max(1, round(width * scale)), max(1, round(height * scale))
+
+        key = (width, height, rl_config.useA85)
+        variant = self._variants.get(key)
+        if variant is None:
+            with self._lock:
+                variant = self._variants.get(key)
+                if variant is None:
+                    if (width, height) == (self.width, self.height):
+                        reader = self.reader
+                    else:
+                        with PILImage.open(self.path) as im:
+                            im = im.convert('RGBA' if 'A' in im.getbands() or 'transparency' in im.info else 'RGB')
+                            reader = ImageReader(im.resize((width, height), PILImage.LANCZOS))
+                    variant = self._variants[key] = ImageVariant(reader)
+        return variant
+
+
+_image_assets: Dict[str, ImageAsset] = {}
+_image_assets_lock = threading.Lock()
+
+
+def image_asset(path: Path) -> ImageAsset:
+    """Cached ImageAsset for ``path``, re-decoded when the file's mtime changes"""
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    asset = _image_assets.get(key)
+    if asset is None or asset.mtime_ns != mtime_ns:
+        with _image_assets_lock:
+            asset = _image_assets.get(key)
+            if asset is None or asset.mtime_ns != mtime_ns:
+                asset = _image_assets[key] = ImageAsset(path, mtime_ns)
+    return asset
+
+
+class CachedImage(Image):
+    """Image flowable drawn from a shared ImageAsset instead of re-reading the file"""
+
+    def __init__(self, asset: ImageAsset, width: float, height: float, **kwargs):
+        super().__init__(str(asset.path), width=width, height=height, **kwargs)
+        self._asset = asset
+        self._img = asset.reader
+
+    def draw(self):
+        profile = getattr(self.canv, 'pdf_profile', None)
+        if profile is not None and profile.image_dpi:
+            # Pixels needed at the placed size (points are 1/72 inch)
+            variant = self._asset.variant(math.ceil(self.drawWidth * profile.image_dpi / 72),
+                                          math.ceil(self.drawHeight * profile.image_dpi / 72))
+        else:
+            variant = self._asset.variant()
+        variant.register(self.canv)
+        self.canv.drawImage(variant.reader, getattr(self, '_offs_x', 0), getattr(self, '_offs_y', 0),
+                            self.drawWidth, self.drawHeight, mask=self._mask)
+
+
+def warm_caches():
+    """Register fonts, build the shared stylesheet and decode the PDF logos ahead of the first document"""
+    shared_styles()
+    for path in sorted((Path(__file__).parent.parent / 'static' / 'images' / 'optimized').glob('*.png')):
+        image_asset(path)
+
+
+class _FrozenStyleType(type):
+    """
+    Metaclass of the read-only style classes.
+
+    ReportLab requires a child style to have its parent's class
+    (``ParagraphStyle('X', parent=shared_style)``), so a frozen class compares
+    equal to the style class it freezes. Everything else sees the real class.
+    """
+
+    def __eq__(cls, other):
+        return cls is other or other is cls.__mro__[1]
+
+    def __hash__(cls):
+        return type.__hash__(cls)
+
+
+class FrozenParagraphStyle(ParagraphStyle, metaclass=_FrozenStyleType):
+    """A ParagraphStyle of the shared stylesheet: read-only once built"""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"Shared style '{self.name}' is read-only; use styles.override('{self.name}', ...)"
+        )
+
+
+class FrozenListStyle(ListStyle, metaclass=_FrozenStyleType):
+    """A ListStyle of the shared stylesheet: read-only once built"""
+
+    __setattr__ = FrozenParagraphStyle.__setattr__
+
+
+_FROZEN_CLASSES = {ParagraphStyle: FrozenParagraphStyle, ListStyle: FrozenListStyle}
+
+
+def _freeze(style):
+    """Make a built ``style`` read-only by switching it to the frozen subclass of its class"""
+    style.__class__ = _FROZEN_CLASSES[type(style)]
+    return style
+
+
+def _build_stylesheet() -> Dict[str, Any]:
+    """Build the ReportLab sample styles plus the FluxGen styles"""
+    sample = getSampleStyleSheet()
+    styles = {name: sample[name] for name in sample.byName}
+
+    # Determine font availability (Montserrat preferred, Helvetica fallback)
+    bold_font = 'Montserrat-Bold' if _fonts_registered else 'Helvetica-Bold'
+    regular_font = 'Montserrat' if _fonts_registered else 'Helvetica'
+    semibold_font = 'Montserrat-SemiBold' if _fonts_registered else 'Helvetica-Bold'
+
+    PRIMARY = BaseDocumentGenerator.PRIMARY
+    COPPER = BaseDocumentGenerator.COPPER
+    SILVER = BaseDocumentGenerator.SILVER
+    WHITE = BaseDocumentGenerator.WHITE
+    BLACK = BaseDocumentGenerator.BLACK
+
+    def add(style):
+        styles[style.name] = style
+
+    # Title style
+    add(ParagraphStyle(
+        'FluxGenTitle',
+        parent=styles['Title'],
+        fontSize=24,
+        textColor=PRIMARY,
+        spaceAfter=20,
+        spaceBefore=10,
+        alignment=TA_CENTER,
+        fontName=bold_font
+    ))
+
+    # Heading 1 style
+    add(ParagraphStyle(
+        'FluxGenHeading1',
+        parent=styles['Heading1'],
+        fontSize=16,
+        textColor=PRIMARY,
+        spaceAfter=12,
+        spaceBefore=16,
+        fontName=bold_font
+    ))
+
+    # Heading 2 style
+    add(ParagraphStyle(
+        'FluxGenHeading2',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=PRIMARY,
+        spaceAfter=10,
+        spaceBefore=14,
+        fontName=semibold_font
+    ))
+
+    # Body text style
+    add(ParagraphStyle(
+        'FluxGenBody',
+        parent=styles['Normal'],
+        fontSize=10,
+        leading=14,
+        textColor=BLACK,
+        spaceAfter=6,
+        spaceBefore=0,
+        alignment=TA_JUSTIFY,
+        fontName=regular_font
+    ))
+
+    # Table cell style for text wrapping
+    add(ParagraphStyle(
+        'FluxGenTableCell',
+        parent=styles['Normal'],
+        fontSize=9,
+        leading=12,
+        textColor=BLACK,
+        spaceAfter=0,
+        spaceBefore=0,
+        alignment=TA_LEFT,
+        fontName=regular_font
+    ))
+
+    # Table header style
+    add(ParagraphStyle(
+        'FluxGenTableHeader',
+        parent=styles['Normal'],
+        fontSize=10,
+        leading=12,
+        textColor=WHITE,
+        spaceAfter=0,
+        spaceBefore=0,
+        alignment=TA_CENTER,
+        fontName=bold_font
+    ))
+
+    # Small text style
+    add(ParagraphStyle(
+        'FluxGenSmall',
+        parent=styles['Normal'],
+        fontSize=8,
+        leading=10,
+        textColor=SILVER,
+        spaceAfter=3,
+        spaceBefore=0,
+        fontName=regular_font
+    ))
+
+    # Company header (add_company_header)
+    add(ParagraphStyle(
+        'HeaderName',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=PRIMARY,
+        fontName=bold_font,
+        alignment=TA_LEFT
+    ))
+    add(ParagraphStyle(
+        'HeaderTagline',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=COPPER,
+        fontName=regular_font,
+        alignment=TA_LEFT
+    ))
+    add(ParagraphStyle(
+        'HeaderLocation',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=BLACK,
+        fontName=regular_font,
+        alignment=TA_LEFT
+    ))
+    add(ParagraphStyle(
+        'HeaderWebsite',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=BLACK,
+        fontName=regular_font,
+        alignment=TA_LEFT
+    ))
+
+    # Footer bar (add_footer_info) - white text for dark background
+    add(ParagraphStyle(
+        'FooterText',
+        parent=styles['Normal'],
+        fontSize=8,
+        leading=10,
+        textColor=SILVER,
+        fontName=regular_font,
+        alignment=TA_LEFT
+    ))
+    add(ParagraphStyle(
+        'FooterTextOnly',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=SILVER,
+        fontName=regular_font,
+    ))
+
+    return styles
+
+
+_shared_styles: Optional[Mapping[str, Any]] = None
+_shared_styles_lock = threading.Lock()
+
 
-# Register fonts on module load
-_register_fonts()
+def shared_styles() -> Mapping[str, Any]:
+    """The FluxGen stylesheet, built once per process and shared read-only by all generators"""
+    global _shared_styles
+    if _shared_styles is None:
+        with _shared_styles_lock:
+            if _shared_styles is None:
+                _register_fonts()
+                styles = _build_stylesheet()
+                for style in styles.values():
+                    _freeze(style)
+                _shared_styles = MappingProxyType(styles)
+    return _shared_styles
+
+
+class DocumentStyles:
+    """
+    A generator's view of the shared stylesheet.
+
+    Lookups fall through to ``shared_styles()``; ``add()`` and ``override()``
+    only change this document, so a tweak in one generator never leaks into
+    the next one.
+    """
+
+    def __init__(self, shared: Mapping[str, Any]):
+        self._shared = shared
+        self._local: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str):
+        style = self._local.get(name)
+        return style if style is not None else self._shared[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._local or name in self._shared
+
+    def get(self, name: str, default=None):
+        return self[name] if name in self else default
+
+    def add(self, style):
+        """Add a document-only style (same contract as StyleSheet1.add)"""
+        if style.name in self:
+            raise KeyError(f"Style '{style.name}' already defined")
+        self._local[style.name] = style
+
+    def override(self, name: str, **changes) -> ParagraphStyle:
+        """Replace ``name`` for this document with a copy carrying ``changes``"""
+        style = ParagraphStyle(name, parent=self[name], **changes)
+        self._local[name] = style
+        return style
+
+
+@functools.lru_cache(maxsize=8192)
+def _cell_frags(style_name: str, text: str):
+    """Parsed Paragraph fragments for ``text`` in a shared style, or None if not cacheable"""
+    style = shared_styles()[style_name]
+    text = cleanBlockQuotedText(text)
+    parser = ParaParser()
+    parsed_style, frags, bullet_frags = parser.parse(text, style)
+    if frags is None or bullet_frags or parsed_style is not style:
+        return None  # let Paragraph raise or handle <para>/<bullet> markup itself
+    textTransformFrags(frags, style)
+    return text, tuple(frags)
+
+
+class TableCell(Paragraph):
+    """
+    Paragraph for table cells that reuses parsed fragments and wrap results.
+
+    Cells in a shared style take their fragments from a process-wide cache
+    keyed by (style name, text), so repeated values ("N/A", years, units) are
+    parsed once. Tables wrap every cell when measuring rows and again when
+    drawing, so the last wrap is remembered per width.
+    """
+
+    def __init__(self, text: str, style):
+        cached = None
+        if shared_styles().get(style.name) is style:
+            cached = _cell_frags(style.name, text)
+        if cached is None:
+            super().__init__(text, style)
+        else:
+            text, frags = cached
+            super().__init__(text, style, frags=list(frags))
+        self._wrapped_for = None
+
+    def wrap(self, availWidth, availHeight):
+        if self._wrapped_for != availWidth:
+            super().wrap(availWidth, availHeight)
+            self._wrapped_for = availWidth
+        return self.width, self.height
+
+
+class StripedTable(Table):
+    """
+    Table whose ROWBACKGROUNDS stripes carry on across page splits.
+
+    ReportLab restarts a ROWBACKGROUNDS colour cycle at the top of the part
+    of a split table that continues on the next page, so a split after an odd
+    number of rows would swap the stripes there. The continuation's cycles
+    are rotated to where the unsplit table had got to.
+    """
+
+    def _splitRows(self, availHeight, doInRowSplit=0):
+        parts = super()._splitRows(availHeight, doInRowSplit)
+        if len(parts) != 2 or doInRowSplit:
+            return parts
+        first, rest = parts
+        split_at = first._nrows
+        repeated = rest._nrows - (self._nrows - split_at)
+        # The split copies each command's colour list, so it identifies the original
+        starts = {
+            id(arg): sr + self._nrows if sr < 0 else sr
+            for cmd, (sc, sr), end, arg in self._bkgrndcmds
+            if cmd == 'ROWBACKGROUNDS' and isinstance(sr, int)
+        }
+        for i, (cmd, (sc, sr), end, arg) in enumerate(rest._bkgrndcmds):
+            if cmd != 'ROWBACKGROUNDS' or not isinstance(sr, int) or id(arg) not in starts:
+                continue
+            row = sr + rest._nrows if sr < 0 else sr
+            row = row if row < repeated else row - repeated + split_at
+            shift = (row - starts[id(arg)]) % len(arg)
+            if shift:
+                rest._bkgrndcmds[i] = (cmd, (sc, sr), end, list(arg[shift:]) + list(arg[:shift]))
+        return parts
+
+
+# Flowables built by @section methods, per thread: flowables are not safe to
+# lay out from two threads at once, and each render worker has one thread
+_section_local = threading.local()
+
+
+def _section_entries() -> Dict[tuple, tuple]:
+    entries = getattr(_section_local, 'entries', None)
+    if entries is None:
+        entries = _section_local.entries = {}
+        _section_local.hits = _section_local.misses = 0
+    return entries
+
+
+def section(*tables: str, cache: bool = True):
+    """
+    Declare the tables an ``_add_*`` method reads and memoize its flowables.
+
+    The flowables the method appends to ``self.story`` are kept per generator
+    class, method and arguments, with the versions of ``tables`` they were
+    built from (``financial_summary`` stands for the tables it totals). Later
+    builds reuse copies of them until one of those tables is written, so a
+    section that reads no tables is built once per worker. ``cache=False``
+    is for sections that depend on generator state rather than arguments;
+    they are still timed in render reports.
+    """
+    dependencies = tuple(sorted({
+        table
+        for name in tables
+        for table in (DatabaseManager.FINANCIAL_SUMMARY_TABLES if name == 'financial_summary' else (name,))
+    }))
+
+    def decorate(method):
+        section_name = method.__name__.removeprefix('_').removeprefix('add_').removesuffix('_section')
+
+        def build(self, args, kwargs) -> bool:
+            """Append the section's flowables; True if they came from the cache"""
+            versions = self.data.versions
+            if not cache or not versions:
+                # No dataset_versions table, so no way to tell when data changed
+                method(self, *args, **kwargs)
+                return False
+
+            entries = _section_entries()
+            key = (type(self), method.__name__, args, tuple(sorted(kwargs.items())))
+            version_key = tuple(versions.get(table, 0) for table in dependencies)
+            entry = entries.get(key)
+            if entry is not None and entry[0] == version_key:
+                _section_local.hits += 1
+                # Layout marks top-level flowables (e.g. _postponed), so each
+                # build gets its own shallow copies
+                self.story.extend(copy.copy(flowable) for flowable in entry[1])
+                return True
+
+            _section_local.misses += 1
+            start = len(self.story)
+            method(self, *args, **kwargs)
+            entries[key] = (version_key, tuple(copy.copy(flowable) for flowable in self.story[start:]))
+            return False
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            report = self._report
+            if report is None and self._progress is None:
+                build(self, args, kwargs)
+                return
+            self._emit('section_started', section=section_name)
+            start = len(self.story)
+            started = time.perf_counter()
+            cached = build(self, args, kwargs)
+            seconds = time.perf_counter() - started
+            if report is not None:
+                report.add_section(section_name, self.story[start:], seconds, cached)
+            self._emit('section_finished', section=section_name, build_ms=round(seconds * 1000, 2), cached=cached)
+
+        wrapper.tables = dependencies
+        return wrapper
+    return decorate
+
+
+def section_cache_stats() -> Dict[str, int]:
+    """Section hits, misses and entries for the calling thread"""
+    entries = _section_entries()
+    return {'hits': _section_local.hits, 'misses': _section_local.misses, 'entries': len(entries)}
+
+
+class RenderReport:
+    """
+    Where one document's render time, pages and bytes went, per @section.
+
+    Sections record how long building their flowables took and which
+    top-level flowables they appended; flowables appended outside any
+    section belong to 'document'. During ``doc.build`` each flowable's
+    layout time is charged to the section that owns it (split parts and the
+    page breaks they cause included), while the afterFlowable and onPage
+    hooks record the pages its flowables finished on and the content-stream
+    bytes (before compression) and image bytes they drew.
+    """
+
+    DOCUMENT = 'document'
+
+    def __init__(self):
+        self.sections: Dict[str, Dict[str, Any]] = {}  # in story order
+        self._owner: Dict[int, str] = {}
+        self._current = self.DOCUMENT
+        self._doc = None
+        self._code_pos = 0
+        self._objects_seen = 0
+        self._layout_end = None
+
+    def _section(self, name: str) -> Dict[str, Any]:
+        entry = self.sections.get(name)
+        if entry is None:
+            entry = self.sections[name] = {
+                'name': name, 'calls': 0, 'cached': 0, 'build_ms': 0.0, 'layout_ms': 0.0,
+                'flowables': 0, 'pages': set(), 'content_bytes': 0, 'image_bytes': 0,
+            }
+        return entry
+
+    def add_section(self, name: str, flowables: list, seconds: float, cached: bool):
+        """Record a section call that appended ``flowables`` (nested sections keep their own)"""
+        entry = self._section(name)
+        entry['calls'] += 1
+        entry['cached'] += cached
+        entry['build_ms'] += seconds * 1000
+        for flowable in flowables:
+            if self._owner.setdefault(id(flowable), name) == name:
+                entry['flowables'] += 1
+
+    def attach(self, doc, story: list) -> Dict[str, Any]:
+        """Hook into ``doc`` for a build of ``story``; returns build() keyword arguments"""
+        for flowable in story:
+            if id(flowable) not in self._owner:
+                self._owner[id(flowable)] = self.DOCUMENT
+                self._section(self.DOCUMENT)['flowables'] += 1
+        self._doc = doc
+        handle_flowable = doc.handle_flowable
+
+        def timed_handle_flowable(flowables):
+            # Split parts go back on the front of the list, so they keep the
+            # owner of the flowable they came from
+            self._current = self._owner.get(id(flowables[0]), self._current)
+            section = self._section(self._current)
+            started = time.perf_counter()
+            handle_flowable(flowables)
+            self._layout_end = time.perf_counter()
+            section['layout_ms'] += (self._layout_end - started) * 1000
+
+        doc.handle_flowable = timed_handle_flowable
+        doc.afterFlowable = self._after_flowable
+        return {'onFirstPage': self._on_page, 'onLaterPages': self._on_page}
+
+    def _on_page(self, canv, doc):
+        self._code_pos = len(canv._code)
+
+    def _after_flowable(self, flowable):
+        canv = self._doc.canv
+        section = self._section(self._current)
+        section['pages'].add(self._doc.page)
+        code = canv._code
+        section['content_bytes'] += sum(len(op) + 1 for op in code[self._code_pos:])
+        self._code_pos = len(code)
+        objects = canv._doc.idToObject
+        if len(objects) > self._objects_seen:
+            for obj in list(objects.values())[self._objects_seen:]:
+                if isinstance(obj, pdfdoc.PDFImageXObject):
+                    section['image_bytes'] += len(obj.streamContent)
+            self._objects_seen = len(objects)
+
+    def as_dict(self, started: float, finished: float, size: int) -> Dict[str, Any]:
+        """The report for a build that ran from ``started`` to ``finished`` and wrote ``size`` bytes"""
+        layout_end = self._layout_end or finished
+        sections = []
+        for entry in self.sections.values():
+            pages = sorted(entry['pages'])
+            sections.append(dict(
+                entry,
+                build_ms=round(entry['build_ms'], 2),
+                layout_ms=round(entry['layout_ms'], 2),
+                pages=len(pages),
+                first_page=pages[0] if pages else None,
+                last_page=pages[-1] if pages else None,
+            ))
+        return {
+            'pages': self._doc.page if self._doc else 0,
+            'bytes': size,
+            'build_ms': round(sum(entry['build_ms'] for entry in self.sections.values()), 2),
+            'layout_ms': round((layout_end - started) * 1000, 2),
+            'write_ms': round((finished - layout_end) * 1000, 2),
+            'sections': sections,
+        }
 
 
 class BaseDocumentGenerator:
@@ -60,6 +875,7 @@ class BaseDocumentGenerator:
     SILVER = HexColor('#C0C0C0')       # Silver (text color)
     LIGHT_GRAY = HexColor('#F3F4F6')   # Light gray (backgrounds)
     WHITE = HexColor('#FFFFFF')
+    ROW_SHADE = HexColor('#F9FAFB')    # Alternate table rows
     BLACK = HexColor('#000000')
 
     # Legacy aliases for backward compatibility
@@ -67,21 +883,37 @@ class BaseDocumentGenerator:
     ORANGE = COPPER
     GRAY = SILVER
     
-    def __init__(self, database_manager, output_dir: Path):
-        """Initialize the document generator"""
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        """Initialize the document generator
+
+        The whole dataset is read once here, in a single read transaction, and
+        every section builds from ``self.data`` rather than querying the database.
+        ``profile`` names the PDF_PROFILES entry the PDF is written with.
+        """
         self.db = database_manager
         self.output_dir = output_dir
         self.output_dir.mkdir(exist_ok=True)
+        self.profile = pdf_profile(profile)
         
-        # Set up styles
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        # Shared process-wide stylesheet; per-document changes are copy-on-write
+        self.styles = DocumentStyles(shared_styles())
         
         # Document elements
         self.story = []
+
+        # Set by render_bytes(): generate_document() writes here instead of output_dir
+        self._buffer: Optional[io.BytesIO] = None
+
+        # Set by collect_reports(): sections and layout are timed into it
+        self._report: Optional[RenderReport] = None
+        self.reports: List[Dict[str, Any]] = []
+
+        # Set by on_progress(): called with each progress event
+        self._progress: Optional[Callable[..., None]] = None
         
-        # Company data (loaded once)
-        self.company_info = self.db.get_company_info()
+        # Generation session: one consistent snapshot shared by all sections
+        self.data = self.db.read_snapshot()
+        self.company_info = self.data.company_info
         
         # Logo paths (optimized versions for PDF use)
         _images_dir = Path(__file__).parent.parent / 'static' / 'images'
@@ -97,108 +929,24 @@ class BaseDocumentGenerator:
         self.logo_square_path = _images_dir / 'fluxgen-square-logo.png'
         self.logo_monogram_path = _images_dir / 'fluxgen-logo-monogram.png'
         
-    def _setup_custom_styles(self):
-        """Set up custom paragraph styles for FluxGen documents"""
-
-        # Determine font availability (Montserrat preferred, Helvetica fallback)
-        bold_font = 'Montserrat-Bold' if _fonts_registered else 'Helvetica-Bold'
-        regular_font = 'Montserrat' if _fonts_registered else 'Helvetica'
-        semibold_font = 'Montserrat-SemiBold' if _fonts_registered else 'Helvetica-Bold'
-
-        # Title style
-        self.styles.add(ParagraphStyle(
-            'FluxGenTitle',
-            parent=self.styles['Title'],
-            fontSize=24,
-            textColor=self.PRIMARY,
-            spaceAfter=20,
-            spaceBefore=10,
-            alignment=TA_CENTER,
-            fontName=bold_font
-        ))
-
-        # Heading 1 style
-        self.styles.add(ParagraphStyle(
-            'FluxGenHeading1',
-            parent=self.styles['Heading1'],
-            fontSize=16,
-            textColor=self.PRIMARY,
-            spaceAfter=12,
-            spaceBefore=16,
-            fontName=bold_font
-        ))
-
-        # Heading 2 style
-        self.styles.add(ParagraphStyle(
-            'FluxGenHeading2',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=self.PRIMARY,
-            spaceAfter=10,
-            spaceBefore=14,
-            fontName=semibold_font
-        ))
-
-        # Body text style
-        self.styles.add(ParagraphStyle(
-            'FluxGenBody',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=14,
-            textColor=self.BLACK,
-            spaceAfter=6,
-            spaceBefore=0,
-            alignment=TA_JUSTIFY,
-            fontName=regular_font
-        ))
-
-        # Table cell style for text wrapping
-        self.styles.add(ParagraphStyle(
-            'FluxGenTableCell',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            leading=12,
-            textColor=self.BLACK,
-            spaceAfter=0,
-            spaceBefore=0,
-            alignment=TA_LEFT,
-            fontName=regular_font
-        ))
-
-        # Table header style
-        self.styles.add(ParagraphStyle(
-            'FluxGenTableHeader',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=12,
-            textColor=self.WHITE,
-            spaceAfter=0,
-            spaceBefore=0,
-            alignment=TA_CENTER,
-            fontName=bold_font
-        ))
-        
-        # Small text style
-        self.styles.add(ParagraphStyle(
-            'FluxGenSmall',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            leading=10,
-            textColor=self.SILVER,
-            spaceAfter=3,
-            spaceBefore=0,
-            fontName=regular_font
-        ))
-    
     def create_wrapped_table_cell(self, text: str, style_name: str = 'FluxGenTableCell') -> Paragraph:
         """Create a Paragraph object for table cells to ensure text wrapping"""
         if text is None:
             text = ''
-        return Paragraph(str(text), self.styles[style_name])
-    
+        return TableCell(str(text), self.styles[style_name])
+
+    @staticmethod
+    def _is_plain_cell(text, width: float, style) -> bool:
+        """Whether text draws the same as a string cell: no markup, one line within width"""
+        text = '' if text is None else str(text)
+        if '<' in text or '&' in text or text != ' '.join(text.split()):
+            return False
+        # Less the table's 8pt left and right padding
+        return pdfmetrics.stringWidth(text, style.fontName, style.fontSize) <= width - 16
+
     def create_header_cell(self, text: str) -> Paragraph:
         """Create a header cell with proper styling"""
-        return Paragraph(str(text), self.styles['FluxGenTableHeader'])
+        return TableCell(str(text), self.styles['FluxGenTableHeader'])
     
     def format_currency(self, amount: Optional[float], currency: str = 'CAD') -> str:
         """Format currency values"""
@@ -262,21 +1010,26 @@ class BaseDocumentGenerator:
         if not data:
             return None
         
-        # Convert all cells to Paragraph objects for text wrapping
+        # Convert cells to Paragraph objects for text wrapping. Data cells
+        # that fit on one line without markup stay strings, drawn in the cell
+        # font set below with no parsing or wrapping
+        cell_style = self.styles['FluxGenTableCell']
         wrapped_data = []
         for i, row in enumerate(data):
             wrapped_row = []
-            for cell in row:
+            for cell, width in zip(row, col_widths):
                 if i == 0 and has_header:
                     # Header row
                     wrapped_row.append(self.create_header_cell(cell))
+                elif self._is_plain_cell(cell, width * inch, cell_style):
+                    wrapped_row.append('' if cell is None else str(cell))
                 else:
                     # Data row
                     wrapped_row.append(self.create_wrapped_table_cell(cell))
             wrapped_data.append(wrapped_row)
         
         # Create table with page splitting enabled
-        table = Table(
+        table = StripedTable(
             wrapped_data, 
             colWidths=[w*inch for w in col_widths],
             repeatRows=1 if has_header else 0,
@@ -290,8 +1043,10 @@ class BaseDocumentGenerator:
             ('TEXTCOLOR', (0, 0), (-1, 0 if has_header else -1), self.WHITE if has_header else self.BLACK),
             
             # Data rows styling
-            ('BACKGROUND', (0, 1 if has_header else 0), (-1, -1), self.WHITE),
+            ('ROWBACKGROUNDS', (0, 1 if has_header else 0), (-1, -1), [self.WHITE, self.ROW_SHADE]),
             ('TEXTCOLOR', (0, 1 if has_header else 0), (-1, -1), self.BLACK),
+            ('FONT', (0, 1 if has_header else 0), (-1, -1),
+             cell_style.fontName, cell_style.fontSize, cell_style.leading),
             
             # Grid and borders
             ('GRID', (0, 0), (-1, -1), 0.5, self.GRAY),
@@ -306,12 +1061,6 @@ class BaseDocumentGenerator:
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
         ]
         
-        # Add alternating row colors for better readability
-        if len(wrapped_data) > 1:
-            start_row = 1 if has_header else 0
-            for i in range(start_row, len(wrapped_data), 2):
-                table_style.append(('BACKGROUND', (0, i), (-1, i), HexColor('#F9FAFB')))
-        
         # Add custom style commands
         if style_commands:
             table_style.extend(style_commands)
@@ -374,11 +1123,9 @@ class BaseDocumentGenerator:
             return None
 
         try:
-            # Get actual image dimensions to calculate aspect ratio
-            from PIL import Image as PILImage
-            with PILImage.open(logo_path) as img:
-                img_width, img_height = img.size
-            aspect_ratio = img_width / img_height
+            # Decoded once per process; dimensions give the aspect ratio
+            asset = image_asset(logo_path)
+            aspect_ratio = asset.width / asset.height
 
             # Calculate dimensions that fit BOTH constraints while preserving aspect ratio
             # Option 1: Use target_width and calculate height
@@ -397,14 +1144,9 @@ class BaseDocumentGenerator:
                 final_height = max_height
 
             # Create image with calculated dimensions (preserving aspect ratio)
-            logo = Image(str(logo_path), width=final_width*inch, height=final_height*inch)
+            logo = CachedImage(asset, width=final_width*inch, height=final_height*inch)
             return logo
 
-        except ImportError:
-            # PIL not available, fall back to ReportLab's auto-scaling (width-only)
-            logger.warning("PIL not available for aspect ratio calculation, using width-only scaling")
-            logo = Image(str(logo_path), width=target_width*inch)
-            return logo
         except Exception as e:
             logger.error(f"Error loading logo: {str(e)}")
             return None
@@ -422,6 +1164,7 @@ class BaseDocumentGenerator:
             self.story.append(logo)
             self.story.append(Spacer(1, 0.5*inch))
     
+    @section('company_info')
     def add_company_header(self, include_logo: bool = True, logo_width: float = 2.5):
         """Add standard company header to document with optional logo
 
@@ -442,50 +1185,22 @@ class BaseDocumentGenerator:
                     # Create company info as Paragraphs for better formatting
                     company_name = Paragraph(
                         self.company_info.get('legal_name', 'FluxGen Industries Ltd.'),
-                        ParagraphStyle(
-                            'HeaderName',
-                            parent=self.styles['Normal'],
-                            fontSize=14,
-                            textColor=self.PRIMARY,
-                            fontName=bold_font,
-                            alignment=TA_LEFT
-                        )
+                        self.styles['HeaderName']
                     )
 
                     tagline = Paragraph(
                         self.company_info.get('tagline', 'Forging Tomorrow\'s Welds'),
-                        ParagraphStyle(
-                            'HeaderTagline',
-                            parent=self.styles['Normal'],
-                            fontSize=11,
-                            textColor=self.COPPER,
-                            fontName=regular_font,
-                            alignment=TA_LEFT
-                        )
+                        self.styles['HeaderTagline']
                     )
 
                     location = Paragraph(
                         f"{self.company_info.get('location', 'Airdrie')}, {self.company_info.get('province', 'Alberta')}, {self.company_info.get('country', 'Canada')}",
-                        ParagraphStyle(
-                            'HeaderLocation',
-                            parent=self.styles['Normal'],
-                            fontSize=9,
-                            textColor=self.BLACK,
-                            fontName=regular_font,
-                            alignment=TA_LEFT
-                        )
+                        self.styles['HeaderLocation']
                     )
 
                     website = Paragraph(
                         self.company_info.get('website', 'www.fluxgen.ca'),
-                        ParagraphStyle(
-                            'HeaderWebsite',
-                            parent=self.styles['Normal'],
-                            fontSize=9,
-                            textColor=self.BLACK,
-                            fontName=regular_font,
-                            alignment=TA_LEFT
-                        )
+                        self.styles['HeaderWebsite']
                     )
 
                     # LINE 470-491: Header layout - Logo LEFT, Text RIGHT
@@ -563,23 +1278,10 @@ class BaseDocumentGenerator:
 
         footer_text = f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')} | FluxGen Industries Ltd."
 
-        # Determine font for footer text
-        regular_font = 'Montserrat' if _fonts_registered else 'Helvetica'
-
         if include_logo:
             logo = self._create_logo_image('footer', width=0.45, max_height=0.45)
             if logo:
-                # Footer text style - white text for dark background
-                footer_style = ParagraphStyle(
-                    'FooterText',
-                    parent=self.styles['Normal'],
-                    fontSize=8,
-                    leading=10,
-                    textColor=self.SILVER,
-                    fontName=regular_font,
-                    alignment=TA_LEFT
-                )
-                footer_para = Paragraph(footer_text, footer_style)
+                footer_para = Paragraph(footer_text, self.styles['FooterText'])
 
                 # LINE 560-575: Footer bar layout - Logo (left) | Text (right)
                 # Adjust column widths here (logo_col + text_col = 6.5 inches total)
@@ -599,14 +1301,7 @@ class BaseDocumentGenerator:
                 return
 
         # Fallback: footer without logo (still with dark background)
-        footer_style = ParagraphStyle(
-            'FooterTextOnly',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            textColor=self.SILVER,
-            fontName=regular_font,
-        )
-        fallback_table = Table([[Paragraph(footer_text, footer_style)]], colWidths=[6.5*inch])
+        fallback_table = Table([[Paragraph(footer_text, self.styles['FooterTextOnly'])]], colWidths=[6.5*inch])
         fallback_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, -1), self.PRIMARY),
             ('LEFTPADDING', (0, 0), (-1, -1), 10),
@@ -626,32 +1321,134 @@ class BaseDocumentGenerator:
         Returns:
             Path to generated PDF file
         """
-        # Ensure filename has .pdf extension
-        if not filename.endswith('.pdf'):
-            filename += '.pdf'
+        # Ensure filename has .pdf extension (and names a non-standard profile)
+        if filename.endswith('.pdf'):
+            filename = filename[:-4]
+        if self.profile.name != 'standard':
+            filename += f"_{self.profile.name}"
+        filename += '.pdf'
         
         output_path = self.output_dir / filename
+        # Written beside the output and moved over it when complete, so an
+        # existing file (possibly hard-linked into the render cache) is
+        # replaced rather than rewritten in place
+        partial_path = output_path.with_name(f".{filename}.{os.getpid()}.{threading.get_ident()}.partial")
         
         # Create document
         doc = SimpleDocTemplate(
-            str(output_path),
+            self._buffer if self._buffer is not None else str(partial_path),
             pagesize=letter,
             rightMargin=1*inch,
             leftMargin=1*inch,
             topMargin=1*inch,
             bottomMargin=1*inch,
-            title=title or filename
+            title=title or filename,
+            pageCompression=int(self.profile.compress)
         )
         
+        report = self._report
+        hooks = report.attach(doc, self.story) if report is not None else {}
+        if self._progress is not None:
+            doc.setProgressCallBack(self._layout_progress(filename))
+        
         try:
             # Build the document
-            doc.build(self.story)
-            logger.info(f"Document generated successfully: {output_path}")
+            started = time.perf_counter()
+            with _rl_overrides.apply(useA85=int(self.profile.ascii85)):
+                doc.build(self.story, canvasmaker=_profile_canvas(self.profile), **hooks)
+            if self._buffer is None:
+                os.replace(partial_path, output_path)
+            if report is not None or self._progress is not None:
+                finished = time.perf_counter()
+                size = self._buffer.getbuffer().nbytes if self._buffer is not None else output_path.stat().st_size
+                self._emit('completed', filename=filename, pages=doc.page, bytes=size,
+                           ms=round((finished - started) * 1000, 1))
+            if report is not None:
+                self.reports.append(dict(report.as_dict(started, finished, size),
+                                         document=filename, profile=self.profile.name))
+            if self._buffer is not None:
+                logger.info(f"Document rendered in memory: {filename} ({self.profile.name} profile)")
+            else:
+                self._record_output(output_path, doc.page)
+                logger.info(f"Document generated successfully: {output_path} ({self.profile.name} profile)")
             return output_path
             
         except Exception as e:
             logger.error(f"Error generating document {filename}: {str(e)}")
+            if self._buffer is None:
+                partial_path.unlink(missing_ok=True)
             raise
+
+        finally:
+            if report is not None:
+                self._report = RenderReport()  # for the next document this generator writes
+
+    def _record_output(self, output_path: Path, pages: int):
+        """Index a written PDF in the output manifest; a failure there never fails the document"""
+        try:
+            manifest_for(self.output_dir).record(output_path, pages=pages, data_version=self.data.version_id)
+        except Exception as e:
+            logger.warning(f"Could not record {output_path.name} in the output manifest: {str(e)}")
+
+    def collect_reports(self):
+        """Record a RenderReport for every PDF this generator writes from now on, in ``self.reports``"""
+        self._report = RenderReport()
+
+    def on_progress(self, callback: Callable[..., None]):
+        """
+        Call ``callback(event, **data)`` as documents are built and laid out.
+
+        Events: ``section_started`` and ``section_finished`` (``section``,
+        ``build_ms``, ``cached``) around each @section; ``layout_started``
+        (``filename``, ``flowables``), then ``page`` as each page begins
+        (``page``, and ``progress``, the share of the story laid out so far);
+        ``completed`` (``filename``, ``pages``, ``bytes``, ``ms``) once a PDF
+        is written. Errors raised by the callback are logged and ignored.
+        """
+        self._progress = callback
+
+    def _emit(self, event: str, **data):
+        if self._progress is None:
+            return
+        try:
+            self._progress(event, **data)
+        except Exception as e:
+            logger.warning(f"Progress callback failed on {event}: {str(e)}")
+
+    def _layout_progress(self, filename: str) -> Callable[[str, int], None]:
+        """ReportLab progress callback for doc.build() that emits ``layout_started`` and ``page`` events"""
+        state = {'total': 0, 'handled': 0}
+
+        def callback(kind: str, value: int):
+            if kind == 'SIZE_EST':
+                state['total'] = value
+                self._emit('layout_started', filename=filename, flowables=value)
+            elif kind == 'PROGRESS':
+                state['handled'] = value
+            elif kind == 'PAGE':
+                progress = state['handled'] / state['total'] if state['total'] else 0.0
+                self._emit('page', page=value, progress=round(progress, 3))
+
+        return callback
+
+    def render_bytes(self, generate: Optional[Callable[[], Optional[Path]]] = None) -> Optional[Tuple[str, bytes]]:
+        """
+        Run ``generate`` (default ``self.generate``) with the PDF built in memory
+
+        Nothing is written to ``output_dir``; the path ``generate`` returns
+        only supplies the filename.
+
+        Returns:
+            (filename, PDF bytes), or None if ``generate`` produced no document
+        """
+        self._buffer = io.BytesIO()
+        try:
+            output_path = (generate or self.generate)()
+            if output_path is None:
+                return None
+            return output_path.name, self._buffer.getvalue()
+        finally:
+            self._buffer = None
     
     def build_content(self):
         """
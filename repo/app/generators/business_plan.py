@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class BusinessPlanGenerator(BaseDocumentGenerator):
     """Generates comprehensive Business Plan document (8-12 pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build business plan content"""
@@ -61,6 +61,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    @section()
     def _add_executive_summary(self):
         """Add executive summary section"""
         self.add_heading1("Executive Summary")
@@ -89,6 +90,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(summary_text)
         self.add_spacer()
     
+    @section('company_info')
     def _add_company_description(self):
         """Add company description section"""
         self.add_heading1("Company Description")
@@ -135,6 +137,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(industry_text)
         self.add_spacer()
     
+    @section()
     def _add_market_analysis(self):
         """Add market analysis section"""
         self.add_heading1("Market Analysis")
@@ -201,6 +204,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(target_text)
         self.add_spacer()
     
+    @section('alloys_catalog')
     def _add_products_services(self):
         """Add products and services section"""
         self.add_heading1("Products & Services")
@@ -208,7 +212,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_heading2("Product Portfolio")
         
         # Get alloys catalog data
-        alloys = self.db.get_alloys_catalog()
+        alloys = self.data.alloys_catalog
         
         if alloys:
             products_data = [['Alloy Symbol', 'Application', 'Grade Type', 'Key Features']]
@@ -268,6 +272,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(value_text)
         self.add_spacer()
     
+    @section('production_targets')
     def _add_operations_plan(self):
         """Add operations plan section"""
         self.add_heading1("Operations Plan")
@@ -275,7 +280,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_heading2("Manufacturing Process")
         
         # Get production targets
-        production_targets = self.db.get_production_targets()
+        production_targets = self.data.production_targets
         
         if production_targets:
             process_data = [['Phase', 'Capacity (kg/month)', 'Process Flow', 'Sourcing Strategy']]
@@ -370,12 +375,13 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(supply_text)
         self.add_spacer()
     
+    @section('team_members')
     def _add_management_team(self):
         """Add management team section"""
         self.add_heading1("Management Team")
         
         # Get team member data
-        team_members = self.db.get_team_members()
+        team_members = self.data.team_members
         
         if team_members:
             team_data = [['Name', 'Position', 'Key Responsibilities', 'Contact']]
@@ -435,13 +441,14 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(team_text)
         self.add_spacer()
     
+    @section('investment_capex', 'financial_summary')
     def _add_financial_overview(self):
         """Add financial overview section"""
         self.add_heading1("Financial Overview")
         
         # Get financial data
-        capex_items = self.db.get_investment_capex()
-        financial_summary = self.db.get_financial_summary()
+        capex_items = self.data.investment_capex
+        financial_summary = self.data.financial_summary
         
         self.add_heading2("Capital Investment Requirements")
         
@@ -490,6 +497,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(financial_text)
         self.add_spacer()
     
+    @section()
     def _add_risk_analysis(self):
         """Add risk analysis section"""
         self.add_heading1("Risk Analysis & Mitigation")
@@ -544,6 +552,7 @@ class BusinessPlanGenerator(BaseDocumentGenerator):
         self.add_body_text(risk_text)
         self.add_spacer()
     
+    @section()
     def _add_implementation_timeline(self):
         """Add implementation timeline section"""
         self.add_heading1("Implementation Timeline")
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class ExecutiveSummaryGenerator(BaseDocumentGenerator):
     """Generates Executive Summary document (1-2 pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build executive summary content"""
@@ -48,6 +48,7 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    @section('company_info')
     def _add_company_overview(self):
         """Add company overview section"""
         self.add_heading1("Company Overview")
@@ -76,12 +77,13 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         self.add_body_text(overview_text)
         self.add_spacer()
     
+    @section('production_targets')
     def _add_business_model(self):
         """Add business model and phases"""
         self.add_heading1("Business Model & Development Phases")
         
         # Get production targets for phases
-        production_targets = self.db.get_production_targets()
+        production_targets = self.data.production_targets
         
         if production_targets:
             phases_data = [['Phase', 'Output (kg/month)', 'Facility Type', 'Key Focus']]
@@ -112,11 +114,12 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         self.add_body_text(business_model_text)
         self.add_spacer()
     
+    @section('team_members')
     def _add_team_overview(self):
         """Add team overview section"""
         self.add_heading1("Management Team")
         
-        team_members = self.db.get_team_members()
+        team_members = self.data.team_members
         
         if team_members:
             team_data = [['Name', 'Role', 'Contact']]
@@ -148,13 +151,14 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         self.add_body_text(team_text)
         self.add_spacer()
     
+    @section('investment_capex', 'funding_programs', 'financial_summary')
     def _add_financial_highlights(self):
         """Add financial highlights section"""
         self.add_heading1("Financial Highlights")
         
         # Get CAPEX data
-        capex_items = self.db.get_investment_capex()
-        financial_summary = self.db.get_financial_summary()
+        capex_items = self.data.investment_capex
+        financial_summary = self.data.financial_summary
         
         # Calculate phase totals
         pilot_capex = sum(item.get('estimated_cost_cad', 0) for item in capex_items 
@@ -171,7 +175,7 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         
         self.add_table(financial_data, [2.0, 1.8, 1.8], title="Investment Overview")
         
-        funding_programs = self.db.get_funding_programs()
+        funding_programs = self.data.funding_programs
         if funding_programs:
             funding_text = f"""
             <b>Funding Strategy:</b> FluxGen has identified {len(funding_programs)} government funding programs 
@@ -186,11 +190,12 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section('production_targets')
     def _add_economic_impact(self):
         """Add economic impact section"""
         self.add_heading1("Economic Impact")
         
-        production_targets = self.db.get_production_targets()
+        production_targets = self.data.production_targets
         total_capacity = sum(target.get('output_kg_month', 0) for target in production_targets)
         
         # Break into intro and bullet points to prevent overflow
@@ -221,6 +226,7 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         self.add_body_text(conclusion_text)
         self.add_spacer()
     
+    @section()
     def _add_site_requirements(self):
         """Add site requirements summary"""
         self.add_heading1("Facility Requirements")
@@ -252,6 +258,7 @@ class ExecutiveSummaryGenerator(BaseDocumentGenerator):
         self.add_body_text(conclusion_text)
         self.add_spacer()
     
+    @section()
     def _add_next_steps(self):
         """Add next steps section"""
         self.add_heading1("Next Steps & Milestones")
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class FinancialProjectionsGenerator(BaseDocumentGenerator):
     """Generates Financial Projections document (4-6 pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build financial projections content"""
@@ -57,11 +57,12 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    @section('financial_summary')
     def _add_financial_executive_summary(self):
         """Add financial executive summary"""
         self.add_heading1("Financial Executive Summary")
         
-        financial_summary = self.db.get_financial_summary()
+        financial_summary = self.data.financial_summary
         
         summary_text = f"""
         FluxGen Industries' financial projections demonstrate a viable path to profitability with strong return 
@@ -95,12 +96,13 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(summary_text)
         self.add_spacer()
     
+    @section('investment_capex')
     def _add_capex_breakdown(self):
         """Add CAPEX breakdown section"""
         self.add_heading1("Capital Expenditure Analysis")
         
         # Get CAPEX data
-        capex_items = self.db.get_investment_capex()
+        capex_items = self.data.investment_capex
         
         if capex_items:
             # Group by phase
@@ -168,6 +170,7 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(capex_text)
         self.add_spacer()
     
+    @section()
     def _add_opex_projections(self):
         """Add OPEX projections section"""
         self.add_heading1("Operating Expense Projections")
@@ -215,12 +218,13 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(opex_text)
         self.add_spacer()
     
+    @section('production_targets')
     def _add_revenue_forecasts(self):
         """Add revenue forecasts section"""
         self.add_heading1("Revenue Forecasts & Market Projections")
         
         # Get production targets
-        production_targets = self.db.get_production_targets()
+        production_targets = self.data.production_targets
         
         # Revenue projections table
         revenue_data = [
@@ -283,6 +287,7 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(revenue_text)
         self.add_spacer()
     
+    @section()
     def _add_breakeven_analysis(self):
         """Add break-even analysis section"""
         self.add_heading1("Break-Even Analysis")
@@ -345,6 +350,7 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(breakeven_text)
         self.add_spacer()
     
+    @section()
     def _add_profit_loss_projection(self):
         """Add 5-year P&L projection"""
         self.add_heading1("5-Year Profit & Loss Projection")
@@ -417,6 +423,7 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(pl_text)
         self.add_spacer()
     
+    @section()
     def _add_cash_flow_analysis(self):
         """Add cash flow analysis section"""
         self.add_heading1("Cash Flow Analysis & Working Capital")
@@ -495,12 +502,13 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(cashflow_text)
         self.add_spacer()
     
+    @section('funding_programs')
     def _add_funding_requirements(self):
         """Add funding requirements section"""
         self.add_heading1("Funding Requirements & Sources")
         
         # Get funding programs
-        funding_programs = self.db.get_funding_programs()
+        funding_programs = self.data.funding_programs
         
         if funding_programs:
             funding_data = [['Program Name', 'Type', 'Max Coverage', 'Max Amount', 'Status']]
@@ -566,6 +574,7 @@ class FinancialProjectionsGenerator(BaseDocumentGenerator):
         self.add_body_text(funding_text)
         self.add_spacer()
     
+    @section()
     def _add_financial_assumptions(self):
         """Add financial assumptions section"""
         self.add_heading1("Key Financial Assumptions & Sensitivities")
@@ -6,7 +6,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -16,8 +16,8 @@ logger = logging.getLogger(__name__)
 class IndividualPrepGenerator(BaseDocumentGenerator):
     """Generates Individual Prep Documents for team members (1-2 pages each)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
         self.current_member = None
     
     def build_content_for_member(self, member):
@@ -44,6 +44,8 @@ class IndividualPrepGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    # Sections read self.current_member, which is not part of the cache key
+    @section('team_members', cache=False)
     def _add_your_role_section(self):
         """Add 'Your Role in FluxGen' section"""
         member = self.current_member
@@ -77,6 +79,7 @@ class IndividualPrepGenerator(BaseDocumentGenerator):
         self.add_body_text(role_text)
         self.add_spacer()
     
+    @section('team_members', cache=False)
     def _add_why_you_section(self):
         """Add 'Why You're on This Team' section"""
         member = self.current_member
@@ -118,6 +121,7 @@ class IndividualPrepGenerator(BaseDocumentGenerator):
         self.add_body_text(why_text)
         self.add_spacer()
     
+    @section('team_members', cache=False)
     def _add_questions_section(self):
         """Add anticipated questions section"""
         member = self.current_member
@@ -140,6 +144,7 @@ class IndividualPrepGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section('team_members', cache=False)
     def _add_talking_points_section(self):
         """Add key talking points section"""
         member = self.current_member
@@ -173,6 +178,7 @@ class IndividualPrepGenerator(BaseDocumentGenerator):
         self.add_body_text(points_text)
         self.add_spacer()
     
+    @section('team_members', cache=False)
     def _add_dos_and_donts_section(self):
         """Add do's and don'ts section"""
         member = self.current_member
@@ -484,16 +490,13 @@ class IndividualPrepGenerator(BaseDocumentGenerator):
     
     def generate_for_member(self, member_name: str) -> Path:
         """Generate prep document for a specific team member"""
-        # Get team member data
-        query = f"SELECT * FROM team_members WHERE name = '{member_name}'"
-        result = self.db.execute_query(query)
+        # Get team member data from the generation snapshot
+        member = self.data.get_team_member(member_name)
         
-        if not result:
+        if not member:
             logger.error(f"Team member {member_name} not found")
             return None
         
-        member = result[0]
-        
         # Build content
         self.story = []
         self.build_content_for_member(member)
@@ -504,7 +507,7 @@ class IndividualPrepGenerator(BaseDocumentGenerator):
     
     def generate_all_members(self) -> list[Path]:
         """Generate prep documents for all team members"""
-        team_members = self.db.get_team_members()
+        team_members = self.data.team_members
         generated_files = []
         
         for member in team_members:
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class MarketAnalysisGenerator(BaseDocumentGenerator):
     """Generates Market Analysis document (5-7 pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build market analysis content"""
@@ -54,6 +54,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    @section()
     def _add_market_executive_summary(self):
         """Add market executive summary"""
         self.add_heading1("Market Executive Summary")
@@ -94,6 +95,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         self.add_body_text(summary_text)
         self.add_spacer()
     
+    @section()
     def _add_industry_overview(self):
         """Add industry overview section"""
         self.add_heading1("SAW Flux Industry Overview")
@@ -186,6 +188,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         self.add_body_text(trends_text)
         self.add_spacer()
     
+    @section()
     def _add_target_markets(self):
         """Add target markets section"""
         self.add_heading1("Target Markets & Applications")
@@ -292,6 +295,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         self.add_body_text(applications_text)
         self.add_spacer()
     
+    @section()
     def _add_competitive_landscape(self):
         """Add competitive landscape section"""
         self.add_heading1("Competitive Landscape Analysis")
@@ -365,6 +369,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section()
     def _add_market_size_growth(self):
         """Add market size and growth section"""
         self.add_heading1("Market Size & Growth Projections")
@@ -452,6 +457,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section()
     def _add_customer_segments(self):
         """Add customer segments section"""
         self.add_heading1("Customer Segment Analysis")
@@ -538,6 +544,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section()
     def _add_pricing_strategy(self):
         """Add pricing strategy section"""
         self.add_heading1("Pricing Strategy & Market Positioning")
@@ -626,6 +633,7 @@ class MarketAnalysisGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section()
     def _add_market_entry_strategy(self):
         """Add market entry strategy section"""
         self.add_heading1("Market Entry & Growth Strategy")
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class PitchDeckGenerator(BaseDocumentGenerator):
     """Generates Pitch Deck presentation document (12-15 slides as PDF pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build pitch deck content as slides"""
@@ -81,6 +81,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         self.add_body_text(f"<i>{header_text}</i>")
         self.add_title(title)
     
+    @section('company_info')
     def _add_title_slide(self):
         """Slide 1: Title slide"""
         self._add_slide_header(1, "FluxGen Industries Ltd.")
@@ -107,6 +108,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(title_content)
     
+    @section()
     def _add_problem_slide(self):
         """Slide 2: Problem Statement"""
         self._add_slide_header(2, "The Problem: Supply Chain Vulnerability")
@@ -162,6 +164,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_table(impact_data, [1.5, 2.0, 2.5], title="Market Problem Quantification")
     
+    @section()
     def _add_solution_slide(self):
         """Slide 3: Solution"""
         self._add_slide_header(3, "The FluxGen Solution")
@@ -218,6 +221,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_table(benefits_data, [1.5, 2.0, 2.5], title="Customer Value Proposition")
     
+    @section()
     def _add_market_opportunity_slide(self):
         """Slide 4: Market Opportunity"""
         self._add_slide_header(4, "Massive Market Opportunity")
@@ -281,6 +285,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(growth_text)
     
+    @section('alloys_catalog')
     def _add_product_overview_slide(self):
         """Slide 5: Product Overview"""
         self._add_slide_header(5, "Product Portfolio & Quality")
@@ -316,7 +321,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         self.add_body_text(product_text)
         
         # Get some alloy data if available
-        alloys = self.db.get_alloys_catalog()
+        alloys = self.data.alloys_catalog
         if alloys and len(alloys) > 0:
             # Product examples table
             product_examples_data = [['Product', 'Application', 'Key Benefits']]
@@ -359,6 +364,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(quality_text)
     
+    @section('production_targets')
     def _add_business_model_slide(self):
         """Slide 6: Business Model"""
         self._add_slide_header(6, "Scalable Business Model")
@@ -373,7 +379,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         self.add_body_text(business_model_text)
         
         # Get production targets
-        production_targets = self.db.get_production_targets()
+        production_targets = self.data.production_targets
         
         if production_targets:
             phases_data = [['Phase', 'Capacity (kg/month)', 'Revenue Target', 'Key Focus']]
@@ -437,6 +443,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(model_details)
     
+    @section()
     def _add_traction_slide(self):
         """Slide 7: Traction/Milestones"""
         self._add_slide_header(7, "Progress & Milestones")
@@ -517,6 +524,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(validation_text)
     
+    @section('team_members')
     def _add_team_slide(self):
         """Slide 8: Management Team"""
         self._add_slide_header(8, "Experienced Management Team")
@@ -531,7 +539,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         self.add_body_text(team_intro)
         
         # Get team data
-        team_members = self.db.get_team_members()
+        team_members = self.data.team_members
         
         if team_members:
             team_data = [['Name', 'Role', 'Key Experience', 'Value to FluxGen']]
@@ -597,11 +605,12 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(team_strength)
     
+    @section('financial_summary')
     def _add_financials_slide(self):
         """Slide 9: Financial Projections"""
         self._add_slide_header(9, "Strong Financial Projections")
         
-        financial_summary = self.db.get_financial_summary()
+        financial_summary = self.data.financial_summary
         
         financials_intro = f"""
         <b>Path to Profitability with Strong Returns</b>
@@ -670,6 +679,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(financial_highlights)
     
+    @section()
     def _add_competition_slide(self):
         """Slide 10: Competition"""
         self._add_slide_header(10, "Competitive Landscape")
@@ -740,6 +750,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(competitive_strategy)
     
+    @section()
     def _add_go_to_market_slide(self):
         """Slide 11: Go-to-Market Strategy"""
         self._add_slide_header(11, "Go-to-Market Strategy")
@@ -822,6 +833,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(customer_acquisition)
     
+    @section()
     def _add_funding_ask_slide(self):
         """Slide 12: The Ask (Funding)"""
         self._add_slide_header(12, "Investment Opportunity")
@@ -893,6 +905,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(investor_benefits)
     
+    @section()
     def _add_use_of_funds_slide(self):
         """Slide 13: Use of Funds"""
         self._add_slide_header(13, "Use of Investment Funds")
@@ -956,6 +969,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         
         self.add_body_text(funding_timeline)
     
+    @section('company_info', 'team_members')
     def _add_contact_slide(self):
         """Slide 14: Contact & Next Steps"""
         self._add_slide_header(14, "Next Steps & Contact Information")
@@ -985,7 +999,7 @@ class PitchDeckGenerator(BaseDocumentGenerator):
         self.add_body_text(contact_info)
         
         # Team contact info if available
-        team_members = self.db.get_team_members()
+        team_members = self.data.team_members
         if team_members:
             team_contacts_data = [['Name', 'Role', 'Contact Information']]
             
@@ -0,0 +1,46 @@
+"""
+Document type to generator class mapping, shared by the routes and the render workers
+"""
+from generators.executive_summary import ExecutiveSummaryGenerator
+from generators.business_plan import BusinessPlanGenerator
+from generators.financial_projections import FinancialProjectionsGenerator
+from generators.market_analysis import MarketAnalysisGenerator
+from generators.technical_specs import TechnicalSpecsGenerator
+from generators.team_bios import TeamBiosGenerator
+from generators.site_requirements import SiteRequirementsGenerator
+from generators.pitch_deck import PitchDeckGenerator
+from generators.individual_prep import IndividualPrepGenerator
+from typing import Optional
+
+GENERATORS = {
+    'executive_summary': ExecutiveSummaryGenerator,
+    'business_plan': BusinessPlanGenerator,
+    'financial_projections': FinancialProjectionsGenerator,
+    'market_analysis': MarketAnalysisGenerator,
+    'technical_specs': TechnicalSpecsGenerator,
+    'team_bios': TeamBiosGenerator,
+    'site_requirements': SiteRequirementsGenerator,
+    'pitch_deck': PitchDeckGenerator,
+    'individual_prep': IndividualPrepGenerator
+}
+
+# Start of each generator's output filenames: <prefix><YYYYmmdd_HHMMSS>[_<profile>].pdf
+FILE_PREFIXES = {
+    'executive_summary': 'fluxgen_executive_summary_',
+    'business_plan': 'fluxgen_business_plan_',
+    'financial_projections': 'fluxgen_financial_projections_',
+    'market_analysis': 'fluxgen_market_analysis_',
+    'technical_specs': 'fluxgen_technical_specifications_',
+    'team_bios': 'fluxgen_team_biographies_',
+    'site_requirements': 'fluxgen_site_requirements_',
+    'pitch_deck': 'fluxgen_pitch_deck_',
+    'individual_prep': 'fluxgen_prep_'
+}
+
+
+def document_type(filename: str) -> Optional[str]:
+    """Document type whose generator wrote ``filename``, or None for other files"""
+    for doc_name, prefix in FILE_PREFIXES.items():
+        if filename.startswith(prefix):
+            return doc_name
+    return None
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class SiteRequirementsGenerator(BaseDocumentGenerator):
     """Generates Site Requirements document (3-4 pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build site requirements content"""
@@ -53,6 +53,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    @section()
     def _add_site_executive_summary(self):
         """Add site requirements executive summary"""
         self.add_heading1("Site Requirements Executive Summary")
@@ -98,6 +99,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         self.add_body_text(summary_text)
         self.add_spacer()
     
+    @section()
     def _add_land_requirements(self):
         """Add land requirements section"""
         self.add_heading1("Land Area & Physical Requirements")
@@ -176,6 +178,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         self.add_body_text(characteristics_text)
         self.add_spacer()
     
+    @section()
     def _add_utilities_requirements(self):
         """Add utilities requirements section"""
         self.add_heading1("Utilities & Infrastructure Requirements")
@@ -298,6 +301,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         self.add_body_text(gas_water_text)
         self.add_spacer()
     
+    @section()
     def _add_infrastructure_needs(self):
         """Add infrastructure needs section"""
         self.add_heading1("Transportation & Logistics Infrastructure")
@@ -371,6 +375,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         self.add_body_text(traffic_text)
         self.add_spacer()
     
+    @section()
     def _add_zoning_regulatory(self):
         """Add zoning and regulatory requirements"""
         self.add_heading1("Zoning & Regulatory Requirements")
@@ -490,6 +495,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         self.add_body_text(environmental_text)
         self.add_spacer()
     
+    @section()
     def _add_facility_layout(self):
         """Add facility layout section"""
         self.add_heading1("Facility Layout & Design Considerations")
@@ -584,6 +590,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section()
     def _add_environmental_considerations(self):
         """Add environmental considerations section"""
         self.add_heading1("Environmental Impact & Mitigation")
@@ -674,6 +681,7 @@ class SiteRequirementsGenerator(BaseDocumentGenerator):
         self.add_body_text(sustainability_text)
         self.add_spacer()
     
+    @section()
     def _add_site_selection_criteria(self):
         """Add site selection criteria section"""
         self.add_heading1("Site Selection Criteria & Evaluation")
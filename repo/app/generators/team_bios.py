@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class TeamBiosGenerator(BaseDocumentGenerator):
     """Generates Team Biographies document (2-3 pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build team biographies content"""
@@ -43,12 +43,13 @@ class TeamBiosGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    @section('team_members')
     def _add_team_overview(self):
         """Add team overview section"""
         self.add_heading1("Executive Team Overview")
         
         # Get team member data
-        team_members = self.db.get_team_members()
+        team_members = self.data.team_members
         
         # Break into smaller sections to prevent overflow
         intro_text = """
@@ -108,11 +109,12 @@ class TeamBiosGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section('team_members')
     def _add_individual_bios(self):
         """Add detailed individual biographies"""
         self.add_heading1("Individual Biographies")
         
-        team_members = self.db.get_team_members()
+        team_members = self.data.team_members
         
         if team_members:
             for member in team_members:
@@ -182,6 +184,7 @@ class TeamBiosGenerator(BaseDocumentGenerator):
             """
             self.add_body_text(placeholder_text)
     
+    @section()
     def _add_organizational_structure(self):
         """Add organizational structure section"""
         self.add_heading1("Organizational Structure & Reporting")
@@ -253,6 +256,7 @@ class TeamBiosGenerator(BaseDocumentGenerator):
         self.add_body_text(performance_mgmt_text)
         self.add_spacer()
     
+    @section()
     def _add_advisory_board(self):
         """Add advisory board section"""
         self.add_heading1("Advisory Board & Industry Experts")
@@ -342,6 +346,7 @@ class TeamBiosGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section()
     def _add_hiring_plan(self):
         """Add hiring plan section"""
         self.add_heading1("Staffing Plan & Human Resources Strategy")
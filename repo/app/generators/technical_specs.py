@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generators.base import BaseDocumentGenerator
+from generators.base import BaseDocumentGenerator, section
 from pathlib import Path
 import logging
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class TechnicalSpecsGenerator(BaseDocumentGenerator):
     """Generates Technical Specifications document (6-8 pages)"""
     
-    def __init__(self, database_manager, output_dir: Path):
-        super().__init__(database_manager, output_dir)
+    def __init__(self, database_manager, output_dir: Path, profile: str = 'standard'):
+        super().__init__(database_manager, output_dir, profile)
     
     def build_content(self):
         """Build technical specifications content"""
@@ -54,12 +54,13 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         # Footer
         self.add_footer_info()
     
+    @section('production_targets')
     def _add_manufacturing_overview(self):
         """Add manufacturing process overview"""
         self.add_heading1("Manufacturing Process Overview")
         
         # Get production target data
-        production_targets = self.db.get_production_targets()
+        production_targets = self.data.production_targets
         
         overview_text = """
         FluxGen Industries employs advanced manufacturing processes to produce high-quality submerged arc welding (SAW) 
@@ -121,6 +122,7 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         self.add_body_text(process_overview_text)
         self.add_spacer()
     
+    @section()
     def _add_process_flow(self):
         """Add detailed process flow"""
         self.add_heading1("Detailed Manufacturing Process Flow")
@@ -174,6 +176,7 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         self.add_body_text(parameters_text)
         self.add_spacer()
     
+    @section()
     def _add_equipment_specifications(self):
         """Add equipment specifications section"""
         self.add_heading1("Equipment Specifications & Layout")
@@ -229,6 +232,7 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         self.add_body_text(layout_text)
         self.add_spacer()
     
+    @section()
     def _add_quality_control(self):
         """Add quality control procedures"""
         self.add_heading1("Quality Control & Testing Procedures")
@@ -314,12 +318,13 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section('alloys_catalog')
     def _add_product_catalog(self):
         """Add product catalog section"""
         self.add_heading1("Product Catalog & Technical Specifications")
         
         # Get alloys catalog data
-        alloys = self.db.get_alloys_catalog()
+        alloys = self.data.alloys_catalog
         
         if alloys:
             # Product specifications table
@@ -389,12 +394,13 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section('certifications_roadmap')
     def _add_certifications_roadmap(self):
         """Add certifications roadmap section"""
         self.add_heading1("Certifications & Compliance Roadmap")
         
         # Get certifications data
-        certifications = self.db.get_certifications_roadmap()
+        certifications = self.data.certifications_roadmap
         
         if certifications:
             # Certifications timeline table
@@ -479,6 +485,7 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         
         self.add_spacer()
     
+    @section()
     def _add_raw_materials(self):
         """Add raw material requirements section"""
         self.add_heading1("Raw Material Requirements & Sourcing")
@@ -548,6 +555,7 @@ class TechnicalSpecsGenerator(BaseDocumentGenerator):
         self.add_body_text(cost_mgmt_text)
         self.add_spacer()
     
+    @section()
     def _add_technical_standards(self):
         """Add technical standards and compliance section"""
         self.add_heading1("Technical Standards & Industry Compliance")
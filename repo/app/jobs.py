@@ -0,0 +1,214 @@
+"""
+Background jobs for document generation
+"""
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class QueueFull(Exception):
+    """Raised by JobQueue.submit() when ``max_queued`` jobs are already waiting"""
+
+
+class QueueClosed(Exception):
+    """Raised by JobQueue.submit() once the queue has been closed"""
+
+
+class Job:
+    """
+    One submitted unit of work, its state, timings and result.
+
+    Everything that happens to the job is also appended to ``events`` as
+    ``(id, event, data)`` with ids counting from 1: its status changes
+    (``queued``, ``running``, then ``done`` with the result or ``failed``
+    with the error), ``progress`` updates and whatever the job's target
+    emits, such as the generators' progress events.
+    """
+
+    def __init__(self, kind: str, params: Dict[str, Any]):
+        self.id = uuid.uuid4().hex[:16]
+        self.kind = kind
+        self.params = params
+        self.status = QUEUED
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.progress: Dict[str, Any] = {}
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._created = time.perf_counter()
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self.events: List[tuple] = []
+        self._changed = threading.Condition()
+        self._future = None  # set by JobQueue.submit()
+        self.emit(QUEUED)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    def update(self, **progress):
+        """Record progress (e.g. ``completed``, ``total``, ``current``) for pollers and listeners"""
+        self.progress.update(progress)
+        self.emit('progress', **self.progress)
+
+    def emit(self, event: str, **data):
+        """Append an event (safe from any thread) and wake listeners"""
+        data['elapsed_ms'] = round((time.perf_counter() - self._created) * 1000, 1)
+        with self._changed:
+            self.events.append((len(self.events) + 1, event, data))
+            self._changed.notify_all()
+
+    def events_after(self, last_id: int, timeout: Optional[float] = None) -> List[tuple]:
+        """Events with ids above ``last_id``, waiting up to ``timeout`` seconds for one if there are none yet"""
+        with self._changed:
+            if len(self.events) <= last_id:
+                self._changed.wait(timeout)
+            return self.events[last_id:]
+
+    def as_dict(self) -> Dict[str, Any]:
+        now = time.perf_counter()
+        queued_until = self._started if self._started is not None else now
+        return {
+            'job_id': self.id,
+            'kind': self.kind,
+            'params': self.params,
+            'status': self.status,
+            'progress': dict(self.progress),
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'queued_ms': round((queued_until - self._created) * 1000, 1),
+            'run_ms': round(((self._finished or now) - self._started) * 1000, 1) if self._started else None,
+            'result': self.result,
+            'error': self.error,
+        }
+
+
+class JobQueue:
+    """
+    Jobs run on a bounded pool of ``workers`` threads, tracked by ID.
+
+    ``submit`` returns at once with a queued Job; its target runs on the next
+    free worker inside ``app``'s application context (so routes' helpers and
+    the render pool work as they do in a request) and its return value
+    becomes the job's result. At most ``max_queued`` jobs wait at a time
+    (0 = unbounded). The newest ``history`` finished jobs are kept for
+    lookups; older ones are forgotten.
+    """
+
+    def __init__(self, workers: int = 4, max_queued: int = 0, history: int = 200, app=None):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.history = history
+        self.app = app
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fluxgen-job')
+        self._closed = False
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0}
+
+    def submit(self, kind: str, target: Callable[[Job], Dict[str, Any]], **params) -> Job:
+        """Queue ``target(job)``; ``params`` are reported with the job"""
+        job = Job(kind, params)
+        with self._lock:
+            if self._closed:
+                self._stats['rejected'] += 1
+                raise QueueClosed("server shutting down")
+            if self.max_queued and self._count(QUEUED) >= self.max_queued:
+                self._stats['rejected'] += 1
+                raise QueueFull(f"{self.max_queued} jobs already queued")
+            self._jobs[job.id] = job
+            self._stats['submitted'] += 1
+            self._trim()
+        try:
+            job._future = self._executor.submit(self._run, job, target)
+        except RuntimeError:
+            # close() ran since the check above; the executor takes no more work
+            self._finish(job, FAILED, error='server shutting down')
+            raise QueueClosed("server shutting down") from None
+        logger.info(f"Job {job.id} queued: {kind} {params}")
+        return job
+
+    def _run(self, job: Job, target: Callable[[Job], Dict[str, Any]]):
+        job.started_at = datetime.now()
+        job._started = time.perf_counter()
+        job.status = RUNNING
+        job.emit(RUNNING)
+        try:
+            if self.app is not None:
+                with self.app.app_context():
+                    result = target(job)
+            else:
+                result = target(job)
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {str(e)}")
+            self._finish(job, FAILED, error=str(e))
+        else:
+            self._finish(job, DONE, result=result)
+
+    def _finish(self, job: Job, status: str, result=None, error=None):
+        job.result = result
+        job.error = error
+        job.finished_at = datetime.now()
+        job._finished = time.perf_counter()
+        job.status = status
+        if status == DONE:
+            job.emit(DONE, result=result)
+        else:
+            job.emit(FAILED, error=error)
+        with self._lock:
+            self._stats['completed' if status == DONE else 'failed'] += 1
+            self._trim()
+        if job._started is None:
+            logger.info(f"Job {job.id} {status} before it started: {error}")
+        else:
+            logger.info(f"Job {job.id} {status} in {(job._finished - job._started) * 1000:.0f} ms")
+
+    def _count(self, status: str) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == status)
+
+    def _trim(self):
+        """Forget the oldest finished jobs beyond ``history`` (caller holds the lock)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def recent(self, limit: int = 50, status: Optional[str] = None) -> List[Job]:
+        """Newest jobs first, optionally only those in ``status``"""
+        with self._lock:
+            jobs = [job for job in reversed(self._jobs.values()) if status is None or job.status == status]
+        return list(itertools.islice(jobs, limit))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, workers=self.workers, queued=self._count(QUEUED),
+                        running=self._count(RUNNING), tracked=len(self._jobs))
+
+    def close(self):
+        """Stop taking jobs and fail the ones still queued; running jobs finish"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            dropped = [job for job in self._jobs.values() if job._future is not None and job._future.cancelled()]
+        for job in dropped:
+            self._finish(job, FAILED, error='server shutting down')
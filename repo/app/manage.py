@@ -0,0 +1,197 @@
+"""
+Maintenance commands for the FluxGen database
+
+Usage:
+    python manage.py migrate
+    python manage.py reconcile-summary [--fix]
+    python manage.py index-advisor [--strict] [--trace FILE]
+    python manage.py snapshot [--dir DIR] [--keep N]
+    python manage.py rebuild-manifest [--dir DIR]
+"""
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import os
+import re
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from database import DatabaseManager, SnapshotManager, dataset_cache, query_tracer
+from manifest import manifest_for
+from models import ModelFactory
+
+
+def traced_queries(db_path: Path) -> List[Tuple[str, str]]:
+    """
+    (caller, statement) of every SELECT the app's read paths issue, captured with the query tracer.
+
+    Runs read_snapshot() - every DATASET_QUERIES statement, the company row,
+    the financial summary and the version table - and the typed query of each
+    model on a fresh read-only DatabaseManager, with the dataset cache
+    cleared so nothing is skipped.
+    """
+    query_tracer.configure(enabled=True)
+    query_tracer.reset()
+    dataset_cache.clear()
+    reader = DatabaseManager(db_path, mode='ro')
+    with query_tracer.section('DatabaseManager.read_snapshot'):
+        reader.read_snapshot()
+    for model in ModelFactory.TABLES:
+        with query_tracer.section(f"DatabaseManager.query_models({model.__name__})"):
+            try:
+                reader.query_models(model)
+            except sqlite3.OperationalError as e:
+                print(f"? {model.__name__}: {e} (skipped)")
+    query_tracer.configure(enabled=False)
+    return traced_statements(query_tracer.get_stats()['statements'])
+
+
+def traced_statements(statements: List[dict]) -> List[Tuple[str, str]]:
+    """(caller, statement) of the SELECTs in QueryTracer stats (as /api/debug/queries returns them)"""
+    queries = []
+    for entry in statements:
+        if entry['statement'].upper().startswith(('SELECT', 'WITH')):
+            sections = entry['sections']
+            queries.append((max(sections, key=sections.get), entry['statement']))
+    return queries
+
+
+def explain(conn: sqlite3.Connection, query: str) -> List[str]:
+    """EXPLAIN QUERY PLAN details for ``query`` with all parameters bound to NULL"""
+    params = (None,) * query.count('?')
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+
+
+def plan_issues(query: str, plan: List[str]) -> List[str]:
+    """Full scans of filtered queries and temp B-trees used for sorting or grouping"""
+    issues = []
+    filtered = ' WHERE ' in f" {' '.join(query.split()).upper()} "
+    for detail in plan:
+        if filtered and detail.startswith('SCAN ') and 'USING' not in detail:
+            issues.append(f"full scan: {detail}")
+        if 'USE TEMP B-TREE' in detail:
+            issues.append(f"temp b-tree: {detail}")
+    return issues
+
+
+def cmd_migrate(db: DatabaseManager, args) -> int:
+    """Apply pending schema migrations"""
+    version = db.migrate()
+    print(f"Database schema at version {version}")
+    return 0
+
+
+def cmd_reconcile_summary(db: DatabaseManager, args) -> int:
+    """Check the materialized financial summary against a full recompute"""
+    result = db.reconcile_financial_summary(fix=args.fix)
+    print(json.dumps(result, indent=2))
+    if result['consistent']:
+        print("✓ financial_summary matches a full recompute")
+        return 0
+    if result['fixed']:
+        print("✓ financial_summary was out of date and has been rebuilt")
+        return 0
+    print("✗ financial_summary does not match (run with --fix to rebuild)")
+    return 1
+
+
+def cmd_index_advisor(db: DatabaseManager, args) -> int:
+    """Report full scans and temp B-trees in the plans of every app query"""
+    queries = traced_queries(db.db_path)
+    for trace in args.trace:
+        # Statements another process traced, e.g. the app's /api/debug/queries under real load
+        with open(trace) as f:
+            queries += traced_statements(json.load(f)['statements'])
+    unique = {}
+    for source, query in queries:
+        unique.setdefault(query, source)
+
+    flagged = 0
+    with db.get_connection() as conn:
+        for query, source in unique.items():
+            try:
+                plan = explain(conn, query)
+            except sqlite3.Error as e:
+                print(f"? {source}: {e}")
+                continue
+            issues = plan_issues(query, plan)
+            flagged += bool(issues)
+            size = ''
+            table = re.search(r'\bFROM\s+(\w+)', query, re.IGNORECASE)
+            if table:
+                rows = conn.execute(f"SELECT COUNT(*) FROM {table.group(1)}").fetchone()[0]
+                size = f" ({table.group(1)}: {rows} rows)"
+            print(f"{'✗' if issues else '✓'} {source}{size}")
+            print(f"    {' '.join(query.split())}")
+            for issue in issues:
+                print(f"    - {issue}")
+
+    print(f"{flagged} of {len(unique)} queries have full scans or temp B-trees")
+    return 1 if args.strict and flagged else 0
+
+
+def cmd_snapshot(db: DatabaseManager, args) -> int:
+    """Write a frozen copy of the database for immutable generation workers"""
+    snapshots = SnapshotManager(db.db_path, args.dir, keep=args.keep)
+    path = snapshots.create()
+    print(f"✓ Snapshot written to {path}")
+    for existing in snapshots.list():
+        print(f"    {existing.name} ({existing.stat().st_size / 1024:.0f} KB)")
+    return 0
+
+
+def cmd_rebuild_manifest(db: DatabaseManager, args) -> int:
+    """Sync the output manifest with the PDFs actually in the output directory"""
+    counts = manifest_for(args.dir).rebuild()
+    print(f"✓ Output manifest in {args.dir}: {counts['files']} PDFs, {counts['added']} added, "
+          f"{counts['restored']} restored, {counts['removed']} marked deleted")
+    return 0
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='FluxGen Database Maintenance')
+    parser.add_argument('--db', type=Path, default=Config.DATABASE_PATH, help='Database path')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('migrate', help='Apply pending schema migrations').set_defaults(func=cmd_migrate)
+
+    reconcile = subparsers.add_parser('reconcile-summary', help='Verify the materialized financial summary')
+    reconcile.add_argument('--fix', action='store_true', help='Rebuild the summary if it does not match')
+    reconcile.set_defaults(func=cmd_reconcile_summary)
+
+    advisor = subparsers.add_parser('index-advisor', help='Check query plans for missing indexes')
+    advisor.add_argument('--strict', action='store_true', help='Exit non-zero when any query is flagged')
+    advisor.add_argument('--trace', type=Path, action='append', default=[],
+                         help='Also check the statements in a saved /api/debug/queries response')
+    advisor.set_defaults(func=cmd_index_advisor)
+
+    snapshot = subparsers.add_parser('snapshot', help='Create a read-only snapshot copy and rotate old ones')
+    snapshot.add_argument('--dir', type=Path, default=Config.DB_SNAPSHOT_DIR, help='Snapshot directory')
+    snapshot.add_argument('--keep', type=int, default=Config.DB_SNAPSHOT_KEEP, help='Snapshots to keep')
+    snapshot.set_defaults(func=cmd_snapshot)
+
+    manifest = subparsers.add_parser('rebuild-manifest', help='Re-index generated PDFs for /list')
+    manifest.add_argument('--dir', type=Path, default=Config.OUTPUT_DIR, help='Output directory')
+    manifest.set_defaults(func=cmd_rebuild_manifest)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+
+    db = DatabaseManager(args.db)
+    try:
+        return args.func(db, args)
+    except sqlite3.Error as e:
+        print(f"✗ {e}")
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
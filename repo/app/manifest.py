@@ -0,0 +1,243 @@
+"""
+Index of the PDFs in the output directory, kept in a small SQLite database beside them
+"""
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = '.manifest.db'
+MANIFEST_VERSION = 2  # PRAGMA user_version; an older manifest is dropped and rebuilt from the directory
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    filename TEXT PRIMARY KEY,
+    doc_type TEXT,
+    member TEXT,
+    profile TEXT NOT NULL DEFAULT 'standard',
+    data_version TEXT,
+    size INTEGER NOT NULL,
+    pages INTEGER,
+    created_at TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_documents_created ON documents (deleted, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_documents_type_created ON documents (deleted, doc_type, created_at DESC);
+"""
+
+_PAGE_OBJECT = re.compile(rb'/Type\s*/Page(?![A-Za-z])')
+
+
+def file_profile(path: Path) -> str:
+    """PDF profile a generated file was written in (non-standard profiles suffix the name)"""
+    from generators.base import PDF_PROFILES
+
+    for name in PDF_PROFILES:
+        if name != 'standard' and path.stem.endswith(f"_{name}"):
+            return name
+    return 'standard'
+
+
+def _prep_member(path: Path, profile: str) -> str:
+    """Member part of fluxgen_prep_<member>_<YYYYmmdd>_<HHMMSS>[_<profile>].pdf"""
+    from generators.registry import FILE_PREFIXES
+
+    stem = path.stem[len(FILE_PREFIXES['individual_prep']):]
+    return stem.rsplit('_', 2 if profile == 'standard' else 3)[0]
+
+
+class OutputManifest:
+    """
+    One row per generated PDF: document type, prep member, profile, the
+    dataset version it was built from, size, page count and creation time.
+
+    Generators record their PDF as they finish writing it (from whichever
+    process rendered it), so listing documents is an indexed query rather
+    than a directory scan. Deleting through the API marks the row deleted;
+    a cached render restored into the output directory clears the mark.
+    ``rebuild()`` re-syncs the index with the directory after files are
+    added or removed by hand.
+    """
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_NAME
+        self._local = threading.local()
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, creating the manifest on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            with self._lock:
+                if not self._ready:
+                    conn.execute("PRAGMA journal_mode = WAL")  # render workers write concurrently
+                    conn.execute("BEGIN IMMEDIATE")  # one process at a time checks and creates the schema
+                    try:
+                        if conn.execute("PRAGMA user_version").fetchone()[0] != MANIFEST_VERSION:
+                            conn.execute("DROP TABLE IF EXISTS documents")
+                        for statement in filter(None, (part.strip() for part in _SCHEMA.split(';'))):
+                            conn.execute(statement)
+                        conn.execute(f"PRAGMA user_version = {MANIFEST_VERSION}")
+                        conn.execute("COMMIT")
+                    except Exception:
+                        conn.execute("ROLLBACK")
+                        raise
+                    self._ready = True
+            self._local.conn = conn
+        return conn
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def record(self, path: Path, pages: Optional[int] = None, data_version: Optional[str] = None,
+               created_at: Optional[datetime] = None, size: Optional[int] = None):
+        """Add or replace ``path``'s row (type, member and profile come from the filename)
+
+        ``data_version`` identifies the data the PDF was built from
+        (DatasetSnapshot.version_id); files indexed from disk have none.
+        """
+        from generators.registry import document_type
+
+        path = Path(path)
+        doc_type = document_type(path.name)
+        profile = file_profile(path)
+        member = _prep_member(path, profile) if doc_type == 'individual_prep' else None
+        if size is None:
+            size = path.stat().st_size
+        self._connection().execute(
+            "INSERT OR REPLACE INTO documents "
+            "(filename, doc_type, member, profile, data_version, size, pages, created_at, deleted) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+            (path.name, doc_type, member, profile, data_version, size, pages,
+             (created_at or datetime.now()).isoformat())
+        )
+
+    def mark_deleted(self, filename: str):
+        self._connection().execute("UPDATE documents SET deleted = 1 WHERE filename = ?", (filename,))
+
+    def restore(self, paths: Iterable[Path]):
+        """Clear the deleted mark of files put back in the output directory, indexing unknown ones"""
+        conn = self._connection()
+        for path in paths:
+            if conn.execute("UPDATE documents SET deleted = 0 WHERE filename = ?", (path.name,)).rowcount == 0:
+                self.record(path, pages=self._count_pages(path),
+                            created_at=datetime.fromtimestamp(path.stat().st_mtime))
+
+    @staticmethod
+    def _count_pages(path: Path) -> Optional[int]:
+        """Page count of a PDF written by ReportLab (page objects are never in object streams)"""
+        try:
+            return len(_PAGE_OBJECT.findall(path.read_bytes())) or None
+        except OSError:
+            return None
+
+    def rebuild(self) -> Dict[str, int]:
+        """Index PDFs missing from the manifest and mark rows whose file is gone; returns the counts"""
+        conn = self._connection()
+        known = {row['filename']: row['deleted'] for row in conn.execute("SELECT filename, deleted FROM documents")}
+        on_disk = {path.name: path for path in self.output_dir.glob('*.pdf')}
+        added = restored = removed = 0
+        conn.execute("BEGIN")
+        try:
+            for name, path in on_disk.items():
+                if name not in known:
+                    self.record(path, pages=self._count_pages(path),
+                                created_at=datetime.fromtimestamp(path.stat().st_mtime))
+                    added += 1
+                elif known[name]:
+                    conn.execute("UPDATE documents SET deleted = 0 WHERE filename = ?", (name,))
+                    restored += 1
+            for name, deleted in known.items():
+                if name not in on_disk and not deleted:
+                    conn.execute("UPDATE documents SET deleted = 1 WHERE filename = ?", (name,))
+                    removed += 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info(f"Output manifest rebuilt: {added} added, {restored} restored, {removed} gone")
+        return {'added': added, 'restored': restored, 'removed': removed, 'files': len(on_disk)}
+
+    def list(self, doc_type: Optional[str] = None, profile: Optional[str] = None,
+             limit: int = 100, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Newest first, optionally one document type / profile; returns (page of rows, total matching)"""
+        where, params = self._filters(doc_type, profile)
+        conn = self._connection()
+        total = conn.execute(f"SELECT COUNT(*) FROM documents WHERE {where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT * FROM documents WHERE {where} ORDER BY created_at DESC, filename DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+        return [self._row(row) for row in rows], total
+
+    def latest(self, doc_types: Optional[Iterable[str]] = None,
+               profile: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Newest PDF of each document type (each member's, for individual_prep).
+
+        Rows carry ``versions``, how many PDFs of that type (and member) exist.
+        """
+        where, params = self._filters(None, profile)
+        doc_types = list(doc_types) if doc_types is not None else None
+        if doc_types is not None:
+            where += f" AND doc_type IN ({', '.join('?' * len(doc_types))})"
+            params += doc_types
+        rows = self._connection().execute(f"""
+            SELECT * FROM (
+                SELECT *,
+                       ROW_NUMBER() OVER (PARTITION BY doc_type, member
+                                          ORDER BY created_at DESC, filename DESC) AS rank,
+                       COUNT(*) OVER (PARTITION BY doc_type, member) AS versions
+                FROM documents WHERE {where} AND doc_type IS NOT NULL
+            ) WHERE rank = 1 ORDER BY doc_type, member
+        """, params)
+        return [self._row(row) for row in rows]
+
+    @staticmethod
+    def _filters(doc_type: Optional[str], profile: Optional[str]) -> Tuple[str, list]:
+        where, params = "deleted = 0", []
+        if doc_type:
+            where += " AND doc_type = ?"
+            params.append(doc_type)
+        if profile:
+            where += " AND profile = ?"
+            params.append(profile)
+        return where, params
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict[str, Any]:
+        entry = {key: row[key] for key in row.keys() if key not in ('deleted', 'rank')}
+        # Field names /list has always returned
+        entry['created'] = entry['modified'] = entry.pop('created_at')
+        return entry
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_manifests: Dict[Path, OutputManifest] = {}
+_manifests_lock = threading.Lock()
+
+
+def manifest_for(output_dir: Path) -> OutputManifest:
+    """The process's OutputManifest for ``output_dir``"""
+    key = Path(output_dir).resolve()
+    with _manifests_lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = _manifests[key] = OutputManifest(key)
+        return manifest
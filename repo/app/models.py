@@ -1,12 +1,15 @@
 """
 Data models for FluxGen application
 """
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, asdict, field
+import hashlib
+import json
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+from itertools import starmap
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyInfo:
     """Company information model"""
     id: int
@@ -28,7 +31,7 @@ class CompanyInfo:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamMember:
     """Team member model"""
     id: int
@@ -40,12 +43,16 @@ class TeamMember:
     status: str = 'active'
     notes: Optional[str] = None
     created_date: Optional[str] = None
+    background: Optional[str] = None
+    expertise: Optional[str] = None
+    current_position: Optional[str] = None
+    value_to_fluxgen: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class CapexItem:
     """Capital expenditure item model"""
     id: int
@@ -62,7 +69,7 @@ class CapexItem:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductionTarget:
     """Production target model"""
     id: int
@@ -79,7 +86,7 @@ class ProductionTarget:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Alloy:
     """Alloy catalog item model"""
     id: int
@@ -97,7 +104,7 @@ class Alloy:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingProgram:
     """Funding program model"""
     id: int
@@ -117,7 +124,7 @@ class FundingProgram:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Certification:
     """Certification roadmap item model"""
     id: int
@@ -136,7 +143,7 @@ class Certification:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandAsset:
     """Brand asset model"""
     id: int
@@ -156,8 +163,151 @@ class BrandAsset:
         return asdict(self)
 
 
+@dataclass(slots=True)
+class Supplier:
+    """Supplier model (Ai-Sourcing suppliers table)"""
+    id: int
+    company_name: str
+    contact_person: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    website: Optional[str] = None
+    address_line1: Optional[str] = None
+    city: Optional[str] = None
+    province_state: Optional[str] = None
+    country: Optional[str] = 'Canada'
+    postal_code: Optional[str] = None
+    materials_supplied: Optional[str] = None
+    supplier_type: str = 'Local'
+    priority: str = 'Primary'
+    estimated_lead_time_days: Optional[int] = None
+    min_order_qty_mt: Optional[float] = None
+    payment_terms: Optional[str] = None
+    notes: Optional[str] = None
+    status: str = 'Prospect'
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    contact_email: Optional[str] = None
+    contact_phone: Optional[str] = None
+    pricing_tier: Optional[str] = None
+    last_contact_date: Optional[str] = None
+    response_rate: Optional[float] = None
+    avg_lead_time_days: Optional[int] = None
+    quality_rating: Optional[float] = None
+    last_quote_date: Optional[str] = None
+    total_quotes: int = 0
+    linkedin_url: Optional[str] = None
+    source: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class Equipment:
+    """Equipment and machinery model"""
+    id: int
+    equipment_category: str
+    equipment_name: str
+    equipment_code: Optional[str] = None
+    quantity: int = 1
+    capacity_specification: Optional[str] = None
+    technical_specs: Optional[str] = None
+    purpose: Optional[str] = None
+    priority: str = 'High'
+    estimated_cost_cad: Optional[float] = None
+    estimated_cost_range_low: Optional[float] = None
+    estimated_cost_range_high: Optional[float] = None
+    supplier_type: Optional[str] = None
+    lead_time_weeks: Optional[int] = None
+    installation_complexity: Optional[str] = None
+    power_requirement_kw: Optional[float] = None
+    floor_space_sqm: Optional[float] = None
+    notes: Optional[str] = None
+    phase: str = 'Phase 1 - Year 1'
+    status: str = 'Required'
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class DatasetSnapshot:
+    """Everything a document generator reads, loaded in one read transaction
+
+    Rows stay as dicts (the shape generators already use); collections are
+    tuples so sections cannot mutate data another section will read. Rows may
+    be shared with the dataset cache, so treat them as read-only.
+    ``versions`` maps table name to the dataset version the data was read at.
+    """
+    company_info: Optional[Dict[str, Any]]
+    team_members: Tuple[Dict[str, Any], ...]
+    investment_capex: Tuple[Dict[str, Any], ...]
+    production_targets: Tuple[Dict[str, Any], ...]
+    alloys_catalog: Tuple[Dict[str, Any], ...]
+    funding_programs: Tuple[Dict[str, Any], ...]
+    certifications_roadmap: Tuple[Dict[str, Any], ...]
+    business_assumptions: Tuple[Dict[str, Any], ...]
+    competitors: Tuple[Dict[str, Any], ...]
+    competitor_pricing: Tuple[Dict[str, Any], ...]
+    market_analysis: Tuple[Dict[str, Any], ...]
+    raw_materials: Tuple[Dict[str, Any], ...]
+    brand_assets: Tuple[Dict[str, Any], ...]
+    financial_summary: Dict[str, Any]
+    versions: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def version_id(self) -> Optional[str]:
+        """Short hash of ``versions``: equal exactly when every table version is; None without version counters"""
+        if not self.versions:
+            return None
+        canonical = json.dumps(self.versions, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+    def get_team_member(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a team member by exact name"""
+        for member in self.team_members:
+            if member.get('name') == name:
+                return member
+        return None
+
+
 class ModelFactory:
-    """Factory for creating model instances from database rows"""
+    """Factory for creating model instances from database rows
+
+    Model fields follow table column order, so rows selected with
+    ``columns(model)`` can be passed positionally via ``from_row``.
+    """
+    
+    # Table each model is read from
+    TABLES = {
+        CompanyInfo: 'company_info',
+        TeamMember: 'team_members',
+        CapexItem: 'investment_capex',
+        ProductionTarget: 'production_targets',
+        Alloy: 'alloys_catalog',
+        FundingProgram: 'funding_programs',
+        Certification: 'certifications_roadmap',
+        BrandAsset: 'brand_assets',
+        Supplier: 'suppliers',
+        Equipment: 'equipment_machinery',
+    }
+    
+    @staticmethod
+    def columns(model: type) -> Tuple[str, ...]:
+        """Column names in positional constructor order"""
+        return model.__match_args__
+    
+    @staticmethod
+    def from_row(model: type, row: Tuple[Any, ...]):
+        """Build a model from a plain tuple row selected with columns(model)"""
+        return model(*row)
+    
+    @staticmethod
+    def from_rows(model: type, rows: List[Tuple[Any, ...]]) -> List[Any]:
+        return list(starmap(model, rows))
     
     @staticmethod
     def create_company_info(data: Dict[str, Any]) -> CompanyInfo:
@@ -189,4 +339,12 @@ class ModelFactory:
     
     @staticmethod
     def create_brand_asset(data: Dict[str, Any]) -> BrandAsset:
-        return BrandAsset(**data)
\ No newline at end of file
+        return BrandAsset(**data)
+    
+    @staticmethod
+    def create_supplier(data: Dict[str, Any]) -> Supplier:
+        return Supplier(**data)
+    
+    @staticmethod
+    def create_equipment(data: Dict[str, Any]) -> Equipment:
+        return Equipment(**data)
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+Content-addressed cache of rendered PDFs
+"""
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import reportlab
+
+logger = logging.getLogger(__name__)
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """Hard-link ``src`` to ``dst`` (no extra disk space), copying where links are not supported"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class RenderCache:
+    """
+    Rendered PDFs keyed by everything that determines their content.
+
+    The key hashes the generator class, the source of every generator module
+    it inherits from, the ReportLab version, the dataset versions the render
+    read and the render options. Entries live in ``cache_dir/<key>/`` as hard
+    links to the PDFs in the output directory, so a cached document costs no
+    extra disk space until its output file is deleted. That relies on output
+    files never being rewritten in place: generators write a new file and
+    os.replace() it over the old name, so a cached inode keeps its content.
+    Least recently used entries are evicted once the cache holds more than
+    ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Path, output_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.output_dir = Path(output_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._code_versions: Dict[type, str] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    def code_version(self, generator_class: type) -> str:
+        """Hash of the source of ``generator_class`` and its generator base classes"""
+        version = self._code_versions.get(generator_class)
+        if version is None:
+            digest = hashlib.sha256(reportlab.Version.encode())
+            for cls in generator_class.__mro__:
+                if cls.__module__.startswith('generators.'):
+                    digest.update(Path(inspect.getsourcefile(cls)).read_bytes())
+            version = self._code_versions[generator_class] = digest.hexdigest()
+        return version
+
+    def key(self, generator_class: type, db, options: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key for rendering ``generator_class`` from ``db``'s current data with ``options``"""
+        parts = {
+            'generator': f"{generator_class.__module__}.{generator_class.__qualname__}",
+            'code': self.code_version(generator_class),
+            'dataset': list(db.dataset_version()),
+            'options': options or {},
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+    def lookup(self, key: str, restore: bool = True) -> Optional[List[Path]]:
+        """Output paths of a cached render, re-linked into the output directory if deleted there
+
+        With ``restore=False`` the paths inside the cache entry are returned
+        and the output directory is left alone (for reading a render back
+        without publishing it).
+        """
+        entry = self.cache_dir / key
+        try:
+            cached = sorted(entry.glob('*.pdf'))
+        except OSError:
+            cached = []
+        if not cached:
+            with self._lock:
+                self._stats['misses'] += 1
+            return None
+
+        paths = cached
+        try:
+            if restore:
+                paths = []
+                for cached_path in cached:
+                    output_path = self.output_dir / cached_path.name
+                    if not (output_path.exists() and os.path.samefile(output_path, cached_path)):
+                        partial_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.partial")
+                        _link_or_copy(cached_path, partial_path)
+                        os.replace(partial_path, output_path)
+                    paths.append(output_path)
+            os.utime(entry)  # mtime orders eviction
+        except OSError as e:
+            # Evicted by another process mid-lookup; render again
+            logger.warning(f"Render cache entry {key} unusable: {e}")
+            with self._lock:
+                self._stats['misses'] += 1
+            return None
+
+        with self._lock:
+            self._stats['hits'] += 1
+        return paths
+
+    def entry_bytes(self, key: str) -> Optional[int]:
+        """Size of the PDFs cached under ``key``, or None; unlike lookup() not counted as a hit or miss"""
+        try:
+            sizes = [path.stat().st_size for path in (self.cache_dir / key).glob('*.pdf')]
+        except OSError:
+            return None
+        return sum(sizes) if sizes else None
+
+    def store(self, key: str, paths: List[Path]):
+        """Record the PDFs of a fresh render under ``key`` and evict old entries"""
+        if not paths:
+            return
+        entry = self.cache_dir / key
+        partial = self.cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.partial"
+        try:
+            partial.mkdir(parents=True)
+            for path in paths:
+                _link_or_copy(path, partial / path.name)
+            os.replace(partial, entry)
+        except OSError as e:
+            # Most likely a concurrent render stored the same key first
+            logger.debug(f"Render cache entry {key} not stored: {e}")
+            shutil.rmtree(partial, ignore_errors=True)
+            return
+
+        with self._lock:
+            self._stats['stores'] += 1
+        self.evict()
+
+    def _entries(self) -> List[tuple]:
+        """(mtime, bytes, path) per complete entry"""
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            try:
+                size = sum(path.stat().st_size for path in entry.iterdir())
+                entries.append((entry.stat().st_mtime, size, entry))
+            except OSError:
+                continue  # removed concurrently
+        return entries
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        if not self.cache_dir.exists():
+            return
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            evicted += 1
+        if evicted:
+            with self._lock:
+                self._stats['evictions'] += evicted
+
+    def clear(self):
+        """Remove every entry (output files stay where they are)"""
+        if self.cache_dir.exists():
+            for entry in self.cache_dir.iterdir():
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus current size"""
+        entries = self._entries() if self.cache_dir.exists() else []
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats.update(
+            hit_rate=round(stats['hits'] / lookups, 3) if lookups else 0.0,
+            entries=len(entries),
+            bytes=sum(size for _, size, _ in entries),
+            max_bytes=self.max_bytes,
+        )
+        return stats
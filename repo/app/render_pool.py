@@ -0,0 +1,405 @@
+"""
+Process pool that renders documents outside the Flask request threads
+"""
+import itertools
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).parent.resolve()
+
+
+def _generator(db, doc_name: str, output_dir: Path, profile: str, reports: Optional[list],
+               progress: Optional[Callable[..., None]]):
+    from generators.registry import GENERATORS
+
+    generator = GENERATORS[doc_name](db, output_dir, profile)
+    if reports is not None:
+        generator.collect_reports()
+    if progress is not None:
+        generator.on_progress(lambda event, **data: progress(event, document=doc_name, **data))
+    return generator
+
+
+def render_document(db, doc_name: str, output_dir: Path, member_name: Optional[str] = None,
+                    profile: str = 'standard', reports: Optional[list] = None,
+                    progress: Optional[Callable[..., None]] = None) -> List[Path]:
+    """Render one document type with ``db`` in PDF ``profile`` and return the PDFs written
+
+    ``individual_prep`` renders ``member_name``'s prep document, or one per
+    team member when no name is given. Pass a list as ``reports`` to have a
+    render report (see generators.base.RenderReport) appended per PDF, and
+    ``progress`` to receive the generator's progress events (see
+    BaseDocumentGenerator.on_progress), tagged with ``document=doc_name``.
+    """
+    generator = _generator(db, doc_name, output_dir, profile, reports, progress)
+    if doc_name != 'individual_prep':
+        paths = [generator.generate()]
+    elif member_name is None:
+        paths = generator.generate_all_members()
+    else:
+        output_path = generator.generate_for_member(member_name)
+        paths = [output_path] if output_path else []
+    if reports is not None:
+        reports.extend(generator.reports)
+    return paths
+
+
+def render_document_bytes(db, doc_name: str, output_dir: Path, member_name: Optional[str] = None,
+                          profile: str = 'standard', reports: Optional[list] = None,
+                          progress: Optional[Callable[..., None]] = None) -> Optional[Tuple[str, bytes]]:
+    """Render one document in memory and return (filename, PDF bytes) without writing it
+
+    ``individual_prep`` needs ``member_name``; None means that member was not found.
+    ``reports`` and ``progress`` work as for render_document().
+    """
+    if doc_name == 'individual_prep' and member_name is None:
+        raise ValueError("member_name is required to render individual_prep in memory")
+    generator = _generator(db, doc_name, output_dir, profile, reports, progress)
+    if doc_name != 'individual_prep':
+        rendered = generator.render_bytes()
+    else:
+        rendered = generator.render_bytes(lambda: generator.generate_for_member(member_name))
+    if reports is not None:
+        reports.extend(generator.reports)
+    return rendered
+
+
+# Worker process state, set up once by _init_worker
+_worker_output_dir: Optional[Path] = None
+_worker_dbs: Dict[tuple, object] = {}
+_WORKER_DB_LIMIT = 4  # immutable snapshots rotate; keep the newest few open
+_worker_events = None  # queue of (token, event, data) progress events back to the pool
+
+
+def _init_worker(output_dir: str, warm: bool, events=None):
+    """Pool initializer: import the generators and warm the per-process caches"""
+    global _worker_output_dir, _worker_events
+    if str(APP_DIR) not in sys.path:
+        sys.path.insert(0, str(APP_DIR))
+    _worker_output_dir = Path(output_dir)
+    _worker_events = events
+
+    import generators.registry  # noqa: F401  (imports every generator once)
+    if warm:
+        from generators.base import warm_caches
+        warm_caches()
+
+
+def _worker_db(db_path: str, mode: str):
+    """The worker's DatabaseManager for (db_path, mode), so its dataset cache survives between jobs"""
+    from database import DatabaseManager, dataset_cache
+
+    key = (db_path, mode)
+    db = _worker_dbs.pop(key, None)
+    if db is None:
+        db = DatabaseManager(db_path, mode=mode)
+    _worker_dbs[key] = db  # most recently used last
+    while len(_worker_dbs) > _WORKER_DB_LIMIT:
+        stale = _worker_dbs.pop(next(iter(_worker_dbs)))
+        dataset_cache.forget(stale._cache_key)
+        stale.close()
+    return db
+
+
+def _worker_progress(token: Optional[int]) -> Optional[Callable[..., None]]:
+    """Progress callback forwarding a job's events to the pool, or None when nobody listens"""
+    if token is None or _worker_events is None:
+        return None
+    return lambda event, **data: _worker_events.put((token, event, data))
+
+
+def _worker_done(token: Optional[int]):
+    """Tell the pool the job's last progress event has been sent (see RenderPool._release)"""
+    if token is not None and _worker_events is not None:
+        _worker_events.put((token, None, None))
+
+
+def _worker_render(doc_name: str, db_path: str, mode: str, member_name: Optional[str],
+                   profile: str, report: bool, token: Optional[int] = None) -> Tuple[List[str], List[dict]]:
+    db = _worker_db(db_path, mode)
+    reports = [] if report else None
+    try:
+        paths = render_document(db, doc_name, _worker_output_dir, member_name, profile, reports,
+                                _worker_progress(token))
+    finally:
+        _worker_done(token)
+    return [str(path) for path in paths], reports or []
+
+
+def _worker_render_bytes(doc_name: str, db_path: str, mode: str, member_name: Optional[str],
+                         profile: str, report: bool,
+                         token: Optional[int] = None) -> Tuple[Optional[Tuple[str, bytes]], List[dict]]:
+    db = _worker_db(db_path, mode)
+    reports = [] if report else None
+    try:
+        rendered = render_document_bytes(db, doc_name, _worker_output_dir, member_name, profile, reports,
+                                         _worker_progress(token))
+    finally:
+        _worker_done(token)
+    return rendered, reports or []
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+class RenderPool:
+    """
+    Persistent pool of render worker processes.
+
+    Workers are spawned (not forked, so no Flask or SQLite state is
+    inherited), import the generators once and warm the font, stylesheet and
+    logo caches before taking jobs. Each job names a database file and mode
+    rather than carrying a connection; a worker keeps its DatabaseManager per
+    file so the dataset cache carries over between jobs. After
+    ``max_jobs_per_worker`` jobs a worker is replaced with a fresh one.
+    Nothing is spawned until the first render (or ``start()``).
+    """
+
+    def __init__(self, output_dir: Path, workers: int = 2, max_jobs_per_worker: int = 50,
+                 warm: bool = True):
+        if workers < 1:
+            raise ValueError(f"RenderPool needs at least one worker, got {workers}")
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.warm = warm
+
+        self._lock = threading.RLock()  # shutdown(cancel_futures=True) runs _job_done inline
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._closed = False
+        self._stats = {'submitted': 0, 'active': 0, 'completed': 0, 'failed': 0, 'restarts': 0}
+
+        # Progress events from workers, dispatched to listeners by job token
+        self._events = None
+        self._listeners: Dict[int, Tuple[Callable[..., None], threading.Event]] = {}
+        self._tokens = itertools.count(1)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        kwargs = {}
+        if self.max_jobs_per_worker:
+            if sys.version_info >= (3, 11):
+                kwargs['max_tasks_per_child'] = self.max_jobs_per_worker
+            else:
+                logger.warning("Render worker recycling needs Python 3.11+; workers will not be replaced")
+        context = multiprocessing.get_context('spawn')
+        if self._events is None:
+            # Handed to workers as they start; one queue outlives executor restarts
+            self._events = context.Queue()
+            threading.Thread(target=self._dispatch_events, name='render-pool-events', daemon=True).start()
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(str(self.output_dir), self.warm, self._events),
+            **kwargs,
+        )
+
+    def _dispatch_events(self):
+        """Deliver workers' progress events to the listener registered for each job token"""
+        while True:
+            item = self._events.get()
+            if item is None:
+                return
+            token, event, data = item
+            listener = self._listeners.get(token)
+            if listener is None:
+                continue
+            progress, finished = listener
+            if event is None:
+                finished.set()
+                continue
+            try:
+                progress(event, **data)
+            except Exception as e:
+                logger.warning(f"Progress listener failed on {event}: {str(e)}")
+
+    def _release(self, future: Future, timeout: float = 2.0):
+        """Wait until the finished job's progress events are delivered, then drop its listener
+
+        Events travel on their own queue, so they can trail the job's result.
+        """
+        token = getattr(future, 'progress_token', None)
+        listener = self._listeners.get(token) if token is not None else None
+        if listener is None:
+            return
+        # A cancelled job never ran and a dead worker sends nothing more
+        if not future.cancelled() and not isinstance(future.exception(), BrokenProcessPool):
+            listener[1].wait(timeout)
+        self._listeners.pop(token, None)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Running executor, replacing one whose worker died (caller holds _lock)"""
+        if self._closed:
+            raise RuntimeError("Render pool is shut down")
+        # A worker that dies (crash, OOM kill) marks the whole executor broken
+        if self._executor is not None and self._executor._broken:
+            logger.warning("Render worker died; restarting the render pool")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._stats['restarts'] += 1
+        if self._executor is None:
+            self._executor = self._new_executor()
+            # Each submit finds no idle worker and spawns one, up to `workers`,
+            # so every worker starts warming up before the first job lands
+            for _ in range(self.workers):
+                self._executor.submit(_worker_ready)
+            logger.info(f"Render pool started: {self.workers} workers, "
+                        f"recycled after {self.max_jobs_per_worker or 'unlimited'} jobs")
+        return self._executor
+
+    def start(self):
+        """Spawn every worker now instead of on the first render (returns without waiting for warm-up)"""
+        with self._lock:
+            self._get_executor()
+
+    def submit(self, doc_name: str, db, member_name: Optional[str] = None,
+               in_memory: bool = False, profile: str = 'standard', report: bool = False,
+               progress: Optional[Callable[..., None]] = None) -> Future:
+        """Queue a render using ``db``'s file and mode, in PDF ``profile``
+
+        The future resolves to ``(result, reports)``: the PDF paths, or with
+        ``in_memory`` (filename, PDF bytes) of a render that was never
+        written to disk, and with ``report`` a render report per PDF.
+        ``progress`` receives the worker's progress events (as for
+        render_document()) on the pool's event thread; call ``_release(future)``
+        once the future is done so none are still in flight.
+        """
+        worker = _worker_render_bytes if in_memory else _worker_render
+        with self._lock:
+            executor = self._get_executor()
+            token = None
+            if progress is not None:
+                token = next(self._tokens)
+                self._listeners[token] = (progress, threading.Event())
+            future = executor.submit(
+                worker, doc_name, str(db.db_path), db.mode, member_name, profile, report, token
+            )
+            future.progress_token = token
+            self._stats['submitted'] += 1
+            self._stats['active'] += 1
+        future.add_done_callback(self._job_done)
+        return future
+
+    def _job_done(self, future: Future):
+        with self._lock:
+            self._stats['active'] -= 1
+            if future.cancelled():
+                return
+            if future.exception() is None:
+                self._stats['completed'] += 1
+            else:
+                self._stats['failed'] += 1
+
+    def _result(self, future: Future, timeout: Optional[float] = None):
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            if future.done():
+                self._release(future)
+            else:
+                self._listeners.pop(future.progress_token, None)
+
+    def _wait(self, doc_name: str, db, member_name: Optional[str], timeout: Optional[float],
+              reports: Optional[list], **options):
+        """Submit and wait for the result, retried once on a new worker if the worker dies"""
+        try:
+            result, worker_reports = self._result(
+                self.submit(doc_name, db, member_name, report=reports is not None, **options), timeout)
+        except BrokenProcessPool:
+            logger.warning(f"Render worker died while rendering {doc_name}; retrying on a new worker")
+            result, worker_reports = self._result(
+                self.submit(doc_name, db, member_name, report=reports is not None, **options), timeout)
+        if reports is not None:
+            reports.extend(worker_reports)
+        return result
+
+    def render(self, doc_name: str, db, member_name: Optional[str] = None,
+               timeout: Optional[float] = None, profile: str = 'standard',
+               reports: Optional[list] = None, progress: Optional[Callable[..., None]] = None) -> List[Path]:
+        """Render in a worker and wait for the PDF paths (``reports``, ``progress`` as for render_document())"""
+        paths = self._wait(doc_name, db, member_name, timeout, reports, profile=profile, progress=progress)
+        return [Path(path) for path in paths]
+
+    def render_bytes(self, doc_name: str, db, member_name: Optional[str] = None,
+                     timeout: Optional[float] = None, profile: str = 'standard',
+                     reports: Optional[list] = None,
+                     progress: Optional[Callable[..., None]] = None) -> Optional[Tuple[str, bytes]]:
+        """Render in a worker without writing to disk and wait for (filename, PDF bytes)"""
+        return self._wait(doc_name, db, member_name, timeout, reports, profile=profile, in_memory=True,
+                          progress=progress)
+
+    def render_each(self, doc_names: Iterable[str], db, timeout: Optional[float] = None,
+                    profile: str = 'standard', report: bool = False,
+                    progress: Optional[Callable[..., None]] = None
+                    ) -> Iterator[Tuple[str, Optional[List[Path]], Optional[list], Optional[Exception]]]:
+        """
+        Render ``doc_names`` concurrently, one per worker, all reading ``db``.
+
+        Yields ``(doc_name, paths, reports, error)`` as each document finishes,
+        in completion order. A document whose worker died is retried once on
+        a new worker; one that fails, or is still unfinished ``timeout``
+        seconds after the batch started, is yielded with its error.
+        ``progress`` receives every document's progress events.
+        """
+        futures = {self.submit(doc_name, db, profile=profile, report=report, progress=progress): doc_name
+                   for doc_name in doc_names}
+        retried = set()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while futures:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            try:
+                for future in as_completed(list(futures), timeout=remaining):
+                    doc_name = futures.pop(future)
+                    self._release(future)
+                    try:
+                        paths, worker_reports = future.result()
+                    except BrokenProcessPool as e:
+                        if doc_name in retried:
+                            yield doc_name, None, None, e
+                        else:
+                            logger.warning(f"Render worker died while rendering {doc_name}; retrying on a new worker")
+                            retried.add(doc_name)
+                            futures[self.submit(doc_name, db, profile=profile, report=report,
+                                                progress=progress)] = doc_name
+                    except Exception as e:
+                        yield doc_name, None, None, e
+                    else:
+                        yield doc_name, [Path(path) for path in paths], worker_reports, None
+            except FuturesTimeout:
+                for future, doc_name in futures.items():
+                    future.cancel()
+                    self._listeners.pop(future.progress_token, None)
+                    yield doc_name, None, None, TimeoutError(f"{doc_name} did not render within {timeout:g}s")
+                return
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, workers=self.workers, max_jobs_per_worker=self.max_jobs_per_worker)
+
+    def close(self, wait: bool = True):
+        """Stop accepting jobs, drop queued ones and let running renders finish"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("Render pool shut down")
+        if self._events is not None:
+            try:
+                self._events.put(None)  # stops the event thread
+            except RuntimeError:
+                pass  # at interpreter exit (atexit) the queue cannot start its feeder; the thread is a daemon
@@ -14,8 +14,12 @@ data_bp = Blueprint('data', __name__, url_prefix='/api/data')
 logger = logging.getLogger(__name__)
 
 def get_db():
-    """Get database manager instance"""
-    return DatabaseManager(Config.DATABASE_PATH)
+    """Get the app's pooled database manager, pinning one connection for this request"""
+    db = current_app.extensions.get('fluxgen_db')
+    if db is None:
+        return DatabaseManager(Config.DATABASE_PATH)
+    db.pool.pin()
+    return db
 
 @data_bp.route('/company', methods=['GET'])
 def get_company():
@@ -164,6 +168,41 @@ def update_production(target_id):
         logger.error(f"Error updating production target: {str(e)}")
         return jsonify({'error': 'Failed to update production target'}), 500
 
+# API names accepted by PATCH /api/data/<table> and the tables they update
+BULK_UPDATE_TABLES = {
+    'company': 'company_info',
+    'team': 'team_members',
+    'capex': 'investment_capex',
+    'production': 'production_targets',
+}
+
+@data_bp.route('/<table>', methods=['PATCH'])
+def bulk_update(table):
+    """Apply a list of row changes atomically: {"rows": [{"id": 1, "column": value}, ...]}"""
+    try:
+        if table not in BULK_UPDATE_TABLES:
+            return jsonify({'error': f'Bulk updates are not supported for {table}'}), 404
+
+        data = request.get_json(silent=True)
+        rows = data.get('rows') if isinstance(data, dict) else None
+        if not isinstance(rows, list) or not rows:
+            return jsonify({'error': 'A non-empty "rows" list is required'}), 400
+        
+        db = get_db()
+        outcome = db.bulk_update(BULK_UPDATE_TABLES[table], rows)
+        results = outcome['results']
+        if outcome['applied']:
+            return jsonify({
+                'message': f'{len(results)} rows updated successfully',
+                'results': results
+            })
+        if any(r['status'] == 'invalid' for r in results):
+            return jsonify({'error': 'Invalid rows; nothing was updated', 'results': results}), 400
+        return jsonify({'error': 'Some rows were not found; nothing was updated', 'results': results}), 404
+    except Exception as e:
+        logger.error(f"Error bulk updating {table}: {str(e)}")
+        return jsonify({'error': f'Failed to update {table}'}), 500
+
 @data_bp.route('/alloys', methods=['GET'])
 def get_alloys():
     """Get alloys catalog"""
@@ -0,0 +1,33 @@
+"""
+Debug routes for FluxGen application
+"""
+from flask import Blueprint, request, jsonify
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import query_tracer
+import logging
+
+debug_bp = Blueprint('debug', __name__, url_prefix='/api/debug')
+logger = logging.getLogger(__name__)
+
+@debug_bp.route('/queries', methods=['GET'])
+def get_query_stats():
+    """Aggregated per-statement SQLite timings for this process (needs DB_TRACE_QUERIES)"""
+    try:
+        limit = request.args.get('limit', type=int)
+        return jsonify(query_tracer.get_stats(limit))
+    except Exception as e:
+        logger.error(f"Error getting query stats: {str(e)}")
+        return jsonify({'error': 'Failed to retrieve query stats'}), 500
+
+@debug_bp.route('/queries', methods=['DELETE'])
+def reset_query_stats():
+    """Clear collected query stats"""
+    try:
+        query_tracer.reset()
+        return jsonify({'message': 'Query stats cleared'})
+    except Exception as e:
+        logger.error(f"Error clearing query stats: {str(e)}")
+        return jsonify({'error': 'Failed to clear query stats'}), 500
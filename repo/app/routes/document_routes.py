@@ -1,8 +1,10 @@
 """
 Document generation routes for FluxGen application
 """
-from flask import Blueprint, request, jsonify, send_file, current_app
+from flask import Blueprint, Response, request, jsonify, send_file, current_app, url_for
 from pathlib import Path
+import io
+import json
 import os
 import logging
 from datetime import datetime
@@ -10,46 +12,282 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from bundle import latest_documents, stream_zip
 from config import Config
 from database import DatabaseManager
-
-# Import document generators
-from generators.executive_summary import ExecutiveSummaryGenerator
-from generators.business_plan import BusinessPlanGenerator
-from generators.financial_projections import FinancialProjectionsGenerator
-from generators.market_analysis import MarketAnalysisGenerator
-from generators.technical_specs import TechnicalSpecsGenerator
-from generators.team_bios import TeamBiosGenerator
-from generators.site_requirements import SiteRequirementsGenerator
-from generators.pitch_deck import PitchDeckGenerator
-from generators.individual_prep import IndividualPrepGenerator
+from generators.base import PDF_PROFILES
+from generators.registry import GENERATORS
+from jobs import Job, QueueClosed, QueueFull, RUNNING, DONE, FAILED
+from manifest import manifest_for
+from render_pool import render_document, render_document_bytes
 
 doc_bp = Blueprint('documents', __name__, url_prefix='/api/documents')
 logger = logging.getLogger(__name__)
 
 def get_db():
-    """Get database manager instance"""
-    return DatabaseManager(Config.DATABASE_PATH)
-
-# Document generator mapping
-GENERATORS = {
-    'executive_summary': ExecutiveSummaryGenerator,
-    'business_plan': BusinessPlanGenerator, 
-    'financial_projections': FinancialProjectionsGenerator,
-    'market_analysis': MarketAnalysisGenerator,
-    'technical_specs': TechnicalSpecsGenerator,
-    'team_bios': TeamBiosGenerator,
-    'site_requirements': SiteRequirementsGenerator,
-    'pitch_deck': PitchDeckGenerator,
-    'individual_prep': IndividualPrepGenerator
-}
+    """Get the database manager generators read from (see Config.GENERATION_DB_MODE)"""
+    snapshots = current_app.extensions.get('fluxgen_snapshots')
+    if snapshots is not None and current_app.config.get('GENERATION_DB_MODE') == 'immutable':
+        return snapshots.reader()
+    db = current_app.extensions.get('fluxgen_generation_db') or current_app.extensions.get('fluxgen_db')
+    if db is None:
+        return DatabaseManager(Config.DATABASE_PATH)
+    db.pool.pin()
+    return db
+
+def get_batch_db():
+    """
+    Get the database manager every document of one batch reads: a frozen snapshot copy, opened immutable.
+
+    Generators each load their own dataset, in this thread or in a render
+    worker, so reading the live database would let a write landing mid-batch
+    leave the batch built from two dataset versions. The snapshot is only
+    copied again once the live data has changed.
+    """
+    snapshots = current_app.extensions.get('fluxgen_snapshots')
+    if snapshots is None:
+        return get_db()
+    return snapshots.reader()
+
+def restore_cached(paths):
+    """List cached renders re-linked into OUTPUT_DIR again (the manifest may have them as deleted)"""
+    try:
+        manifest_for(Config.OUTPUT_DIR).restore(paths)
+    except Exception as e:
+        logger.warning(f"Could not restore {len(paths)} cached files in the output manifest: {str(e)}")
+    return paths
+
+def render_documents(doc_name, member_name=None, profile='standard', reports=None, db=None, progress=None):
+    """
+    Render ``doc_name`` in PDF ``profile``, reusing a cached render of the same code, data and options.
+
+    Returns ``(paths, cached)``. Renders run in the render pool when one is
+    running, else in this thread. Pass a list as ``reports`` to have a render
+    report (see generators.base.RenderReport) appended per PDF; that always
+    renders, since a cached PDF has nothing to time. ``progress`` receives the
+    generators' progress events (see BaseDocumentGenerator.on_progress), such
+    as a job's ``emit``. ``db`` defaults to get_db().
+    """
+    db = db or get_db()
+    cache = current_app.extensions.get('fluxgen_render_cache')
+    if cache is not None:
+        key = cache.key(GENERATORS[doc_name], db, {'member_name': member_name, 'profile': profile})
+        paths = cache.lookup(key) if reports is None else None
+        if paths is not None:
+            return restore_cached(paths), True
+
+    pool = current_app.extensions.get('fluxgen_render_pool')
+    if pool is not None:
+        paths = pool.render(doc_name, db, member_name=member_name, timeout=Config.RENDER_TIMEOUT,
+                            profile=profile, reports=reports, progress=progress)
+    else:
+        paths = render_document(db, doc_name, Config.OUTPUT_DIR, member_name=member_name, profile=profile,
+                                reports=reports, progress=progress)
+    if cache is not None:
+        cache.store(key, paths)
+    return paths, False
+
+def render_batch(doc_names, profile='standard', report=False, progress=None):
+    """
+    Render several documents from one database snapshot, concurrently when the render pool is running.
+
+    Yields ``(doc_name, paths, cached, reports, error)`` as each document
+    finishes: cached renders first, then the rest in completion order, one
+    document per render worker. Without a pool they render one after another
+    in this thread. ``reports`` is a list of render reports with ``report``,
+    else None; a failed document carries its exception in ``error``.
+    ``progress`` is as for render_documents().
+    """
+    # One frozen snapshot for the whole batch, whichever worker renders each document
+    db = get_batch_db()
+    pool = current_app.extensions.get('fluxgen_render_pool')
+    if pool is None:
+        for doc_name in doc_names:
+            reports = [] if report else None
+            try:
+                paths, cached = render_documents(doc_name, profile=profile, reports=reports, db=db,
+                                                 progress=progress)
+            except Exception as e:
+                yield doc_name, None, False, None, e
+            else:
+                yield doc_name, paths, cached, reports, None
+        return
+
+    cache = current_app.extensions.get('fluxgen_render_cache')
+    keys = {}
+    pending = []
+    for doc_name in doc_names:
+        if cache is not None:
+            keys[doc_name] = cache.key(GENERATORS[doc_name], db, {'member_name': None, 'profile': profile})
+            paths = cache.lookup(keys[doc_name]) if not report else None
+            if paths is not None:
+                yield doc_name, restore_cached(paths), True, None, None
+                continue
+        pending.append(doc_name)
+
+    for doc_name, paths, reports, error in pool.render_each(pending, db, timeout=Config.RENDER_TIMEOUT,
+                                                            profile=profile, report=report, progress=progress):
+        if error is None and cache is not None:
+            cache.store(keys[doc_name], paths)
+        yield doc_name, paths, False, reports, error
+
+def render_in_memory(doc_name, member_name=None, profile='standard'):
+    """
+    Render ``doc_name`` without writing it to OUTPUT_DIR.
+
+    Returns ``(filename, pdf_bytes, cached)``, or None when individual_prep's
+    member does not exist. A cached render of the same code, data and options
+    is read back from the render cache; otherwise the PDF is built in memory
+    (in the render pool when one is running) and is neither saved nor cached.
+    """
+    db = get_db()
+    cache = current_app.extensions.get('fluxgen_render_cache')
+    if cache is not None:
+        key = cache.key(GENERATORS[doc_name], db, {'member_name': member_name, 'profile': profile})
+        paths = cache.lookup(key, restore=False)
+        if paths is not None:
+            try:
+                return paths[0].name, paths[0].read_bytes(), True
+            except OSError:
+                pass  # evicted since the lookup; render instead
+
+    pool = current_app.extensions.get('fluxgen_render_pool')
+    if pool is not None:
+        rendered = pool.render_bytes(doc_name, db, member_name=member_name, timeout=Config.RENDER_TIMEOUT,
+                                     profile=profile)
+    else:
+        rendered = render_document_bytes(db, doc_name, Config.OUTPUT_DIR, member_name=member_name,
+                                         profile=profile)
+    if rendered is None:
+        return None
+    filename, pdf = rendered
+    return filename, pdf, False
+
+def bytes_saved(doc_name, size, member_name=None, profile='standard'):
+    """
+    Bytes a ``profile`` render of ``size`` bytes saves over the standard render.
+
+    Compared with the standard render of the same code and data in the
+    render cache; None for the standard profile or when that render is not
+    cached (no extra render is made just to measure).
+    """
+    cache = current_app.extensions.get('fluxgen_render_cache')
+    if profile == 'standard' or cache is None:
+        return None
+    key = cache.key(GENERATORS[doc_name], get_db(), {'member_name': member_name, 'profile': 'standard'})
+    standard_size = cache.entry_bytes(key)
+    if standard_size is None:
+        return None
+    return standard_size - size
+
+def request_profile():
+    """PDF profile named by the request's ``profile`` option (JSON body or query), else Config.PDF_PROFILE"""
+    data = request.get_json(silent=True) if request.is_json else None
+    return (data or {}).get('profile') or request.args.get('profile') or Config.PDF_PROFILE
+
+def request_reports():
+    """A list to collect render reports in when the request sets ``report`` (JSON body or query), else None"""
+    data = request.get_json(silent=True) if request.is_json else None
+    return [] if _flag((data or {}).get('report') or request.args.get('report', False)) else None
+
+def unknown_profile_error(profile):
+    return jsonify({'error': f"Unknown PDF profile: {profile} (choose from {', '.join(PDF_PROFILES)})"}), 400
+
+def _flag(value):
+    """Boolean request option given as JSON true/false or a 1/true/yes query string"""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ('1', 'true', 'yes')
+
+@doc_bp.route('/render/<doc_name>', methods=['GET', 'POST'])
+def stream_document(doc_name):
+    """
+    Render a document and return the PDF itself in the response.
+
+    Options (query string, or JSON body on POST): ``member_name`` for
+    individual_prep, ``profile`` (see PDF_PROFILES), ``save`` to also keep
+    the PDF in OUTPUT_DIR as /generate does, and ``download`` to send it as
+    an attachment instead of inline for previews.
+    """
+    try:
+        if doc_name not in GENERATORS:
+            return jsonify({'error': f'Unknown document type: {doc_name}'}), 400
+
+        options = dict(request.args)
+        if request.method == 'POST':
+            options.update(request.get_json(silent=True) or {})
+        member_name = options.get('member_name')
+        if doc_name == 'individual_prep' and not member_name:
+            return jsonify({'error': 'member_name parameter required for individual_prep'}), 400
+        if doc_name != 'individual_prep':
+            member_name = None
+        profile = options.get('profile') or Config.PDF_PROFILE
+        if profile not in PDF_PROFILES:
+            return unknown_profile_error(profile)
+
+        if _flag(options.get('save', False)):
+            output_paths, cached = render_documents(doc_name, member_name=member_name, profile=profile)
+            rendered = (output_paths[0].name, output_paths[0].read_bytes(), cached) if output_paths else None
+        else:
+            rendered = render_in_memory(doc_name, member_name=member_name, profile=profile)
+        if rendered is None:
+            return jsonify({'error': f'Team member not found: {member_name}'}), 404
+
+        filename, pdf, cached = rendered
+        saved = bytes_saved(doc_name, len(pdf), member_name=member_name, profile=profile)
+        logger.info(f"Document rendered for streaming: {filename} ({len(pdf)} bytes, {profile} profile, "
+                    f"cached={cached}, saved={saved})")
+        response = send_file(
+            io.BytesIO(pdf),
+            mimetype='application/pdf',
+            as_attachment=_flag(options.get('download', False)),
+            download_name=filename
+        )
+        response.headers['X-Render-Cached'] = 'true' if cached else 'false'
+        response.headers['X-PDF-Profile'] = profile
+        if saved is not None:
+            response.headers['X-Bytes-Saved'] = str(saved)
+        return response
+
+    except Exception as e:
+        logger.error(f"Error rendering document {doc_name}: {str(e)}")
+        return jsonify({'error': f'Failed to render {doc_name}: {str(e)}'}), 500
+
+def start_job(kind, target, **params):
+    """
+    Run ``target(job)`` as a background job and answer 202 with the job's ID.
+
+    Poll /jobs/<id> (or follow /jobs/<id>/events) for its status and, once
+    done, the response body the target returned. Without a job queue (JOB_WORKERS = 0) the target runs
+    in this request and that body is returned directly.
+    """
+    queue = current_app.extensions.get('fluxgen_jobs')
+    if queue is None:
+        return jsonify(target(Job(kind, params))), 200
+    try:
+        job = queue.submit(kind, target, **params)
+    except QueueFull as e:
+        return jsonify({'error': f'Generation queue is full ({str(e)}), try again shortly'}), 503
+    except QueueClosed:
+        return jsonify({'error': 'Generation queue is shutting down, try again shortly'}), 503
+    return jsonify({
+        'message': f'{kind} queued',
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': url_for('documents.get_job', job_id=job.id),
+        'events_url': url_for('documents.stream_job_events', job_id=job.id)
+    }), 202
 
 @doc_bp.route('/generate/<doc_name>', methods=['POST'])
 def generate_document(doc_name):
-    """Generate a single PDF document"""
+    """Queue generation of a single PDF document"""
     try:
         if doc_name not in GENERATORS:
             return jsonify({'error': f'Unknown document type: {doc_name}'}), 400
+        profile = request_profile()
+        if profile not in PDF_PROFILES:
+            return unknown_profile_error(profile)
+        reports = request_reports()
         
         # Special handling for individual_prep - requires member_name parameter
         if doc_name == 'individual_prep':
@@ -59,44 +297,58 @@ def generate_document(doc_name):
             if not member_name:
                 return jsonify({'error': 'member_name parameter required for individual_prep'}), 400
             
-            db = get_db()
-            generator = IndividualPrepGenerator(db, Config.OUTPUT_DIR)
-            
-            logger.info(f"Individual prep document generation started for: {member_name}")
-            output_path = generator.generate_for_member(member_name)
+            def generate_prep(job):
+                logger.info(f"Individual prep document generation started for: {member_name}")
+                output_paths, cached = render_documents(doc_name, member_name=member_name, profile=profile,
+                                                        reports=reports, progress=job.emit)
+                
+                if not output_paths:
+                    raise RuntimeError(f'Failed to generate prep document for {member_name}')
+                
+                output_path = output_paths[0]
+                filename = output_path.name
+                file_size = output_path.stat().st_size
+                logger.info(f"Individual prep document generated successfully: {filename}")
+                
+                return {
+                    'message': f'Prep document for {member_name} generated successfully',
+                    'filename': filename,
+                    'status': 'completed',
+                    'cached': cached,
+                    'profile': profile,
+                    'file_size': file_size,
+                    'bytes_saved': bytes_saved(doc_name, file_size, member_name=member_name, profile=profile),
+                    'report': reports[0] if reports else None
+                }
             
-            if not output_path:
-                return jsonify({'error': f'Failed to generate prep document for {member_name}'}), 500
+            return start_job('generate', generate_prep, document=doc_name, member_name=member_name,
+                             profile=profile)
+        
+        def generate(job):
+            logger.info(f"Document generation started for: {doc_name}")
             
+            # Generate the document
+            (output_path,), cached = render_documents(doc_name, profile=profile, reports=reports,
+                                                      progress=job.emit)
             filename = output_path.name
-            logger.info(f"Individual prep document generated successfully: {filename}")
+            file_size = output_path.stat().st_size
+            saved = bytes_saved(doc_name, file_size, profile=profile)
             
-            return jsonify({
-                'message': f'Prep document for {member_name} generated successfully',
+            logger.info(f"Document generated successfully: {filename}" +
+                        (f" ({profile} profile, {saved} bytes saved)" if saved is not None else ""))
+            
+            return {
+                'message': f'{Config.DOCUMENTS[doc_name]} generated successfully',
                 'filename': filename,
                 'status': 'completed',
-                'file_size': output_path.stat().st_size
-            }), 200
+                'cached': cached,
+                'profile': profile,
+                'file_size': file_size,
+                'bytes_saved': saved,
+                'report': reports[0] if reports else None
+            }
         
-        # Get database manager and initialize generator
-        db = get_db()
-        generator_class = GENERATORS[doc_name]
-        generator = generator_class(db, Config.OUTPUT_DIR)
-        
-        logger.info(f"Document generation started for: {doc_name}")
-        
-        # Generate the document
-        output_path = generator.generate()
-        filename = output_path.name
-        
-        logger.info(f"Document generated successfully: {filename}")
-        
-        return jsonify({
-            'message': f'{Config.DOCUMENTS[doc_name]} generated successfully',
-            'filename': filename,
-            'status': 'completed',
-            'file_size': output_path.stat().st_size
-        }), 200
+        return start_job('generate', generate, document=doc_name, profile=profile)
         
     except Exception as e:
         logger.error(f"Error generating document {doc_name}: {str(e)}")
@@ -104,29 +356,40 @@ def generate_document(doc_name):
 
 @doc_bp.route('/generate-all-prep', methods=['POST'])
 def generate_all_prep_documents():
-    """Generate prep documents for all team members"""
+    """Queue generation of prep documents for all team members"""
     try:
-        db = get_db()
-        generator = IndividualPrepGenerator(db, Config.OUTPUT_DIR)
-        
-        logger.info("Generating prep documents for all team members")
-        output_paths = generator.generate_all_members()
+        profile = request_profile()
+        if profile not in PDF_PROFILES:
+            return unknown_profile_error(profile)
+        reports = request_reports()
         
-        generated_files = []
-        for output_path in output_paths:
-            generated_files.append({
-                'filename': output_path.name,
-                'status': 'completed',
-                'file_size': output_path.stat().st_size
-            })
-        
-        logger.info(f"All prep documents generated successfully: {len(generated_files)} files")
+        def generate_all_prep(job):
+            logger.info("Generating prep documents for all team members")
+            output_paths, cached = render_documents('individual_prep', profile=profile, reports=reports,
+                                                    progress=job.emit)
+            
+            generated_files = []
+            for i, output_path in enumerate(output_paths):
+                generated_files.append({
+                    'filename': output_path.name,
+                    'status': 'completed',
+                    'file_size': output_path.stat().st_size,
+                    'report': reports[i] if reports else None
+                })
+            
+            logger.info(f"All prep documents generated successfully: {len(generated_files)} files")
+            
+            total_size = sum(f['file_size'] for f in generated_files)
+            return {
+                'message': 'All prep documents generated successfully',
+                'generated': generated_files,
+                'total_generated': len(generated_files),
+                'cached': cached,
+                'profile': profile,
+                'bytes_saved': bytes_saved('individual_prep', total_size, profile=profile)
+            }
         
-        return jsonify({
-            'message': 'All prep documents generated successfully',
-            'generated': generated_files,
-            'total_generated': len(generated_files)
-        }), 200
+        return start_job('generate-all-prep', generate_all_prep, document='individual_prep', profile=profile)
         
     except Exception as e:
         logger.error(f"Error generating all prep documents: {str(e)}")
@@ -134,49 +397,66 @@ def generate_all_prep_documents():
 
 @doc_bp.route('/generate-all', methods=['POST'])
 def generate_all_documents():
-    """Generate all PDF documents"""
+    """Queue generation of all PDF documents"""
     try:
-        generated_files = []
-        errors = []
-        
-        # Get database manager
-        db = get_db()
+        profile = request_profile()
+        if profile not in PDF_PROFILES:
+            return unknown_profile_error(profile)
+        report = request_reports() is not None
         
         # Skip individual_prep from bulk generation as it requires special handling
         generators_to_run = {k: v for k, v in GENERATORS.items() if k != 'individual_prep'}
         
-        for doc_name in generators_to_run.keys():
-            try:
-                logger.info(f"Generating document: {doc_name}")
-                
-                # Initialize generator and create document
-                generator_class = generators_to_run[doc_name]
-                generator = generator_class(db, Config.OUTPUT_DIR)
-                output_path = generator.generate()
-                
-                generated_files.append({
-                    'document': doc_name,
-                    'filename': output_path.name,
-                    'status': 'completed',
-                    'file_size': output_path.stat().st_size
-                })
-                
-            except Exception as e:
-                logger.error(f"Error generating {doc_name}: {str(e)}")
-                errors.append({
-                    'document': doc_name,
-                    'error': str(e)
-                })
-        
-        logger.info(f"Bulk document generation completed: {len(generated_files)} successful, {len(errors)} errors")
+        def generate_all(job):
+            generated_files = []
+            errors = []
+            job.update(completed=0, total=len(generators_to_run), current=None)
+            logger.info(f"Generating documents: {', '.join(generators_to_run)}")
+            
+            # Documents render concurrently in the render pool and are collected as each finishes
+            for doc_name, output_paths, cached, reports, error in render_batch(generators_to_run, profile=profile,
+                                                                               report=report, progress=job.emit):
+                try:
+                    if error is not None:
+                        raise error
+                    (output_path,) = output_paths
+                    file_size = output_path.stat().st_size
+                    
+                    generated_files.append({
+                        'document': doc_name,
+                        'filename': output_path.name,
+                        'status': 'completed',
+                        'cached': cached,
+                        'file_size': file_size,
+                        'bytes_saved': bytes_saved(doc_name, file_size, profile=profile),
+                        'report': reports[0] if reports else None
+                    })
+                    
+                except Exception as e:
+                    logger.error(f"Error generating {doc_name}: {str(e)}")
+                    errors.append({
+                        'document': doc_name,
+                        'error': str(e)
+                    })
+                job.update(completed=len(generated_files) + len(errors), current=doc_name)
+            
+            # Report in the usual document order, not completion order
+            order = list(generators_to_run)
+            generated_files.sort(key=lambda f: order.index(f['document']))
+            errors.sort(key=lambda e: order.index(e['document']))
+            
+            logger.info(f"Bulk document generation completed: {len(generated_files)} successful, {len(errors)} errors")
+            
+            return {
+                'message': 'Bulk document generation completed',
+                'generated': generated_files,
+                'errors': errors,
+                'total_generated': len(generated_files),
+                'total_errors': len(errors),
+                'profile': profile
+            }
         
-        return jsonify({
-            'message': 'Bulk document generation completed',
-            'generated': generated_files,
-            'errors': errors,
-            'total_generated': len(generated_files),
-            'total_errors': len(errors)
-        }), 200
+        return start_job('generate-all', generate_all, profile=profile)
         
     except Exception as e:
         logger.error(f"Error in bulk document generation: {str(e)}")
@@ -202,31 +482,80 @@ def download_document(filename):
         logger.error(f"Error downloading file {filename}: {str(e)}")
         return jsonify({'error': 'Failed to download file'}), 500
 
+@doc_bp.route('/bundle', methods=['GET'])
+def download_bundle():
+    """
+    Download the newest PDF of each document type as one ZIP, streamed as it is written.
+
+    Options: ``documents``, a comma-separated list of document types (default
+    every document except individual_prep; individual_prep adds the newest
+    prep document of each team member), and ``profile`` (see PDF_PROFILES).
+    Types with no generated PDF are left out and named in ``X-Bundle-Missing``.
+    """
+    try:
+        requested = request.args.get('documents')
+        doc_names = [name.strip() for name in requested.split(',') if name.strip()] if requested else \
+            [name for name in GENERATORS if name != 'individual_prep']
+        unknown = [name for name in doc_names if name not in GENERATORS]
+        if unknown:
+            return jsonify({'error': f"Unknown document type: {', '.join(unknown)}"}), 400
+        profile = request.args.get('profile') or Config.PDF_PROFILE
+        if profile not in PDF_PROFILES:
+            return unknown_profile_error(profile)
+
+        latest = latest_documents(Config.OUTPUT_DIR, doc_names, profile=profile)
+        paths = [path for doc_name in doc_names for path in latest[doc_name]]
+        missing = [doc_name for doc_name in doc_names if not latest[doc_name]]
+        if not paths:
+            return jsonify({'error': 'No generated documents to bundle', 'missing': missing}), 404
+
+        filename = f"fluxgen_documents_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        logger.info(f"Streaming bundle {filename}: {len(paths)} files ({profile} profile)")
+        response = Response(stream_zip(paths), mimetype='application/zip', direct_passthrough=True)
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response.headers['X-Bundle-Files'] = str(len(paths))
+        if missing:
+            response.headers['X-Bundle-Missing'] = ','.join(missing)
+        return response
+
+    except Exception as e:
+        logger.error(f"Error bundling documents: {str(e)}")
+        return jsonify({'error': f'Failed to bundle documents: {str(e)}'}), 500
+
 @doc_bp.route('/list', methods=['GET'])
 def list_documents():
-    """List all generated PDF documents"""
+    """
+    List generated PDF documents, newest first, from the output manifest.
+
+    Options: ``doc_type`` and ``profile`` filter, ``limit`` (default 100, at
+    most 1000) and ``offset`` page through the rest. ``latest=1`` lists only
+    the newest PDF of each document type (of each member, for
+    individual_prep), each with ``versions``, the number of PDFs of it.
+    """
     try:
-        output_dir = Config.OUTPUT_DIR
-        files = []
-        # Ensure output directory exists even if app was started clean
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        if output_dir.exists():
-            for file_path in output_dir.glob('*.pdf'):
-                stat = file_path.stat()
-                files.append({
-                    'filename': file_path.name,
-                    'size': stat.st_size,
-                    'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                })
-        
-        # Sort by modification time (newest first)
-        files.sort(key=lambda x: x['modified'], reverse=True)
-        
+        doc_type = request.args.get('doc_type') or None
+        if doc_type is not None and doc_type not in GENERATORS:
+            return jsonify({'error': f'Unknown document type: {doc_type}'}), 400
+        profile = request.args.get('profile') or None
+        if profile is not None and profile not in PDF_PROFILES:
+            return unknown_profile_error(profile)
+        manifest = manifest_for(Config.OUTPUT_DIR)
+
+        if _flag(request.args.get('latest')):
+            files = manifest.latest([doc_type] if doc_type else None, profile=profile)
+            return jsonify({'files': files, 'total': len(files)})
+
+        try:
+            limit = min(max(int(request.args.get('limit', 100)), 1), 1000)
+            offset = max(int(request.args.get('offset', 0)), 0)
+        except ValueError:
+            return jsonify({'error': 'limit and offset must be integers'}), 400
+        files, total = manifest.list(doc_type, profile=profile, limit=limit, offset=offset)
         return jsonify({
             'files': files,
-            'total': len(files)
+            'total': total,
+            'limit': limit,
+            'offset': offset
         })
         
     except Exception as e:
@@ -243,6 +572,7 @@ def delete_document(filename):
             return jsonify({'error': 'File not found'}), 404
         
         file_path.unlink()
+        manifest_for(Config.OUTPUT_DIR).mark_deleted(filename)
         logger.info(f"Document deleted: {filename}")
         
         return jsonify({'message': 'Document deleted successfully'})
@@ -251,18 +581,106 @@ def delete_document(filename):
         logger.error(f"Error deleting file {filename}: {str(e)}")
         return jsonify({'error': 'Failed to delete file'}), 500
 
+@doc_bp.route('/cache', methods=['GET'])
+def get_render_cache_stats():
+    """Render cache hit/miss counters and size"""
+    cache = current_app.extensions.get('fluxgen_render_cache')
+    if cache is None:
+        return jsonify({'error': 'Render cache is disabled'}), 404
+    return jsonify(cache.get_stats())
+
+@doc_bp.route('/cache', methods=['DELETE'])
+def clear_render_cache():
+    """Drop every cached render (generated files are kept)"""
+    cache = current_app.extensions.get('fluxgen_render_cache')
+    if cache is None:
+        return jsonify({'error': 'Render cache is disabled'}), 404
+    cache.clear()
+    return jsonify({'message': 'Render cache cleared'})
+
 @doc_bp.route('/status', methods=['GET'])
 def get_generation_status():
-    """Get document generation status"""
+    """Get document generation status: running and queued jobs"""
     try:
-        # In a real application, this would check the status of background tasks
-        # For now, return a simple status
+        queue = current_app.extensions.get('fluxgen_jobs')
+        if queue is None:
+            # Generation runs inside requests, so nothing is ever queued
+            return jsonify({
+                'status': 'ready',
+                'active_generations': 0,
+                'queue_length': 0
+            })
+        
+        stats = queue.get_stats()
         return jsonify({
-            'status': 'ready',
-            'active_generations': 0,
-            'queue_length': 0
+            'status': 'busy' if stats['running'] else 'ready',
+            'active_generations': stats['running'],
+            'queue_length': stats['queued'],
+            'jobs': stats,
+            'active': [job.as_dict() for job in queue.recent(limit=stats['workers'], status=RUNNING)]
         })
         
     except Exception as e:
         logger.error(f"Error getting generation status: {str(e)}")
         return jsonify({'error': 'Failed to get status'}), 500
+
+@doc_bp.route('/jobs', methods=['GET'])
+def list_jobs():
+    """Recent generation jobs, newest first (``?status=`` and ``?limit=`` filter)"""
+    queue = current_app.extensions.get('fluxgen_jobs')
+    if queue is None:
+        return jsonify({'error': 'Background jobs are disabled'}), 404
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 1000)
+    jobs = queue.recent(limit=limit, status=request.args.get('status'))
+    return jsonify({'jobs': [job.as_dict() for job in jobs], 'total': len(jobs)})
+
+@doc_bp.route('/jobs/<job_id>/events', methods=['GET'])
+def stream_job_events(job_id):
+    """
+    Server-Sent Events stream of a generation job's events.
+
+    Sends every event so far, then each new one as it happens, and ends
+    after ``done`` or ``failed``. Each message carries the event name, its
+    id (send it back as ``Last-Event-ID`` to resume after a reconnect) and
+    its data as JSON. Resuming after the final event ends the stream at
+    once. See jobs.Job and BaseDocumentGenerator.on_progress for the events.
+    """
+    queue = current_app.extensions.get('fluxgen_jobs')
+    job = queue.get(job_id) if queue is not None else None
+    if job is None:
+        return jsonify({'error': f'Job not found: {job_id}'}), 404
+    last_id = request.headers.get('Last-Event-ID', type=int)
+    if last_id is None:
+        last_id = request.args.get('last_event_id', 0, type=int)
+    last_id = min(max(last_id, 0), len(job.events))
+
+    def events():
+        nonlocal last_id
+        yield 'retry: 2000\n\n'
+        while True:
+            pending = job.events_after(last_id, timeout=Config.JOB_EVENTS_KEEPALIVE)
+            if not pending:
+                # Resumed after the job's final event (done or failed is always its last)
+                if job.events and job.events[-1][1] in (DONE, FAILED):
+                    return
+                yield ': keep-alive\n\n'  # comment line; stops proxies timing the stream out
+                continue
+            for event_id, event, data in pending:
+                yield f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+                last_id = event_id
+                if event in (DONE, FAILED):
+                    return
+
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # nginx: pass events through as they are written
+    })
+
+@doc_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """A generation job's status, timings and, once done, its result"""
+    queue = current_app.extensions.get('fluxgen_jobs')
+    job = queue.get(job_id) if queue is not None else None
+    if job is None:
+        return jsonify({'error': f'Job not found: {job_id}'}), 404
+    return jsonify(job.as_dict())
@@ -137,6 +137,13 @@ const FluxGen = {
             });
         },
         
+        patch: function(endpoint, data) {
+            return this.request(endpoint, {
+                method: 'PATCH',
+                body: JSON.stringify(data)
+            });
+        },
+        
         delete: function(endpoint) {
             return this.request(endpoint, {
                 method: 'DELETE'
@@ -14,6 +14,10 @@ class DocumentManager {
             'individual_prep'
         ];
         this.generatedFiles = [];
+        this.latestFiles = [];
+        this.totalFiles = 0;
+        this.filesPageSize = 100;
+        this.jobPollInterval = 500;
         this.init();
     }
 
@@ -47,6 +51,12 @@ class DocumentManager {
             generateAllBtn.addEventListener('click', () => this.generateAllDocuments());
         }
 
+        // Download bundle button
+        const downloadBundleBtn = document.getElementById('download-bundle-btn');
+        if (downloadBundleBtn) {
+            downloadBundleBtn.addEventListener('click', () => this.downloadBundle());
+        }
+
         // Progress modal close button
         const progressClose = document.getElementById('progress-close');
         if (progressClose) {
@@ -56,8 +66,14 @@ class DocumentManager {
 
     async loadGeneratedFiles() {
         try {
-            const response = await FluxGen.api.get('/documents/list');
-            this.generatedFiles = response.files || [];
+            // Newest file per document type for the cards, one page of all files for the list
+            const [latest, recent] = await Promise.all([
+                FluxGen.api.get('/documents/list?latest=1'),
+                FluxGen.api.get(`/documents/list?limit=${this.filesPageSize}`)
+            ]);
+            this.latestFiles = latest.files || [];
+            this.generatedFiles = recent.files || [];
+            this.totalFiles = recent.total || 0;
             this.updateDocumentStates();
             this.updateFilesList();
         } catch (error) {
@@ -78,15 +94,14 @@ class DocumentManager {
             // Guard against missing elements
             if (!statusEl || !downloadBtn) return;
 
-            // Find the latest file for this document type using extractDocType for accuracy
-            const docFiles = this.generatedFiles.filter(file => {
-                const extractedType = this.extractDocType(file.filename);
-                return extractedType === docType;
-            }).sort((a, b) => new Date(b.modified) - new Date(a.modified));
+            // Latest file for this document type (one per team member for individual_prep)
+            const docFiles = this.latestFiles
+                .filter(file => file.doc_type === docType)
+                .sort((a, b) => new Date(b.modified) - new Date(a.modified));
 
             if (docFiles.length > 0) {
                 const latestFile = docFiles[0];
-                const count = docFiles.length;
+                const count = docFiles.reduce((total, file) => total + file.versions, 0);
                 const countText = count > 1 ? ` (${count} files)` : '';
                 statusEl.textContent = `Generated ${FluxGen.ui.formatDateTime(latestFile.modified)}${countText}`;
                 statusEl.className = 'text-xs text-green-600';
@@ -120,7 +135,7 @@ class DocumentManager {
         );
 
         const filesHTML = sortedFiles.map(file => {
-            const docType = this.extractDocType(file.filename);
+            const docType = file.doc_type || this.extractDocType(file.filename);
             const docTitle = this.getDocumentTitle(docType);
             
             return `
@@ -152,7 +167,10 @@ class DocumentManager {
             `;
         }).join('');
 
-        filesList.innerHTML = filesHTML;
+        const moreHTML = this.totalFiles > sortedFiles.length
+            ? `<p class="text-sm text-gray-500 mt-2">Showing the newest ${sortedFiles.length} of ${this.totalFiles} documents.</p>`
+            : '';
+        filesList.innerHTML = filesHTML + moreHTML;
     }
 
     async generateDocument(docType) {
@@ -165,12 +183,25 @@ class DocumentManager {
             statusEl.textContent = 'Generating...';
             statusEl.className = 'text-xs text-blue-600';
 
+            // Show what the server is building and laying out as it happens
+            const showStatus = (event, data) => {
+                if (event === 'queued') {
+                    statusEl.textContent = 'Waiting for a free worker...';
+                } else if (event === 'section_started') {
+                    statusEl.textContent = `Building ${data.section.replace(/_/g, ' ')}...`;
+                } else if (event === 'page') {
+                    statusEl.textContent = `Laying out page ${data.page} (${Math.round(data.progress * 100)}%)`;
+                }
+            };
+
             // Special handling for individual_prep - generate all prep documents
             if (docType === 'individual_prep') {
-                const response = await FluxGen.api.post('/documents/generate-all-prep');
+                const job = await FluxGen.api.post('/documents/generate-all-prep');
+                const response = await this.waitForJob(job, showStatus);
                 FluxGen.ui.showFlashMessage(`Generated ${response.total_generated} prep documents successfully`, 'success');
             } else {
-                const response = await FluxGen.api.post(`/documents/generate/${docType}`);
+                const job = await FluxGen.api.post(`/documents/generate/${docType}`);
+                const response = await this.waitForJob(job, showStatus);
                 FluxGen.ui.showFlashMessage(response.message, 'success');
             }
 
@@ -192,21 +223,27 @@ class DocumentManager {
         this.showProgressModal();
         
         try {
-            let completedCount = 0;
-            const totalCount = this.documents.length;
+            // individual_prep is not part of bulk generation
+            const totalCount = this.documents.length - 1;
             
             // Update progress
-            this.updateProgress(completedCount, totalCount, 'Starting document generation...');
-            
-            const response = await FluxGen.api.post('/documents/generate-all');
+            this.updateProgress(0, totalCount, 'Starting document generation...');
             
-            // Simulate progress updates (in real implementation, this would come from server events)
-            for (let i = 0; i < totalCount; i++) {
-                await new Promise(resolve => setTimeout(resolve, 500)); // Simulate processing time
-                completedCount++;
-                const docTitle = this.getDocumentTitle(this.documents[i]);
-                this.updateProgress(completedCount, totalCount, `Generated ${docTitle}`);
-            }
+            let completed = 0;
+            const job = await FluxGen.api.post('/documents/generate-all');
+            const response = await this.waitForJob(job, (event, data) => {
+                if (event === 'queued') {
+                    this.updateProgress(0, totalCount, 'Waiting for a free worker...');
+                } else if (event === 'progress' && data.current) {
+                    completed = data.completed;
+                    this.updateProgress(completed, data.total, `Generated ${this.getDocumentTitle(data.current)}`);
+                } else if (event === 'page') {
+                    const docTitle = this.getDocumentTitle(data.document);
+                    this.updateProgress(completed, totalCount, `${docTitle}: page ${data.page}`);
+                }
+            });
+            this.updateProgress(response.total_generated + response.total_errors,
+                                response.total_generated + response.total_errors, 'Done');
             
             // Show results
             this.showGenerationResults(response);
@@ -221,6 +258,49 @@ class DocumentManager {
         }
     }
 
+    waitForJob(response, onEvent) {
+        // Generate requests answer with a background job; follow its event
+        // stream until it is done. Without a job queue on the server the
+        // result comes back directly
+        if (!response.job_id) return Promise.resolve(response);
+        if (!window.EventSource) return this.pollJob(response, onEvent);
+
+        return new Promise((resolve, reject) => {
+            const source = new EventSource(response.events_url);
+            const progressEvents = ['queued', 'running', 'progress', 'section_started', 'section_finished',
+                                    'layout_started', 'page', 'completed'];
+            progressEvents.forEach(event => source.addEventListener(event, (e) => {
+                if (onEvent) onEvent(event, JSON.parse(e.data));
+            }));
+            source.addEventListener('done', (e) => {
+                source.close();
+                resolve(JSON.parse(e.data).result);
+            });
+            source.addEventListener('failed', (e) => {
+                source.close();
+                reject(new Error(JSON.parse(e.data).error));
+            });
+            // A dropped connection is retried by the browser (resuming after
+            // the last event seen); only give up once it stops retrying
+            source.onerror = () => {
+                if (source.readyState === EventSource.CLOSED) {
+                    reject(new Error('Lost track of the generation job'));
+                }
+            };
+        });
+    }
+
+    async pollJob(response, onEvent) {
+        // For browsers without EventSource: poll the job's status instead
+        while (true) {
+            const job = await FluxGen.api.get(`/documents/jobs/${response.job_id}`);
+            if (job.status === 'done') return job.result;
+            if (job.status === 'failed') throw new Error(job.error);
+            if (onEvent) onEvent(job.status === 'queued' ? 'queued' : 'progress', job.progress);
+            await new Promise(resolve => setTimeout(resolve, this.jobPollInterval));
+        }
+    }
+
     showProgressModal() {
         const modal = document.getElementById('progress-modal');
         const closeBtn = document.getElementById('progress-close');
@@ -314,6 +394,22 @@ class DocumentManager {
         FluxGen.ui.showFlashMessage('Download started', 'info', 2000);
     }
 
+    downloadBundle() {
+        if (this.generatedFiles.length === 0) {
+            FluxGen.ui.showFlashMessage('Generate documents before downloading the bundle', 'warning');
+            return;
+        }
+
+        // The server streams the ZIP as it writes it; the browser saves it like any download
+        const link = document.createElement('a');
+        link.href = '/api/documents/bundle';
+        document.body.appendChild(link);
+        link.click();
+        document.body.removeChild(link);
+
+        FluxGen.ui.showFlashMessage('Bundle download started', 'info', 2000);
+    }
+
     async deleteFile(filename) {
         if (!confirm(`Are you sure you want to delete ${filename}?`)) {
             return;
@@ -456,7 +456,8 @@ class DataEditor {
 
     async updateCapexItem(id, data) {
         try {
-            await FluxGen.api.put(`/data/capex/${id}`, data);
+            // PATCH changes only the edited columns
+            await FluxGen.api.patch('/data/capex', { rows: [{ id, ...data }] });
             
             // Update local data
             const index = this.data.capex.findIndex(item => item.id === id);
@@ -483,7 +484,7 @@ class DataEditor {
 
     async updateProductionTarget(id, data) {
         try {
-            await FluxGen.api.put(`/data/production/${id}`, data);
+            await FluxGen.api.patch('/data/production', { rows: [{ id, ...data }] });
             
             // Update local data
             const index = this.data.production.findIndex(item => item.id === id);
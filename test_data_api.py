@@ -0,0 +1,109 @@
+"""
+Tests for PATCH /api/data/<table> (atomic bulk row updates)
+
+Each test runs the app against a temporary copy of data/fluxgen.db with
+rendering and jobs in-process, so the real database is untouched.
+
+Run with pytest or directly: python test_data_api.py
+"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from config import Config
+from app import create_app
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'DATABASE_PATH', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'OUTPUT_DIR', tmp_path / 'outputs')
+    monkeypatch.setattr(Config, 'RENDER_CACHE_DIR', tmp_path / 'outputs' / '.cache')
+    monkeypatch.setattr(Config, 'RENDER_WORKERS', 0)
+    monkeypatch.setattr(Config, 'JOB_WORKERS', 0)
+    app = create_app()
+    with app.test_client() as client:
+        client.db = app.extensions['fluxgen_db']
+        yield client
+    client.db.close()
+
+
+def capex_rows(client):
+    return {row['id']: row for row in client.db.get_investment_capex()}
+
+
+def test_unknown_table(client):
+    response = client.patch('/api/data/suppliers', json={'rows': [{'id': 1, 'notes': 'x'}]})
+    assert response.status_code == 404
+
+
+def test_rows_required(client):
+    assert client.patch('/api/data/capex', json={}).status_code == 400
+    assert client.patch('/api/data/capex', json={'rows': []}).status_code == 400
+
+
+def test_column_not_in_whitelist(client):
+    row_id = next(iter(capex_rows(client)))
+    response = client.patch('/api/data/capex', json={'rows': [{'id': row_id, 'id_hack': 1, 'notes': 'x'}]})
+    assert response.status_code == 400
+    assert response.json['results'][0]['status'] == 'invalid'
+    assert 'id_hack' in response.json['results'][0]['error']
+
+
+@pytest.mark.parametrize('row', [{'notes': 'x'}, {'id': '1', 'notes': 'x'}, {'id': True, 'notes': 'x'},
+                                 {'id': False, 'notes': 'x'}])
+def test_missing_or_non_integer_id(client, row):
+    response = client.patch('/api/data/capex', json={'rows': [row]})
+    assert response.status_code == 400
+    assert response.json['results'][0]['status'] == 'invalid'
+
+
+def test_mixed_rows_roll_back(client):
+    before = capex_rows(client)
+    first, second = list(before)[:2]
+    rows = [
+        {'id': first, 'notes': 'changed'},
+        {'id': second, 'colour': 'red'},
+    ]
+    response = client.patch('/api/data/capex', json={'rows': rows})
+    assert response.status_code == 400
+    assert [r['status'] for r in response.json['results']] == ['skipped', 'invalid']
+    assert capex_rows(client) == before
+
+    missing = max(before) + 1000
+    response = client.patch('/api/data/capex', json={'rows': [{'id': first, 'notes': 'changed'},
+                                                              {'id': missing, 'notes': 'changed'}]})
+    assert response.status_code == 404
+    assert [r['status'] for r in response.json['results']] == ['skipped', 'not_found']
+    assert capex_rows(client) == before
+
+
+def test_update_applies_and_bumps_versions(client):
+    before = capex_rows(client)
+    first, second = list(before)[:2]
+    summary = client.db.get_financial_summary()
+    version = client.db.dataset_version()
+
+    rows = [
+        {'id': first, 'estimated_cost_cad': (before[first]['estimated_cost_cad'] or 0) + 1000},
+        {'id': second, 'notes': 'bulk updated'},
+    ]
+    response = client.patch('/api/data/capex', json={'rows': rows})
+    assert response.status_code == 200, response.json
+    assert [r['status'] for r in response.json['results']] == ['updated', 'updated']
+
+    after = capex_rows(client)
+    assert after[first]['estimated_cost_cad'] == rows[0]['estimated_cost_cad']
+    assert after[second]['notes'] == 'bulk updated'
+    assert client.db.get_financial_summary()['total_capex'] == pytest.approx(summary['total_capex'] + 1000)
+    assert client.db.reconcile_financial_summary()['consistent']
+    assert client.db.dataset_version() != version
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,188 @@
+"""
+Tests for the database layer (database.py) and its maintenance commands (manage.py)
+
+Each test works on a temporary copy of data/fluxgen.db.
+
+Run with pytest or directly: python test_database.py
+"""
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from database import SCHEMA_MIGRATIONS, DatabaseManager, SnapshotManager, dataset_cache
+from generators.registry import GENERATORS
+from render_cache import RenderCache
+
+
+@pytest.fixture
+def db(tmp_path):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    db = DatabaseManager(tmp_path / 'fluxgen.db')
+    db.migrate()
+    yield db
+    db.close()
+
+
+def outside_write(db, sql, params=()):
+    """Write through a separate connection, as the Ai-Sourcing scripts do"""
+    conn = sqlite3.connect(db.db_path)
+    with conn:
+        conn.execute(sql, params)
+    conn.close()
+
+
+def test_reconcile_fix_invalidates_cached_summary(db, tmp_path):
+    outside_write(db, "UPDATE financial_summary SET total_capex = total_capex + 1000, team_size = 0 WHERE id = 1")
+    cache = RenderCache(tmp_path / 'cache', tmp_path / 'outputs', max_bytes=1024 * 1024)
+    options = {'member_name': None, 'profile': 'standard'}
+    corrupted = db.get_financial_summary()
+    key = cache.key(GENERATORS['financial_projections'], db, options)
+
+    result = db.reconcile_financial_summary(fix=True)
+    assert result['fixed']
+    assert {m['field'] for m in result['mismatches']} == {'total_capex', 'team_size'}
+
+    summary = db.get_financial_summary()
+    assert summary != corrupted
+    assert summary == {field: result['recomputed'][field] for field in summary}
+    assert db.read_snapshot().financial_summary == summary
+    assert cache.key(GENERATORS['financial_projections'], db, options) != key
+    assert db.reconcile_financial_summary()['consistent']
+
+
+def test_migrate_without_ai_sourcing_tables(tmp_path):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    conn = sqlite3.connect(tmp_path / 'fluxgen.db')
+    conn.execute("DROP TABLE suppliers")
+    conn.close()
+    db = DatabaseManager(tmp_path / 'fluxgen.db')
+    assert db.migrate() == SCHEMA_MIGRATIONS[-1][0]
+    with db.get_connection() as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert 'idx_capex_phase_category' in indexes
+    assert 'idx_suppliers_website' not in indexes
+
+
+def test_index_advisor_checks_what_the_app_runs(db):
+    from manage import traced_queries
+
+    statements = {query: source for source, query in traced_queries(db.db_path)}
+    for query in DatabaseManager.DATASET_QUERIES.values():
+        assert statements[query] == 'DatabaseManager.read_snapshot'
+    assert statements["SELECT table_name, version FROM dataset_versions"] == 'DatabaseManager.read_snapshot'
+    assert any(source == 'DatabaseManager.query_models(Supplier)' for source in statements.values())
+
+
+def company_name(db):
+    """legal_name read straight from the file, bypassing the dataset cache"""
+    return db.execute_query("SELECT legal_name FROM company_info")[0]['legal_name']
+
+
+def test_snapshot_is_consistent_copy(db, tmp_path):
+    db.set_journal_mode('WAL')
+    # Committed but not yet checkpointed: only in the -wal file
+    writer = sqlite3.connect(db.db_path)
+    writer.execute("PRAGMA wal_autocheckpoint = 0")
+    with writer:
+        writer.execute("UPDATE company_info SET legal_name = ?", ('Snapshot Metals Inc.',))
+    snapshots = SnapshotManager(db.db_path, tmp_path / 'snapshots')
+    path = snapshots.create()
+    writer.close()
+
+    assert snapshots.list() == [path]
+    assert [p.name for p in path.parent.iterdir()] == [path.name]  # no .partial, -wal or -journal
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+    assert conn.execute("PRAGMA integrity_check").fetchone()[0] == 'ok'
+    conn.close()
+
+    frozen = DatabaseManager(path, mode='immutable')
+    assert company_name(frozen) == 'Snapshot Metals Inc.'
+    assert frozen.read_snapshot() == db.read_snapshot()
+
+
+def test_snapshots_keep_newest(db, tmp_path):
+    snapshots = SnapshotManager(db.db_path, tmp_path / 'snapshots', keep=2)
+    created = [snapshots.create() for _ in range(4)]
+    assert snapshots.list() == created[-2:]
+    assert snapshots.latest() == created[-1]
+    assert not any(path.exists() for path in created[:2])
+    assert snapshots.prune() == []
+
+
+def test_reader_keeps_its_snapshot_while_a_new_one_rotates_in(db, tmp_path):
+    snapshots = SnapshotManager(db.db_path, tmp_path / 'snapshots', keep=1)
+    reader = snapshots.reader()
+    assert snapshots.reader() is reader  # nothing written, no new copy
+    name = company_name(reader)
+
+    outside_write(db, "UPDATE company_info SET legal_name = ?", ('Rotated Alloys Inc.',))
+    rotated = snapshots.reader()
+    assert rotated is not reader
+    assert rotated.db_path != reader.db_path
+    # keep=1, but the copy the old reader was handed out on is not pruned from under it
+    assert reader.db_path.exists()
+    assert company_name(reader) == name
+    assert company_name(rotated) == 'Rotated Alloys Inc.'
+    assert snapshots.list() == [reader.db_path, rotated.db_path]
+
+
+def test_immutable_reader_sees_no_writes_until_next_snapshot(db, tmp_path):
+    snapshots = SnapshotManager(db.db_path, tmp_path / 'snapshots')
+    reader = snapshots.reader()
+    name = reader.get_company_info()['legal_name']
+    version = reader.dataset_version()
+
+    db.update_company_info({**db.get_company_info(), 'legal_name': 'Frozen Out Inc.'})
+    outside_write(db, "UPDATE team_members SET status = 'inactive'")
+    assert db.get_company_info()['legal_name'] == 'Frozen Out Inc.'
+    assert reader.get_company_info()['legal_name'] == name
+    assert company_name(reader) == name
+    assert reader.dataset_version() == version
+    assert reader.read_snapshot().version_id != db.read_snapshot().version_id
+
+    assert snapshots.reader().get_company_info()['legal_name'] == 'Frozen Out Inc.'
+
+
+def lookups(read):
+    """(hits, misses) of the dataset cache while calling read()"""
+    hits, misses = dataset_cache.hits, dataset_cache.misses
+    read()
+    return dataset_cache.hits - hits, dataset_cache.misses - misses
+
+
+def test_dataset_cache_hits_until_a_write_in_process(db):
+    assert lookups(db.get_company_info) == (0, 1)
+    assert lookups(db.get_company_info) == (1, 0)
+    version = db.dataset_version()
+
+    info = db.get_company_info()
+    db.update_company_info({**info, 'legal_name': 'Cached Castings Inc.'})
+    assert db.dataset_version() != version
+    assert lookups(db.get_company_info) == (0, 1)
+    assert db.get_company_info()['legal_name'] == 'Cached Castings Inc.'
+    assert lookups(db.get_company_info) == (1, 0)
+
+
+def test_dataset_cache_misses_after_a_write_from_another_connection(db):
+    db.get_company_info()
+    watcher = dataset_cache._watchers[db._cache_key]
+    data_version = watcher.data_version
+
+    # Writes to tables the entry does not depend on keep it
+    outside_write(db, "UPDATE team_members SET status = status")
+    assert lookups(db.get_company_info) == (1, 0)
+    assert watcher.data_version != data_version
+
+    outside_write(db, "UPDATE company_info SET legal_name = ?", ('Elsewhere Foundry Inc.',))
+    assert lookups(db.get_company_info) == (0, 1)
+    assert db.get_company_info()['legal_name'] == 'Elsewhere Foundry Inc.'
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,248 @@
+"""
+Concurrency stress test for DatabaseManager in WAL mode with a single writer
+
+Readers (snapshot loads and cached getters), in-process writers going through
+the WriteQueue, and an outside writer connection standing in for the
+Ai-Sourcing scripts all hammer a temporary copy of data/fluxgen.db at once.
+
+Checks that:
+  * no operation fails with "database is locked" (or anything else)
+  * every snapshot is internally consistent while writers move CAPEX amounts
+    between two rows in one transaction (the total never changes)
+  * every queued write is applied
+
+test_pool_leases_pins_and_max_size covers ConnectionPool leasing on its own.
+
+Run with pytest or directly: python test_database_concurrency.py [--seconds N]
+"""
+import argparse
+import queue
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from database import DatabaseManager, ConnectionPool, PoolExhaustedError, WriteQueue
+
+DEFAULT_SECONDS = 5.0
+READERS = 8
+WRITERS = 4
+
+
+def _make_manager(db_path: Path) -> DatabaseManager:
+    pool = ConnectionPool(db_path, max_size=READERS + WRITERS, busy_timeout_ms=5000)
+    db = DatabaseManager(db_path, pool=pool)
+    db.migrate()
+    assert db.set_journal_mode('WAL') == 'wal'
+    db.writer = WriteQueue(db_path, busy_timeout_ms=5000, checkpoint_interval=0.5)
+    return db
+
+
+def run_stress(seconds: float = DEFAULT_SECONDS) -> dict:
+    """Run readers and writers concurrently; return counters and collected errors"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'fluxgen.db'
+        shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', db_path)
+        db = _make_manager(db_path)
+
+        capex_ids = [row['id'] for row in db.get_investment_capex()]
+        expected_total = db.get_financial_summary()['total_capex']
+        members = db.get_team_members()
+
+        stop = threading.Event()
+        errors = []
+        counts = {'snapshots': 0, 'reads': 0, 'writes': 0, 'external_writes': 0}
+        lock = threading.Lock()
+
+        def record(key):
+            with lock:
+                counts[key] += 1
+
+        def reader():
+            while not stop.is_set():
+                try:
+                    snapshot = db.read_snapshot()
+                    total = sum(row['estimated_cost_cad'] or 0 for row in snapshot.investment_capex)
+                    if abs(total - expected_total) > 1e-6:
+                        errors.append(f"Inconsistent snapshot: CAPEX rows sum to {total}, expected {expected_total}")
+                    if abs(snapshot.financial_summary['total_capex'] - total) > 1e-6:
+                        errors.append("Snapshot summary does not match its own CAPEX rows")
+                    record('snapshots')
+                    db.get_alloys_catalog()
+                    db.get_team_members()
+                    record('reads')
+                except Exception as e:
+                    errors.append(f"reader: {type(e).__name__}: {e}")
+
+        def move_capex(conn, source, target, amount):
+            conn.execute(
+                "UPDATE investment_capex SET estimated_cost_cad = estimated_cost_cad - ? WHERE id = ?",
+                (amount, source))
+            conn.execute(
+                "UPDATE investment_capex SET estimated_cost_cad = estimated_cost_cad + ? WHERE id = ?",
+                (amount, target))
+
+        def writer(seed):
+            rng = random.Random(seed)
+            while not stop.is_set():
+                try:
+                    source, target = rng.sample(capex_ids, 2)
+                    db.run_write(lambda conn: move_capex(conn, source, target, 250))
+                    member = dict(rng.choice(members), notes=f"stress {seed} {time.time()}")
+                    db.update_team_member(member['id'], member)
+                    record('writes')
+                except Exception as e:
+                    errors.append(f"writer: {type(e).__name__}: {e}")
+
+        def external_writer():
+            # A separate connection, like the Ai-Sourcing scripts use
+            conn = sqlite3.connect(db_path, timeout=5)
+            try:
+                while not stop.is_set():
+                    try:
+                        conn.execute(
+                            "INSERT INTO suppliers (company_name, materials_supplied) VALUES (?, ?)",
+                            (f"Stress Supplier {time.time()}", 'silica'))
+                        conn.commit()
+                        record('external_writes')
+                        time.sleep(0.01)
+                    except Exception as e:
+                        errors.append(f"external writer: {type(e).__name__}: {e}")
+            finally:
+                conn.close()
+
+        threads = [threading.Thread(target=reader) for _ in range(READERS)]
+        threads += [threading.Thread(target=writer, args=(i,)) for i in range(WRITERS)]
+        threads.append(threading.Thread(target=external_writer))
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        final_total = db.get_financial_summary()['total_capex']
+        writer_stats = db.writer.get_stats()
+        db.close()
+
+    return {
+        'counts': counts,
+        'errors': errors,
+        'final_total': final_total,
+        'expected_total': expected_total,
+        'writer': writer_stats,
+    }
+
+
+def test_wal_concurrency():
+    """Readers, queued writers and an outside writer run without lock errors"""
+    result = run_stress(seconds=2.0)
+    assert not result['errors'], result['errors'][:5]
+    assert abs(result['final_total'] - result['expected_total']) < 1e-6
+    assert result['counts']['snapshots'] > 0
+    assert result['counts']['writes'] > 0
+    # Two queued transactions per writer loop
+    assert result['writer']['writes'] >= 2 * result['counts']['writes']
+    assert result['writer']['failed'] == 0
+
+
+def test_pool_leases_pins_and_max_size():
+    """Nested blocks share one lease, pin() holds it across blocks, and max_size bounds the pool"""
+    def in_thread(fn):
+        """Run fn on a new thread; return a queue that receives its result or exception"""
+        results = queue.Queue()
+
+        def run():
+            try:
+                results.put(fn())
+            except Exception as e:
+                results.put(e)
+        threading.Thread(target=run, daemon=True).start()
+        return results
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'fluxgen.db'
+        shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', db_path)
+        pool = ConnectionPool(db_path, max_size=2, timeout=0.2)
+
+        with pool.connection() as outer:
+            with pool.connection() as inner:
+                assert inner is outer
+            assert pool.get_stats()['idle'] == 0
+        with pool.connection() as conn:
+            assert conn is outer
+        assert pool.get_stats() == {'opened': 1, 'closed': 0, 'checkouts': 2, 'reused': 1, 'discarded': 0,
+                                    'size': 1, 'idle': 1, 'max_size': 2}
+
+        # Pinned, the lease outlives its blocks until unpin()
+        pool.pin()
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            assert second is first
+        assert pool.get_stats()['idle'] == 0
+
+        def borrow():
+            with pool.connection() as conn:
+                return conn
+
+        # A second thread gets its own connection and holds it; a third finds the pool full
+        release = threading.Event()
+
+        def hold():
+            pool.pin()
+            release.wait()
+            pool.unpin()
+            return True
+        held = in_thread(hold)
+        while pool.get_stats()['size'] < 2:
+            time.sleep(0.01)
+        assert isinstance(in_thread(borrow).get(timeout=5), PoolExhaustedError)
+
+        # ...or waits until a connection is returned
+        pool.timeout = 5.0
+        waiting = in_thread(borrow)
+        time.sleep(0.1)
+        pool.unpin()
+        assert waiting.get(timeout=5) is first
+        release.set()
+        assert held.get(timeout=5) is True
+        assert pool.get_stats()['size'] == 2
+        assert pool.get_stats()['opened'] == 2
+
+        pool.close()
+        assert pool.get_stats()['size'] == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FluxGen database concurrency stress test")
+    parser.add_argument('--seconds', type=float, default=DEFAULT_SECONDS)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print(f"Database concurrency stress test ({args.seconds:.0f}s, "
+          f"{READERS} readers, {WRITERS} writers, 1 outside writer)")
+    print("=" * 60)
+
+    result = run_stress(args.seconds)
+    counts = result['counts']
+    for key, value in counts.items():
+        print(f"{key:.<40} {value:>8} ({value / args.seconds:,.0f}/s)")
+    print(f"{'WAL checkpoints':.<40} {result['writer']['checkpoints']:>8}")
+    print(f"{'errors':.<40} {len(result['errors']):>8}")
+    for error in result['errors'][:10]:
+        print(f"  ✗ {error}")
+
+    passed = not result['errors'] and abs(result['final_total'] - result['expected_total']) < 1e-6
+    print("\n✓ PASSED" if passed else "\n✗ FAILED")
+    return passed
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
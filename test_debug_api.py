@@ -0,0 +1,135 @@
+"""
+Tests for SQLite query tracing (database.QueryTracer) and /api/debug/queries
+
+Each test runs against a temporary copy of data/fluxgen.db with tracing
+enabled, as with FLUXGEN_DB_TRACE_QUERIES=1, and turns it off again after.
+
+Run with pytest or directly: python test_debug_api.py
+"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from config import Config
+from database import DatabaseManager, dataset_cache, query_tracer
+
+COMPANY_QUERY = "SELECT * FROM company_info LIMIT 1"
+TEAM_QUERY = DatabaseManager.DATASET_QUERIES['team_members']
+
+
+@pytest.fixture
+def db(tmp_path):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    query_tracer.configure(enabled=True)
+    db = DatabaseManager(tmp_path / 'fluxgen.db')
+    db.migrate()
+    query_tracer.reset()
+    yield db
+    query_tracer.configure(enabled=False)
+    query_tracer.reset()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'DATABASE_PATH', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'OUTPUT_DIR', tmp_path / 'outputs')
+    monkeypatch.setattr(Config, 'RENDER_CACHE_DIR', tmp_path / 'outputs' / '.cache')
+    monkeypatch.setattr(Config, 'RENDER_WORKERS', 0)
+    monkeypatch.setattr(Config, 'JOB_WORKERS', 0)
+    monkeypatch.setattr(Config, 'DB_TRACE_QUERIES', True)
+    from app import create_app
+    app = create_app()
+    with app.test_client() as client:
+        yield client
+    app.extensions['fluxgen_db'].close()
+    query_tracer.configure(enabled=False)
+    query_tracer.reset()
+
+
+def statements():
+    return {entry['statement']: entry for entry in query_tracer.get_stats()['statements']}
+
+
+class CompanySection:
+    """Stands in for a generator section that queries the database"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def _add_company_section(self):
+        return self.db.execute_query(COMPANY_QUERY)
+
+
+def test_tracer_counts_statements_and_rows(db):
+    for _ in range(3):
+        db.get_team_members()
+    members = len(db.get_team_members())
+    assert db.execute_update("UPDATE team_members SET notes = notes WHERE id = ?", (1,)) == 1
+
+    team = statements()[TEAM_QUERY]
+    assert (team['calls'], team['timed_calls'], team['rows']) == (4, 4, 4 * members)
+    assert team['total_ms'] >= team['max_ms'] > 0
+    update = statements()["UPDATE team_members SET notes = notes WHERE id = ?"]
+    assert (update['calls'], update['rows']) == (1, 1)
+
+    # Cache hits run no statement
+    dataset_cache.clear()
+    db.get_company_info()
+    db.get_company_info()
+    assert statements()[COMPANY_QUERY]['calls'] == 1
+
+
+def test_tracer_attributes_statements_to_callers(db):
+    CompanySection(db)._add_company_section()
+    db.execute_query(COMPANY_QUERY)
+    with query_tracer.section('pitch_deck'):
+        db.execute_query(COMPANY_QUERY)
+
+    assert statements()[COMPANY_QUERY]['sections'] == {
+        'CompanySection._add_company_section': 1,
+        'test_debug_api.test_tracer_attributes_statements_to_callers': 1,
+        'pitch_deck': 1,
+    }
+    assert [entry['section'] for entry in query_tracer.get_stats()['recent']][-3:] == [
+        'CompanySection._add_company_section',
+        'test_debug_api.test_tracer_attributes_statements_to_callers',
+        'pitch_deck',
+    ]
+
+
+def test_query_stats_endpoint(client):
+    for _ in range(2):
+        assert client.get('/api/data/team').status_code == 200
+
+    response = client.get('/api/debug/queries')
+    assert response.status_code == 200
+    assert response.json['enabled'] is True
+    team = {entry['statement']: entry for entry in response.json['statements']}[TEAM_QUERY]
+    assert team['calls'] == 2
+    assert team['sections'] == {'data_routes.get_team_members': 2}
+
+    limited = client.get('/api/debug/queries?limit=1').json
+    assert len(limited['statements']) == 1
+    assert len(limited['recent']) == 1
+
+
+def test_query_stats_reset(client):
+    client.get('/api/data/team')
+    assert client.get('/api/debug/queries').json['statements']
+
+    response = client.delete('/api/debug/queries')
+    assert response.status_code == 200
+    stats = client.get('/api/debug/queries').json
+    assert (stats['statements'], stats['recent']) == ([], [])
+
+    client.get('/api/data/team')
+    assert [entry['statement'] for entry in client.get('/api/debug/queries').json['statements']] == [TEAM_QUERY]
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
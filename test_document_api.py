@@ -0,0 +1,214 @@
+"""
+Tests for the generated-document endpoints of /api/documents
+
+Each test runs the app against a temporary copy of data/fluxgen.db and a
+temporary output directory, generating inline (no jobs, and no render workers
+unless a test starts them).
+
+Run with pytest or directly: python test_document_api.py
+"""
+import io
+import os
+import shutil
+import sqlite3
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from config import Config
+from generators.registry import GENERATORS, document_type
+
+BULK_DOCUMENTS = [name for name in GENERATORS if name != 'individual_prep']
+OLD_PITCH_DECK = 'fluxgen_pitch_deck_20200101_000000.pdf'
+
+
+@pytest.fixture(scope='module')
+def generated(tmp_path_factory):
+    """Output directory holding an old pitch deck plus one generate-all and one generate-all-prep run"""
+    tmp_path = tmp_path_factory.mktemp('documents')
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    patch = pytest.MonkeyPatch()
+    patch.setattr(Config, 'DATABASE_PATH', tmp_path / 'fluxgen.db')
+    patch.setattr(Config, 'OUTPUT_DIR', tmp_path / 'outputs')
+    patch.setattr(Config, 'RENDER_CACHE_DIR', tmp_path / 'outputs' / '.cache')
+    patch.setattr(Config, 'DB_SNAPSHOT_DIR', tmp_path / 'snapshots')
+    patch.setattr(Config, 'RENDER_WORKERS', 0)
+    patch.setattr(Config, 'JOB_WORKERS', 0)
+
+    # A pitch deck left over from an earlier run; the app indexes it at startup
+    (tmp_path / 'outputs').mkdir()
+    old = tmp_path / 'outputs' / OLD_PITCH_DECK
+    old.write_bytes(b'%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n')
+    os.utime(old, (1577836800, 1577836800))
+
+    from app import create_app
+    app = create_app()
+    client = app.test_client()
+    assert client.post('/api/documents/generate-all').status_code == 200
+    assert client.post('/api/documents/generate-all-prep').status_code == 200
+    yield client
+    app.extensions['fluxgen_db'].close()
+    patch.undo()
+
+
+def test_bundle_has_latest_of_each_type(generated):
+    response = generated.get('/api/documents/bundle')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/zip'
+    assert response.headers['Content-Disposition'].startswith('attachment; filename="fluxgen_documents_')
+    assert 'X-Bundle-Missing' not in response.headers
+
+    archive = zipfile.ZipFile(io.BytesIO(response.data))
+    assert archive.testzip() is None
+    names = archive.namelist()
+    assert sorted(document_type(name) for name in names) == sorted(BULK_DOCUMENTS)
+    assert OLD_PITCH_DECK not in names
+    assert response.headers['X-Bundle-Files'] == str(len(names))
+    for name in names:
+        assert archive.read(name) == (Config.OUTPUT_DIR / name).read_bytes()
+
+
+def test_bundle_prep_documents_per_member(generated):
+    response = generated.get('/api/documents/bundle?documents=individual_prep,pitch_deck&profile=optimized')
+    assert response.status_code == 404  # nothing generated in the optimized profile
+    assert sorted(response.json['missing']) == ['individual_prep', 'pitch_deck']
+
+    response = generated.get('/api/documents/bundle?documents=individual_prep')
+    names = zipfile.ZipFile(io.BytesIO(response.data)).namelist()
+    members = [member['name'] for member in generated.get('/api/data/team').json]
+    assert len(names) == len(members)
+    assert all(document_type(name) == 'individual_prep' for name in names)
+
+
+def test_bundle_rejects_unknown_options(generated):
+    assert generated.get('/api/documents/bundle?documents=nope').status_code == 400
+    assert generated.get('/api/documents/bundle?profile=nope').status_code == 400
+
+
+def test_list_newest_first_with_metadata(generated):
+    members = generated.get('/api/data/team').json
+    response = generated.get('/api/documents/list')
+    assert response.status_code == 200
+    body = response.json
+    assert (body['total'], body['limit'], body['offset']) == (len(BULK_DOCUMENTS) + len(members) + 1, 100, 0)
+    files = body['files']
+    assert files[0]['data_version'] is not None
+    assert [f['modified'] for f in files] == sorted((f['modified'] for f in files), reverse=True)
+    assert files[-1]['filename'] == OLD_PITCH_DECK
+    for f in files[:-1]:
+        assert f['doc_type'] == document_type(f['filename'])
+        assert f['size'] == (Config.OUTPUT_DIR / f['filename']).stat().st_size
+        assert f['pages'] >= 1
+        assert f['profile'] == 'standard'
+        assert f['data_version'] == files[0]['data_version']  # one dataset for every document
+        assert f['created'] == f['modified']
+    assert files[-1]['data_version'] is None  # indexed from disk at startup
+
+
+def test_list_pages_and_filters(generated):
+    everything = generated.get('/api/documents/list').json['files']
+    page = generated.get('/api/documents/list?limit=3&offset=2').json
+    assert page['files'] == everything[2:5]
+    assert page['total'] == len(everything)
+
+    decks = generated.get('/api/documents/list?doc_type=pitch_deck').json
+    assert decks['total'] == 2
+    assert decks['files'][-1]['filename'] == OLD_PITCH_DECK
+    assert generated.get('/api/documents/list?doc_type=pitch_deck&profile=optimized').json['total'] == 0
+
+    for query in ('doc_type=nope', 'profile=nope', 'limit=x', 'offset=x'):
+        assert generated.get(f'/api/documents/list?{query}').status_code == 400
+
+
+def test_list_latest(generated):
+    members = generated.get('/api/data/team').json
+    latest = generated.get('/api/documents/list?latest=1').json['files']
+    assert len(latest) == len(BULK_DOCUMENTS) + len(members)
+    by_type = {}
+    for f in latest:
+        by_type.setdefault(f['doc_type'], []).append(f)
+    assert sorted(by_type) == sorted(GENERATORS)
+    assert len(by_type['individual_prep']) == len(members)
+    assert by_type['pitch_deck'][0]['filename'] != OLD_PITCH_DECK
+    assert by_type['pitch_deck'][0]['versions'] == 2
+
+
+def test_delete_hides_file_until_restored_from_cache(generated):
+    plan = generated.get('/api/documents/list?doc_type=business_plan').json['files'][0]['filename']
+    assert generated.delete(f'/api/documents/{plan}').status_code == 200
+    assert generated.get('/api/documents/list?doc_type=business_plan').json['total'] == 0
+    assert generated.get('/api/documents/bundle').headers['X-Bundle-Missing'] == 'business_plan'
+
+    response = generated.post('/api/documents/generate/business_plan')
+    assert response.json['filename'] == plan  # served from the render cache
+    files = generated.get('/api/documents/list?doc_type=business_plan').json['files']
+    assert [f['filename'] for f in files] == [plan]
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_batch_reads_one_dataset_despite_writes(tmp_path, monkeypatch, workers):
+    """A save landing mid-batch must not leave /generate-all built from two dataset versions"""
+    import routes.document_routes as document_routes
+    from render_pool import RenderPool
+
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'DATABASE_PATH', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'OUTPUT_DIR', tmp_path / 'outputs')
+    monkeypatch.setattr(Config, 'RENDER_CACHE_DIR', tmp_path / 'outputs' / '.cache')
+    monkeypatch.setattr(Config, 'DB_SNAPSHOT_DIR', tmp_path / 'snapshots')
+    monkeypatch.setattr(Config, 'RENDER_WORKERS', workers)
+    monkeypatch.setattr(Config, 'JOB_WORKERS', 0)
+
+    renamed = []
+
+    def rename_company_once():
+        if not renamed:
+            conn = sqlite3.connect(Config.DATABASE_PATH)
+            with conn:
+                conn.execute("UPDATE company_info SET legal_name = ?", ('Renamed Industries Inc.',))
+            conn.close()
+            renamed.append(True)
+
+    # Write once the first document is underway: in this thread, or once it is queued for a worker
+    if workers:
+        submit = RenderPool.submit
+
+        def submit_then_write(self, *args, **kwargs):
+            future = submit(self, *args, **kwargs)
+            rename_company_once()
+            return future
+        monkeypatch.setattr(RenderPool, 'submit', submit_then_write)
+    else:
+        render_document = document_routes.render_document
+
+        def render_then_write(*args, **kwargs):
+            paths = render_document(*args, **kwargs)
+            rename_company_once()
+            return paths
+        monkeypatch.setattr(document_routes, 'render_document', render_then_write)
+
+    from app import create_app
+    app = create_app()
+    try:
+        client = app.test_client()
+        response = client.post('/api/documents/generate-all')
+        assert response.status_code == 200
+        assert response.json['total_generated'] == len(BULK_DOCUMENTS)
+        assert renamed
+
+        files = client.get('/api/documents/list').json['files']
+        assert len(files) == len(BULK_DOCUMENTS)
+        assert len({f['data_version'] for f in files}) == 1
+        assert files[0]['data_version'] != app.extensions['fluxgen_db'].read_snapshot().version_id
+    finally:
+        if 'fluxgen_render_pool' in app.extensions:
+            app.extensions['fluxgen_render_pool'].close()
+        app.extensions['fluxgen_db'].close()
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
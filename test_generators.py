@@ -0,0 +1,158 @@
+"""
+Tests for the document generator base class (generators/base.py)
+
+Each test works on a temporary copy of data/fluxgen.db.
+
+Run with pytest or directly: python test_generators.py
+"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from reportlab import rl_config
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph
+
+from database import DatabaseManager
+from generators import base
+from generators.base import BaseDocumentGenerator, section, section_cache_stats
+
+
+@pytest.fixture
+def db(tmp_path):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    db = DatabaseManager(tmp_path / 'fluxgen.db')
+    db.migrate()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def sections(monkeypatch):
+    """Empty section cache for this thread; yields the headings SectionGenerator built"""
+    monkeypatch.setattr(base, '_section_local', base.threading.local())
+    monkeypatch.setattr(rl_config, 'invariant', 1)
+    SectionGenerator.built = []
+    yield SectionGenerator.built
+
+
+class SectionGenerator(BaseDocumentGenerator):
+    """One cached section that reads company_info, with a table long enough to split"""
+
+    built = []
+
+    @section('company_info')
+    def _add_overview(self, heading):
+        self.built.append(heading)
+        self.add_heading1(heading)
+        self.add_body_text(self.company_info['legal_name'])
+        self.add_table([['Item', 'Value']] + [[f'Item {i}', f'{i * 1000:,}'] for i in range(60)], [3, 2])
+
+    def build_content(self):
+        self._add_overview('Overview')
+
+    def generate(self):
+        self.story = []
+        self.build_content()
+        return self.generate_document('section_test')
+
+
+def row_colours(table):
+    """The ROWBACKGROUNDS colour each row of table is drawn with"""
+    colours = [None] * table._nrows
+    for cmd, (sc, sr), (ec, er), arg in table._bkgrndcmds:
+        if cmd != 'ROWBACKGROUNDS':
+            continue
+        sr, er = sr % table._nrows, er % table._nrows
+        for row in range(sr, er + 1):
+            colours[row] = arg[(row - sr) % len(arg)]
+    return colours
+
+
+@pytest.mark.parametrize('has_header', [True, False])
+def test_table_stripes_continue_across_page_splits(db, tmp_path, has_header):
+    generator = BaseDocumentGenerator(db, tmp_path / 'outputs')
+    data = [[f'Item {i}', f'{i * 1000:,}'] for i in range(40)]
+    table = generator.create_standard_table(data, [3, 2], has_header=has_header)
+    table.wrap(5 * inch, 10 * inch)
+    expected = row_colours(table)
+    assert expected[has_header::2] == [generator.WHITE] * len(expected[has_header::2])
+    assert expected[has_header + 1::2] == [generator.ROW_SHADE] * len(expected[has_header + 1::2])
+
+    # A page ending after 7 data rows, then one after 8 more
+    parts = [table]
+    for data_rows in (7, 8):
+        part = parts.pop()
+        first, rest = part.split(5 * inch, sum(part._rowHeights[:has_header + data_rows]) + 1)
+        assert first._nrows == has_header + data_rows
+        rest.wrap(5 * inch, 10 * inch)
+        parts += [first, rest]
+    colours = []
+    for i, part in enumerate(parts):
+        part_colours = row_colours(part)
+        colours += part_colours[1:] if has_header and i else part_colours
+    assert colours == expected
+
+
+def test_short_plain_cells_skip_paragraphs(db, tmp_path):
+    generator = BaseDocumentGenerator(db, tmp_path / 'outputs')
+    long_text = 'A description long enough that it has to wrap onto a second line in its column'
+    data = [['Name', 'Notes'], ['Copper', 'N/A'], ['<b>Tin</b>', long_text], [None, 'R&amp;D']]
+    table = generator.create_standard_table(data, [1.5, 2])
+    cells = table._cellvalues
+    assert all(isinstance(cell, Paragraph) for cell in cells[0])
+    assert cells[1] == ['Copper', 'N/A']
+    assert cells[3][0] == ''
+    assert all(isinstance(cell, Paragraph) for cell in (cells[2][0], cells[2][1], cells[3][1]))
+
+
+def test_section_reused_until_its_tables_change(db, tmp_path, sections):
+    def build():
+        generator = SectionGenerator(db, tmp_path / 'outputs')
+        generator.build_content()
+        return generator
+
+    assert SectionGenerator._add_overview.tables == ('company_info',)
+    first = build()
+    assert build().story[1].text == first.story[1].text
+    assert (sections, section_cache_stats()) == (['Overview'], {'hits': 1, 'misses': 1, 'entries': 1})
+
+    # A table the section does not read leaves it cached
+    db.execute_update("UPDATE team_members SET notes = notes")
+    build()
+    assert section_cache_stats()['hits'] == 2
+
+    db.execute_update("UPDATE company_info SET legal_name = ?", ('Sectioned Metals Inc.',))
+    rebuilt = build()
+    assert sections == ['Overview', 'Overview']
+    assert rebuilt.story[1].text == 'Sectioned Metals Inc.'
+    assert section_cache_stats() == {'hits': 2, 'misses': 2, 'entries': 1}
+
+
+def test_cached_sections_are_copied_per_build(db, tmp_path, sections):
+    def render():
+        generator = SectionGenerator(db, tmp_path / 'outputs')
+        return generator, generator.render_bytes()[1]
+
+    first, pdf = render()
+    (_, cached), = base._section_local.entries.values()
+    before = [dict(vars(flowable)) for flowable in cached]
+
+    for _ in range(2):
+        generator, again = render()
+        assert again == pdf
+        assert not any(flowable is other for flowable in generator.story for other in cached + tuple(first.story))
+    assert sections == ['Overview']
+    assert section_cache_stats()['hits'] == 2
+    # Layout set attributes on the copies it drew, never on the cached flowables
+    for flowable, attributes in zip(cached, before):
+        assert vars(flowable).keys() == attributes.keys()
+        assert all(vars(flowable)[name] is value for name, value in attributes.items())
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,168 @@
+"""
+Tests for background generation jobs (jobs.JobQueue) and their event stream
+
+Run with pytest or directly: python test_jobs.py
+"""
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from config import Config
+from jobs import DONE, FAILED, QUEUED, JobQueue, QueueClosed
+
+
+def test_job_runs_to_done():
+    queue = JobQueue(workers=1)
+    job = queue.submit('test', lambda job: {'answer': 42}, n=1)
+    assert job.events_after(0, timeout=5)
+    while not job.finished:
+        job.events_after(len(job.events), timeout=5)
+    assert job.status == DONE
+    assert job.result == {'answer': 42}
+    assert [event for _, event, _ in job.events] == ['queued', 'running', 'done']
+    queue.close()
+
+
+def test_close_fails_queued_jobs():
+    queue = JobQueue(workers=1)
+    release = threading.Event()
+    running = queue.submit('test', lambda job: release.wait(5) and {})
+    running.events_after(1, timeout=5)  # the 'running' event: the only worker is now busy
+    waiting = [queue.submit('test', lambda job: {}) for _ in range(3)]
+    assert all(job.status == QUEUED for job in waiting)
+
+    queue.close()
+    for job in waiting:
+        assert job.status == FAILED
+        assert job.error == 'server shutting down'
+        assert job.events[-1][1] == FAILED
+    assert queue.get_stats()['failed'] == 3
+
+    release.set()
+    while not running.finished:
+        running.events_after(len(running.events), timeout=5)
+    assert running.status == DONE
+
+
+def test_submit_after_close_is_refused():
+    queue = JobQueue(workers=1)
+    queue.close()
+    with pytest.raises(QueueClosed):
+        queue.submit('test', lambda job: {})
+    assert queue.recent() == []
+    assert queue.get_stats()['rejected'] == 1
+
+
+def test_submit_racing_close_fails_the_job():
+    queue = JobQueue(workers=1)
+    queue._executor.shutdown()  # as if close() ran between the check and the executor submit
+    with pytest.raises(QueueClosed):
+        queue.submit('test', lambda job: {})
+    (job,) = queue.recent()
+    assert (job.status, job.error) == (FAILED, 'server shutting down')
+    assert queue.get_stats()['queued'] == 0
+    queue.close()
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'DATABASE_PATH', tmp_path / 'fluxgen.db')
+    monkeypatch.setattr(Config, 'OUTPUT_DIR', tmp_path / 'outputs')
+    monkeypatch.setattr(Config, 'RENDER_CACHE_DIR', tmp_path / 'outputs' / '.cache')
+    monkeypatch.setattr(Config, 'RENDER_WORKERS', 0)
+    monkeypatch.setattr(Config, 'JOB_WORKERS', 1)
+    monkeypatch.setattr(Config, 'JOB_EVENTS_KEEPALIVE', 0.05)
+    from app import create_app
+    app = create_app()
+    yield app
+    app.extensions['fluxgen_jobs'].close()
+    app.extensions['fluxgen_db'].close()
+
+
+def read_stream(client, url, max_keepalives=20, **kwargs):
+    """(event id, event name) of every message, failing if the stream is still open after ``max_keepalives``"""
+    response = client.get(url, buffered=False, **kwargs)
+    assert response.mimetype == 'text/event-stream'
+    messages, keepalives = [], 0
+    for chunk in response.response:
+        chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+        if chunk.startswith(': keep-alive'):
+            keepalives += 1
+            assert keepalives <= max_keepalives, f"stream did not end; got {messages}"
+        elif chunk.startswith('id: '):
+            fields = dict(line.split(': ', 1) for line in chunk.strip().splitlines())
+            messages.append((int(fields['id']), fields['event']))
+    response.close()
+    return messages
+
+
+def finished_job(app):
+    job = app.extensions['fluxgen_jobs'].submit('test', lambda job: {'ok': True})
+    while not job.finished or job.events[-1][1] != DONE:
+        job.events_after(len(job.events), timeout=5)
+    return job
+
+
+def test_stream_ends_after_done(app):
+    job = finished_job(app)
+    with app.test_client() as client:
+        assert read_stream(client, f'/api/documents/jobs/{job.id}/events') == \
+            [(1, 'queued'), (2, 'running'), (3, 'done')]
+
+
+@pytest.mark.parametrize('resume', [
+    {'headers': {'Last-Event-ID': '3'}},
+    {'query_string': {'last_event_id': 3}},
+    {'headers': {'Last-Event-ID': '999'}},
+])
+def test_reconnect_after_done_ends_stream(app, resume):
+    job = finished_job(app)
+    with app.test_client() as client:
+        assert read_stream(client, f'/api/documents/jobs/{job.id}/events', max_keepalives=0, **resume) == []
+
+
+def test_resume_sends_only_newer_events(app):
+    job = finished_job(app)
+    with app.test_client() as client:
+        messages = read_stream(client, f'/api/documents/jobs/{job.id}/events', headers={'Last-Event-ID': '1'})
+    assert messages == [(2, 'running'), (3, 'done')]
+
+
+def test_stream_ends_when_queue_closes(app):
+    queue = app.extensions['fluxgen_jobs']
+    release = threading.Event()
+    blocker = queue.submit('test', lambda job: release.wait(5) and {})
+    blocker.events_after(1, timeout=5)
+    job = queue.submit('test', lambda job: {})
+    queue.close()
+    release.set()
+    with app.test_client() as client:
+        assert read_stream(client, f'/api/documents/jobs/{job.id}/events') == [(1, 'queued'), (2, 'failed')]
+
+
+def test_generate_after_close_is_unavailable(app):
+    app.extensions['fluxgen_jobs'].close()
+    with app.test_client() as client:
+        response = client.post('/api/documents/generate/pitch_deck')
+    assert response.status_code == 503
+    assert 'shutting down' in response.json['error']
+
+
+def test_list_jobs_clamps_limit(app):
+    for _ in range(3):
+        finished_job(app)
+    with app.test_client() as client:
+        for limit, expected in (('-1', 1), ('0', 1), ('2', 2), ('5000', 3), ('x', 3)):
+            response = client.get(f'/api/documents/jobs?limit={limit}')
+            assert response.status_code == 200
+            assert response.json['total'] == expected
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
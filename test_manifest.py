@@ -0,0 +1,151 @@
+"""
+Tests for the output manifest (manifest.OutputManifest), the index /api/documents/list reads
+
+Run with pytest or directly: python test_manifest.py
+"""
+import os
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from manifest import MANIFEST_NAME, OutputManifest
+from models import DatasetSnapshot
+
+START = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def fake_pdf(path: Path, pages: int = 1) -> Path:
+    objects = [f'1 0 obj << /Type /Pages /Count {pages} >> endobj']
+    objects += [f'{i + 2} 0 obj << /Type /Page >> endobj' for i in range(pages)]
+    path.write_bytes('\n'.join(['%PDF-1.4', *objects, '%EOF', '']).encode())
+    return path
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    manifest = OutputManifest(tmp_path)
+    yield manifest
+    manifest.close()
+
+
+def record(manifest, filename, minutes, pages=1, data_version=None):
+    path = fake_pdf(manifest.output_dir / filename, pages)
+    manifest.record(path, pages=pages, data_version=data_version, created_at=START + timedelta(minutes=minutes))
+    return path
+
+
+def test_record_describes_file_from_its_name(manifest):
+    record(manifest, 'fluxgen_technical_specifications_20250101_090000.pdf', 0, pages=3, data_version='abc')
+    record(manifest, 'fluxgen_prep_jane_doe_20250101_090100_optimized.pdf', 1)
+    rows, total = manifest.list()
+    assert total == 2
+    prep, specs = rows
+    assert (specs['doc_type'], specs['member'], specs['profile'], specs['pages'], specs['data_version']) == \
+        ('technical_specs', None, 'standard', 3, 'abc')
+    assert specs['size'] == (manifest.output_dir / specs['filename']).stat().st_size
+    assert specs['created'] == specs['modified'] == START.isoformat()
+    assert (prep['doc_type'], prep['member'], prep['profile']) == ('individual_prep', 'jane_doe', 'optimized')
+
+
+def test_list_pages_and_filters(manifest):
+    for minute in range(5):
+        record(manifest, f'fluxgen_pitch_deck_20250101_09{minute:02d}00.pdf', minute)
+    record(manifest, 'fluxgen_business_plan_20250101_091000.pdf', 10)
+    record(manifest, 'fluxgen_pitch_deck_20250101_092000_optimized.pdf', 20)
+
+    rows, total = manifest.list(limit=2, offset=1)
+    assert total == 7
+    assert [row['filename'] for row in rows] == ['fluxgen_business_plan_20250101_091000.pdf',
+                                                 'fluxgen_pitch_deck_20250101_090400.pdf']
+    rows, total = manifest.list(doc_type='pitch_deck', profile='standard', limit=100)
+    assert total == 5
+    assert [row['filename'][-10:-4] for row in rows] == ['090400', '090300', '090200', '090100', '090000']
+    assert manifest.list(doc_type='team_bios') == ([], 0)
+
+
+def test_latest_per_type_and_member(manifest):
+    record(manifest, 'fluxgen_pitch_deck_20250101_090000.pdf', 0)
+    record(manifest, 'fluxgen_pitch_deck_20250101_090500.pdf', 5)
+    record(manifest, 'fluxgen_pitch_deck_20250101_091000_optimized.pdf', 10)
+    record(manifest, 'fluxgen_prep_jane_doe_20250101_090000.pdf', 0)
+    record(manifest, 'fluxgen_prep_jane_doe_20250101_090100.pdf', 1)
+    record(manifest, 'fluxgen_prep_john_roe_20250101_090000.pdf', 0)
+
+    latest = {(row['doc_type'], row['member']): row for row in manifest.latest(profile='standard')}
+    assert latest.keys() == {('pitch_deck', None), ('individual_prep', 'jane_doe'), ('individual_prep', 'john_roe')}
+    assert latest['pitch_deck', None]['filename'] == 'fluxgen_pitch_deck_20250101_090500.pdf'
+    assert latest['pitch_deck', None]['versions'] == 2
+    assert latest['individual_prep', 'jane_doe']['filename'] == 'fluxgen_prep_jane_doe_20250101_090100.pdf'
+    assert latest['individual_prep', 'jane_doe']['versions'] == 2
+
+    rows = manifest.latest(['pitch_deck'])
+    assert [row['filename'] for row in rows] == ['fluxgen_pitch_deck_20250101_091000_optimized.pdf']
+    assert rows[0]['versions'] == 3
+
+
+def test_deleted_rows_are_hidden_until_restored(manifest):
+    path = record(manifest, 'fluxgen_pitch_deck_20250101_090000.pdf', 0, pages=4, data_version='abc')
+    manifest.mark_deleted(path.name)
+    assert manifest.list() == ([], 0)
+    assert manifest.latest() == []
+
+    manifest.restore([path])
+    rows, _ = manifest.list()
+    assert [(row['filename'], row['pages'], row['data_version']) for row in rows] == [(path.name, 4, 'abc')]
+
+
+def test_restore_indexes_unknown_files(manifest):
+    path = fake_pdf(manifest.output_dir / 'fluxgen_team_biographies_20250101_090000.pdf', pages=6)
+    manifest.restore([path])
+    rows, _ = manifest.list()
+    assert [(row['doc_type'], row['pages'], row['data_version']) for row in rows] == [('team_bios', 6, None)]
+
+
+def test_rebuild_syncs_with_directory(manifest):
+    kept = record(manifest, 'fluxgen_pitch_deck_20250101_090000.pdf', 0)
+    gone = record(manifest, 'fluxgen_business_plan_20250101_090000.pdf', 0)
+    back = record(manifest, 'fluxgen_team_biographies_20250101_090000.pdf', 0)
+    manifest.mark_deleted(back.name)
+    gone.unlink()
+    added = fake_pdf(manifest.output_dir / 'fluxgen_site_requirements_20250101_090000.pdf', pages=2)
+    os.utime(added, (START.timestamp(), START.timestamp()))
+
+    assert manifest.rebuild() == {'added': 1, 'restored': 1, 'removed': 1, 'files': 3}
+    rows, total = manifest.list()
+    assert total == 3
+    assert {row['filename'] for row in rows} == {kept.name, back.name, added.name}
+    assert next(row for row in rows if row['filename'] == added.name)['pages'] == 2
+    assert manifest.rebuild() == {'added': 0, 'restored': 0, 'removed': 0, 'files': 3}
+
+
+def test_outdated_manifest_is_recreated(tmp_path):
+    conn = sqlite3.connect(tmp_path / MANIFEST_NAME)
+    conn.execute("CREATE TABLE documents (filename TEXT PRIMARY KEY, data_version INTEGER)")
+    conn.execute("INSERT INTO documents VALUES ('fluxgen_pitch_deck_20250101_090000.pdf', 7)")
+    conn.commit()
+    conn.close()
+
+    manifest = OutputManifest(tmp_path)
+    assert manifest.list() == ([], 0)
+    record(manifest, 'fluxgen_pitch_deck_20250101_090000.pdf', 0, data_version='0123456789abcdef')
+    assert manifest.list()[0][0]['data_version'] == '0123456789abcdef'
+    manifest.close()
+
+
+def test_data_version_identifies_table_versions():
+    def snapshot(versions):
+        return DatasetSnapshot(None, (), (), (), (), (), (), (), (), (), (), (), (), {}, versions)
+
+    assert snapshot({}).version_id is None
+    assert snapshot({'a': 2, 'b': 0}).version_id == snapshot({'b': 0, 'a': 2}).version_id
+    assert snapshot({'a': 2, 'b': 0}).version_id != snapshot({'a': 0, 'b': 2}).version_id
+    assert snapshot({'a': 1, 'b': 0}).version_id != snapshot({'a': 2, 'b': 0}).version_id
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
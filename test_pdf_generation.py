@@ -12,6 +12,7 @@ from generators.executive_summary import ExecutiveSummaryGenerator
 from generators.team_bios import TeamBiosGenerator
 from generators.market_analysis import MarketAnalysisGenerator
 from generators.technical_specs import TechnicalSpecsGenerator
+from models import DatasetSnapshot
 
 # Import database manager
 import sqlite3
@@ -84,6 +85,25 @@ class SimpleDatabaseManager:
         cursor.execute("SELECT * FROM certifications_roadmap")
         return [dict(row) for row in cursor.fetchall()]
 
+    def read_snapshot(self):
+        """Bundle the simplified queries into the snapshot generators read from"""
+        return DatasetSnapshot(
+            company_info=self.get_company_info(),
+            team_members=tuple(self.get_team_members()),
+            investment_capex=tuple(self.get_investment_capex()),
+            production_targets=tuple(self.get_production_targets()),
+            alloys_catalog=tuple(self.get_alloys_catalog()),
+            funding_programs=tuple(self.get_funding_programs()),
+            certifications_roadmap=tuple(self.get_certifications_roadmap()),
+            business_assumptions=(),
+            competitors=(),
+            competitor_pricing=(),
+            market_analysis=(),
+            raw_materials=(),
+            brand_assets=(),
+            financial_summary=self.get_financial_summary(),
+        )
+
 
 def test_executive_summary():
     """Test Executive Summary generation"""
@@ -0,0 +1,95 @@
+"""
+Tests for the content-addressed render cache (render_cache.RenderCache)
+
+Renders run in-process against a temporary copy of data/fluxgen.db.
+
+Run with pytest or directly: python test_render_cache.py
+"""
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'repo' / 'app'))
+
+from database import DatabaseManager
+from generators.registry import GENERATORS
+from render_cache import RenderCache
+from render_pool import render_document
+
+DOC_NAME = 'pitch_deck'
+
+
+@pytest.fixture
+def env(tmp_path):
+    shutil.copy(Path(__file__).parent / 'data' / 'fluxgen.db', tmp_path / 'fluxgen.db')
+    db = DatabaseManager(tmp_path / 'fluxgen.db')
+    db.migrate()
+    output_dir = tmp_path / 'outputs'
+    output_dir.mkdir()
+    cache = RenderCache(output_dir / '.cache', output_dir, max_bytes=64 * 1024 * 1024)
+    yield db, output_dir, cache
+    db.close()
+
+
+def cache_key(cache, db):
+    return cache.key(GENERATORS[DOC_NAME], db, {'member_name': None, 'profile': 'standard'})
+
+
+def rename_company(db, name):
+    """Write through an outside connection, as the Ai-Sourcing scripts do"""
+    conn = sqlite3.connect(db.db_path)
+    with conn:
+        conn.execute("UPDATE company_info SET legal_name = ?", (name,))
+    conn.close()
+
+
+def test_miss_then_hit(env):
+    db, output_dir, cache = env
+    key = cache_key(cache, db)
+    assert cache.lookup(key) is None
+
+    paths = render_document(db, DOC_NAME, output_dir)
+    cache.store(key, paths)
+    pdf = paths[0].read_bytes()
+
+    paths[0].unlink()  # a hit puts the deleted output back
+    assert cache.lookup(key) == paths
+    assert paths[0].read_bytes() == pdf
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['stores'], stats['entries']) == (1, 1, 1, 1)
+
+
+def test_data_change_invalidates(env):
+    db, output_dir, cache = env
+    key = cache_key(cache, db)
+    cache.store(key, render_document(db, DOC_NAME, output_dir))
+
+    rename_company(db, 'Renamed Industries Inc.')
+    changed_key = cache_key(cache, db)
+    assert changed_key != key
+    assert cache.lookup(changed_key) is None
+    assert cache.lookup(key, restore=False) is not None  # the old render is still there for the old data
+
+
+def test_rewritten_output_leaves_entry_intact(env, monkeypatch):
+    """A same-second re-render reuses the output filename; the cached PDF must not change with it"""
+    db, output_dir, cache = env
+    monkeypatch.setattr(GENERATORS[DOC_NAME], '_get_timestamp', lambda self: '20250101_000000')
+    key = cache_key(cache, db)
+    paths = render_document(db, DOC_NAME, output_dir)
+    cache.store(key, paths)
+    pdf = paths[0].read_bytes()
+
+    rename_company(db, 'Renamed Industries Inc.')
+    assert render_document(db, DOC_NAME, output_dir) == paths
+    assert paths[0].read_bytes() != pdf
+
+    cached = cache.lookup(key, restore=False)
+    assert cached[0].read_bytes() == pdf
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))